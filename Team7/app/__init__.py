@@ -1,41 +1,188 @@
-from flask import Flask, request, make_response, current_app
+import click
+from flask import Flask, request, make_response, current_app, url_for
 from flask_sqlalchemy import SQLAlchemy
+from markupsafe import Markup, escape
 
-db = SQLAlchemy()
+from .config import load_config
+from .sqlite_tuning import install_pragmas, effective_pragmas
+from .db_routing import RoutingSession, READER_BIND, configure_read_engine, reader_pragmas
+from .perf import RequestMetrics
+from .template_cache import TemplateCache
 
-def create_app():
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+
+def create_app(config_name=None):
     app = Flask(__name__, template_folder='boundary')
-    app.config['SECRET_KEY'] = 'dev-secret'  # replace in production
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///Team7.db'
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Profile: dev / test / production (TEAM7_ENV), plus TEAM7_CONFIG_FILE and TEAM7_* overrides
+    profile = load_config(app, config_name)
+    # Read-only engine for list/search methods (separate pool), before init_app
+    has_reader = configure_read_engine(app)
 
     db.init_app(app)
 
-    from .routes import bp as boundary_bp
-    app.register_blueprint(boundary_bp)
+    # SQLite PRAGMAs (WAL, synchronous, busy_timeout, ...) on every new connection
+    with app.app_context():
+        install_pragmas(db.engine, app.config["SQLITE_PRAGMAS"])
+        effective = effective_pragmas(db.engine, {"journal_mode": None, **app.config["SQLITE_PRAGMAS"]})
+        if has_reader:
+            install_pragmas(db.engines[READER_BIND], reader_pragmas(app.config["SQLITE_PRAGMAS"]))
+        # Query count / DB / template / total time per request (Server-Timing + per-endpoint stats)
+        RequestMetrics.init_app(app, list(db.engines.values()))
+    app.config["SQLITE_EFFECTIVE_PRAGMAS"] = effective
+    if effective:
+        print(f"🗄️ SQLite [{profile}] " + ", ".join(f"{k}={v}" for k, v in effective.items()))
+    if has_reader:
+        print(f"🗄️ Read-only engine: pool_size={app.config['READ_ENGINE_OPTIONS'].get('pool_size')}")
+
+    from .entity.RequestViewQueue import RequestViewQueue
+    RequestViewQueue.init_app(app)
+
+    from .entity.PasswordHasher import PasswordHasher
+    PasswordHasher.init_app(app)
+
+    # CSV user imports run on a background worker; the report page polls the job
+    from .entity.UserImportQueue import UserImportQueue
+    UserImportQueue.init_app(app)
+
+    # Short-TTL dashboard counts (invalidated by the entity writes that change them)
+    from .entity.DashboardSummary import DashboardSummary
+    DashboardSummary.init_app(app)
+
+    # "Recommended" CSR search order: open-set snapshot (rebuilt in the background) and cached per-CSR affinities
+    from .entity.RequestRecommendation import RequestRecommendation
+    RequestRecommendation.init_app(app)
+
+    from .routes import register_blueprints
+    register_blueprints(app)
     
-    @app.after_request
-    def add_no_cache_headers(response):
-        # Don’t cache dynamic pages
-        if not request.path.startswith("/static/"):
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-        return response
+    # ETag revalidation (304) for @conditional pages; no-store for everything else
+    from .http_cache import ConditionalGet
+    ConditionalGet.init_app(app)
+
+    # {% call cached_fragment(...) %}: rendered template sections shared across requests
+    from .fragment_cache import FragmentCache
+    FragmentCache.init_app(app)
     
     @app.context_processor
     def utility_processor():
         def has_endpoint(name: str) -> bool:
             return name in current_app.view_functions
-        return {"has_endpoint": has_endpoint}
+
+        def page_url(cursor: str) -> str:
+            # Same page and filters, different keyset cursor
+            args = {**(request.view_args or {}), **request.args.to_dict(), "cursor": cursor}
+            return url_for(request.endpoint, **args)
+
+        return {"has_endpoint": has_endpoint, "page_url": page_url}
+
+    @app.template_filter("search_highlight")
+    def search_highlight(text):
+        # Escape first, then turn the FTS match markers into <mark> tags
+        from .entity.RequestSearchIndex import RequestSearchIndex
+        html = str(escape(text or ""))
+        html = html.replace(RequestSearchIndex.MARK_START, "<mark>")
+        html = html.replace(RequestSearchIndex.MARK_END, "</mark>")
+        return Markup(html)
+
+    @app.cli.command("rebuild-search-index")
+    def rebuild_search_index():
+        """Create (if needed) and rebuild the full-text index over requests."""
+        from .entity.RequestSearchIndex import RequestSearchIndex
+        status = RequestSearchIndex.ensure()
+        if status == "unsupported":
+            return
+        count = RequestSearchIndex.rebuild()
+        print(f"✅ Re-indexed {count} requests")
+
+    @app.cli.command("rebuild-activity-rollups")
+    def rebuild_activity_rollups():
+        """Recompute the hourly/daily view and shortlist rollups from the raw tables."""
+        from .entity.RequestActivity import RequestActivity
+        db.create_all()
+        rows = RequestActivity.rebuild()
+        print(f"✅ Rebuilt request activity rollups ({rows} daily rows)")
+
+    @app.cli.command("seed-demo-data")
+    @click.option("--pins", default=200, show_default=True, help="PIN users to create")
+    @click.option("--csrs", default=50, show_default=True, help="CSR reps to create")
+    @click.option("--categories", default=10, show_default=True, help="service categories to ensure")
+    @click.option("--requests", "n_requests", default=10_000, show_default=True, help="requests to create")
+    @click.option("--views-per-request", default=1.0, show_default=True, help="average CSR views per request")
+    @click.option("--shortlist-rate", default=0.2, show_default=True, help="share of views that shortlist")
+    @click.option("--days", default=365, show_default=True, help="history span for created_at")
+    @click.option("--seed", type=int, default=None, help="random seed for a reproducible dataset")
+    def seed_demo_data(pins, csrs, categories, n_requests, views_per_request, shortlist_rate, days, seed):
+        """Bulk-generate synthetic users, requests, views and shortlists."""
+        from .demo_data import generate_demo_data, DEMO_PASSWORD
+        from .entity.RequestSearchIndex import RequestSearchIndex
+        db.create_all()
+        RequestSearchIndex.ensure()
+        generate_demo_data(pins=pins, csrs=csrs, categories=categories, requests=n_requests,
+                           views_per_request=views_per_request, shortlist_rate=shortlist_rate,
+                           days=days, seed=seed)
+        print(f"ℹ️ Demo accounts use the password {DEMO_PASSWORD!r}")
+
+    @app.cli.command("precompile-templates")
+    def precompile_templates():
+        """Compile every boundary template into the Jinja bytecode cache (run before starting workers)."""
+        if app.jinja_env.bytecode_cache is None:
+            print("⚠️ No bytecode cache (JINJA_BYTECODE_CACHE off or directory unusable); nothing is saved")
+        loaded, ms, errors = TemplateCache.precompile(app)
+        for name, error in errors:
+            print(f"❌ {name}: {error}")
+        print(f"✅ Compiled {loaded} templates in {ms:.0f} ms")
+        if errors:
+            raise SystemExit(1)
+
+    # Bytecode cache (+ optional preload) last: compiling needs the filters registered above
+    TemplateCache.init_app(app)
         
     return app
 
 
 from .entity.UserProfile import UserProfile
 from .entity.UserAdmin import UserAdmin
+from .entity.RequestSearchIndex import RequestSearchIndex
+from .entity.RequestActivity import RequestActivity
+from .entity.PasswordHasher import PasswordHasher
 from . import db
 
+def ensure_indexes():
+    """
+    Create any declared indexes that are missing from the database.
+    db.create_all() only builds indexes for tables it creates, so databases
+    created before an index was added to a model need this step.
+    Unique indexes are preceded by their table's duplicate cleanup; an index
+    that still cannot be built stops startup with a RuntimeError.
+    Returns the list of index names that were created.
+    """
+    # Make sure every model (and its __table_args__) is registered on db.metadata
+    from .entity import Request, CSREntities  # noqa: F401
+
+    cleanups = {"uq_csr_shortlist_request_csr": CSREntities.CSRService.remove_duplicates}
+    inspector = db.inspect(db.engine)
+    created = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue  # db.create_all() builds it with its indexes
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.name in cleanups:
+                removed = cleanups[index.name]()
+                if removed:
+                    print(f"🧹 Removed {removed} duplicate rows from {table.name} before creating {index.name}")
+            try:
+                index.create(bind=db.engine)
+                created.append(index.name)
+            except Exception as e:
+                raise RuntimeError(f"Could not create index {index.name}: {e}") from e
+
+    if created:
+        print(f"✅ Created missing indexes: {', '.join(created)}")
+    return created
+
 def seed_defaults():
     # 1️⃣ Ensure user profiles exist
     profile_names = ["Admin", "CSR Rep", "PIN", "Platform Management"]
@@ -56,11 +203,10 @@ def seed_defaults():
     existing_admin = UserAdmin.query.filter_by(email=admin_email).first()
 
     if not existing_admin:
-        # Plain-text password
         admin_user = UserAdmin(
             name="Administrator",
             email=admin_email,
-            password="admin123",  # plain text, for development only
+            password=PasswordHasher.hash("admin123"),  # default credentials, for development only
             profile_id=admin_profile.id,
             is_suspended=False
         )
@@ -0,0 +1,126 @@
+# 📦 File: app/cache.py
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache: entries expire after `ttl` seconds
+    and the least recently used entry is evicted once `max_size` is reached.
+    Keeps hit/miss/eviction counters for monitoring. get_or_set runs one
+    loader per missing key; concurrent callers for that key wait for it
+    instead of loading the same value in parallel.
+
+    Only cache plain data (tuples, dicts, strings) here, never ORM objects:
+    those are bound to the session that loaded them.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_size: int = 128, ttl: float = 60.0, name: str = "cache"):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._loading = {}  # key -> lock held by the caller running its loader
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is not self._MISSING and entry[0] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not self._MISSING:
+                del self._data[key]  # expired
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl: float | None = None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_many(self, keys) -> dict:
+        """Cached values for `keys` (missing or expired keys left out), under one lock."""
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._data.get(key, self._MISSING)
+                if entry is not self._MISSING and entry[0] > now:
+                    self._data.move_to_end(key)
+                    found[key] = entry[1]
+                elif entry is not self._MISSING:
+                    del self._data[key]  # expired
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: dict, ttl: float | None = None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            for key, value in items.items():
+                self._data[key] = (expires_at, value)
+                self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key, loader, ttl: float | None = None):
+        """
+        Return the cached value, or call loader() and cache its result. Only
+        one caller per key runs the loader; the others wait and then read
+        what it cached (or load themselves if it raised).
+        """
+        value = self.get(key, self._MISSING)
+        if value is not self._MISSING:
+            return value
+        with self._lock:
+            loading = self._loading.setdefault(key, threading.Lock())
+        try:
+            with loading:
+                now = time.monotonic()
+                with self._lock:
+                    entry = self._data.get(key, self._MISSING)
+                    if entry is not self._MISSING and entry[0] > now:
+                        return entry[1]  # loaded while we waited
+                value = loader()
+                self.set(key, value, ttl)
+                return value
+        finally:
+            with self._lock:
+                if self._loading.get(key) is loading:
+                    del self._loading[key]
+
+    def invalidate(self, key=_MISSING):
+        """Drop one key, or everything when called without a key."""
+        with self._lock:
+            if key is self._MISSING:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -0,0 +1,180 @@
+# 📦 File: app/config.py
+import os
+
+from sqlalchemy.pool import StaticPool
+
+
+class BaseConfig:
+    SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret")  # replace in production
+    SQLALCHEMY_DATABASE_URI = "sqlite:///Team7.db"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Writer pool: SQLite takes one writer at a time, so keep it small
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_size": 5,
+        "max_overflow": 5,
+        "connect_args": {"timeout": 10},
+    }
+
+    # Read-only engine (mode=ro + query_only) for list/search pages, see db_routing.py
+    READ_ENGINE_ENABLED = True
+    READ_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_size": 10,
+        "max_overflow": 10,
+        "connect_args": {"timeout": 10},
+    }
+
+    # Applied with PRAGMA on every new SQLite connection (see sqlite_tuning.py).
+    # journal_mode is left at SQLite's default here: WAL is persistent, so
+    # setting it would convert whatever database dev points at, including
+    # the tracked instance/Team7.db. ProductionConfig turns it on.
+    SQLITE_PRAGMAS = {
+        "busy_timeout": 5000,         # ms to wait for the write lock before SQLITE_BUSY
+        "cache_size": -20000,         # negative = KiB, i.e. ~20 MB page cache per connection
+        "mmap_size": 268435456,       # 256 MB memory-mapped reads
+        "temp_store": "MEMORY",       # sorts / temp b-trees in RAM
+    }
+
+    # Per-request instrumentation (perf.py): Server-Timing header + rolling per-endpoint stats
+    PERF_INSTRUMENTATION = True
+    PERF_SERVER_TIMING = True
+    PERF_WINDOW = 500  # requests kept per endpoint
+    # Query budgets (@query_budget on routes) and N+1 detection: "raise", "log" or "off"
+    QUERY_BUDGET_MODE = "log"
+    QUERY_BUDGET_DEFAULT = 25       # for endpoints without their own budget
+    QUERY_BUDGETS = {}              # endpoint -> max queries, overrides @query_budget
+    N_PLUS_ONE_THRESHOLD = 5        # identical statements in one request
+
+    # Role blueprints this process serves; the rest are never imported.
+    # e.g. TEAM7_ENABLED_BLUEPRINTS='["pin", "csr"]' or TEAM7_ENABLED_BLUEPRINTS=pin,csr
+    ENABLED_BLUEPRINTS = ["admin", "platform", "pin", "csr", "api"]
+    # JSON API: serialized request objects cached by (id, updated_at)
+    API_PAYLOAD_CACHE_SIZE = 20_000
+    API_PAYLOAD_CACHE_TTL = 600  # seconds
+
+    # Conditional GET (http_cache.py): ETag + 304 on @conditional pages, no-store elsewhere
+    CONDITIONAL_GET = True
+    ETAG_SALT = None  # None = newest app code/template mtime, so a deploy invalidates old ETags
+
+    # Template fragment cache (fragment_cache.py): rendered cards / dropdowns, LRU + TTL
+    FRAGMENT_CACHE = True
+    FRAGMENT_CACHE_SIZE = 5_000  # fragments (a request card is ~1.5 KB)
+    FRAGMENT_CACHE_TTL = 600     # seconds
+
+    # Dashboard counts (entity/DashboardSummary.py): one GROUP BY per dashboard, cached briefly
+    DASHBOARD_SUMMARY_TTL = 30  # seconds
+    DASHBOARD_SUMMARY_CACHE_SIZE = 2_000  # summaries (one per PIN / CSR, plus admin and platform)
+
+    # "Recommended" sort of the CSR search page (entity/RequestRecommendation.py); pip install numpy for batch scoring
+    RECOMMENDATION_SNAPSHOT_TTL = 60   # seconds before the open-requests snapshot is rebuilt (in the background)
+    RECOMMENDATION_AFFINITY_TTL = 900  # seconds between recomputing a CSR's affinity from their history
+    RECOMMENDATION_AFFINITY_CACHE_SIZE = 5_000  # CSRs
+
+    # Compiled templates on disk (template_cache.py); None = instance/jinja_cache
+    JINJA_BYTECODE_CACHE = True
+    JINJA_BYTECODE_CACHE_DIR = None
+    JINJA_PRELOAD_TEMPLATES = False  # load every template at startup
+
+    # CSR request-view tracking: "async" batches writes on a background thread, "sync" writes inline
+    VIEW_TRACKING_MODE = os.environ.get("VIEW_TRACKING_MODE", "async")
+    VIEW_TRACKING_BATCH_SIZE = 100
+    VIEW_TRACKING_FLUSH_MS = 500
+
+    # Password hashing: werkzeug method string (cost), pool size and backlog bound
+    PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_MAX_PENDING = 32
+
+    # Admin CSV user import (/users/import): runs on a background worker
+    # ("async") at ~7 rows/s (scrypt:32768 on 2 hashing workers), so a full
+    # file takes about 12 minutes while the upload request returns at once
+    USER_IMPORT_MODE = "async"
+    USER_IMPORT_CHUNK_SIZE = 50     # rows per duplicate check / INSERT / commit / progress update (~7 s)
+    USER_IMPORT_MAX_ROWS = 5000
+
+
+class DevConfig(BaseConfig):
+    DEBUG = True
+
+
+class TestConfig(BaseConfig):
+    TESTING = True
+    # One shared in-memory database for the whole test process
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
+    READ_ENGINE_ENABLED = False  # a second connection would see a different in-memory DB
+    SQLITE_PRAGMAS = {
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+    }
+    VIEW_TRACKING_MODE = "sync"
+    USER_IMPORT_MODE = "sync"
+    QUERY_BUDGET_MODE = "raise"
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"  # cheap hashes keep tests fast
+    JINJA_BYTECODE_CACHE = False  # don't write into instance/ from test runs
+
+
+class ProductionConfig(BaseConfig):
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_size": 10,
+        "max_overflow": 10,
+        "connect_args": {"timeout": 15},
+    }
+    READ_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_size": 20,
+        "max_overflow": 20,
+        "connect_args": {"timeout": 15},
+    }
+    SQLITE_PRAGMAS = {
+        **BaseConfig.SQLITE_PRAGMAS,
+        "journal_mode": "WAL",        # readers no longer block behind the writer
+        "synchronous": "NORMAL",      # safe with WAL, far fewer fsyncs than FULL
+        "busy_timeout": 15000,
+        "cache_size": -64000,         # ~64 MB
+        "mmap_size": 1073741824,      # 1 GB
+    }
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 4))
+    PERF_SERVER_TIMING = False  # keep collecting, but don't expose timings to clients
+    QUERY_BUDGET_MODE = "off"
+    JINJA_PRELOAD_TEMPLATES = True  # no template loads on first requests after a deploy
+
+
+PROFILES = {
+    "dev": DevConfig,
+    "test": TestConfig,
+    "production": ProductionConfig,
+}
+
+
+def load_config(app, name: str | None = None) -> str:
+    """
+    Load a named profile into app.config, then overrides from:
+      1. the file named by TEAM7_CONFIG_FILE (a Python file of UPPERCASE settings)
+      2. TEAM7_* environment variables, e.g. TEAM7_SQLITE_PRAGMAS__busy_timeout=20000
+    The profile name comes from `name`, else TEAM7_ENV, else "dev".
+    Returns the profile name used.
+    """
+    name = (name or os.environ.get("TEAM7_ENV") or "dev").lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown config profile {name!r}; expected one of {sorted(PROFILES)}")
+
+    app.config.from_object(PROFILES[name])
+    # Copy dicts so overrides below don't mutate the class attributes
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = dict(app.config["SQLALCHEMY_ENGINE_OPTIONS"])
+    app.config["READ_ENGINE_OPTIONS"] = dict(app.config["READ_ENGINE_OPTIONS"])
+    app.config["SQLITE_PRAGMAS"] = dict(app.config["SQLITE_PRAGMAS"])
+    app.config["ENABLED_BLUEPRINTS"] = list(app.config["ENABLED_BLUEPRINTS"])
+
+    config_file = os.environ.get("TEAM7_CONFIG_FILE")
+    if config_file:
+        app.config.from_pyfile(config_file)
+    app.config.from_prefixed_env("TEAM7")
+
+    app.config["CONFIG_PROFILE"] = name
+    return name
@@ -1,12 +1,22 @@
 # app/control/CSRControllers.py
 from ..entity.CSREntities import (CSRService)
+from ..entity.Request import Request
+from ..entity.ServiceCategory import ServiceCategory
+from ..entity.DashboardSummary import DashboardSummary
+from ..entity.RequestRecommendation import RequestRecommendation
 
-from ..control.PINControllers import PINRequestViewCountController
+from ..entity.RequestViewQueue import RequestViewQueue
 
 class CSRViewCompletedServicesController:
     #Controller for: As CSR Representative, I want to view the history of completed volunteer services#    
-    def get_completed_services_history(self, csr_company_id):
-        return CSRService.get_completed_services_history(csr_company_id)
+    def get_completed_services_history(self, csr_company_id, cursor=None):
+        return CSRService.get_completed_services_history(csr_company_id, cursor)
+
+
+class CSRExportCompletedServicesController:
+    #Controller for: As CSR Representative, I want to export all my completed volunteer services#
+    def export_completed_services(self, csr_company_id):
+        return CSRService.export_completed_services(csr_company_id)
 
 
 class CSRSearchCompletedServicesController:
@@ -17,8 +27,11 @@ class CSRSearchCompletedServicesController:
 
 class CSRSearchAvailableRequestsController:
     #Controller for: As CSR, I want to search for available service requests#    
-    def search_available_requests(self, search_term=None, category=None, urgency=None):
-        return CSRService.search_available_requests(search_term, category, urgency)
+    def search_available_requests(self, search_term=None, category=None, urgency=None, cursor=None,
+                                  csr_company_id=None, sort="newest"):
+        # With csr_company_id the page also flags what this CSR already shortlisted / viewed
+        return CSRService.search_available_requests(search_term, category, urgency, cursor,
+                                                    csr_company_id=csr_company_id, sort=sort)
 
 
 class CSRViewRequestDetailsController:
@@ -29,8 +42,8 @@ class CSRViewRequestDetailsController:
         
 
         if csr_company_id and not isinstance(result, str):
-            tracking_ctrl = PINRequestViewCountController()
-            tracking_ctrl.track_view(request_id, csr_company_id)
+            # Queued for the background writer unless VIEW_TRACKING_MODE = "sync"
+            RequestViewQueue.track(request_id, csr_company_id)
         
         return result
 
@@ -60,3 +73,50 @@ class CSRRemoveFromShortlistController:
     
     def remove_from_shortlist(self, request_id, csr_company_id):
         return CSRService.remove_from_shortlist(request_id, csr_company_id)
+
+
+class CSRRequestsAPIController:
+    #Controller for: As CSR (mobile app), I want requests and my shortlist as JSON#
+    def search_available_requests(self, search_term=None, category=None, urgency=None, cursor=None, per_page=None):
+        return CSRService.search_available_requests(search_term, category, urgency, cursor, per_page, as_rows=True)
+
+    def get_request(self, request_id, csr_company_id):
+        result = Request.get_request_row(request_id)
+        if not isinstance(result, str):
+            # Same view tracking as the HTML details page
+            RequestViewQueue.track(request_id, csr_company_id)
+        return result
+
+    def search_shortlisted_requests(self, csr_company_id, search_term=None):
+        return CSRService.search_shortlisted_requests(csr_company_id, search_term, as_rows=True)
+
+
+class CSRPageVersionController:
+    #Controller for conditional GET: has anything on my search / shortlist pages changed?#
+    def available_requests_version(self, recommended_for=None):
+        version = Request.requests_version()
+        if isinstance(version, str):
+            return version
+        if recommended_for is not None:
+            # The "recommended" order also changes when its snapshot / affinity is refreshed
+            ranking = RequestRecommendation.version(recommended_for)
+            if isinstance(ranking, str):
+                return ranking
+            version += ranking
+        # The search form also lists the active categories (cached, no query)
+        return version + (tuple(ServiceCategory.ListActiveServiceCategory().get("data", [])),)
+
+    def shortlist_version(self, csr_company_id):
+        return CSRService.shortlist_version(csr_company_id)
+
+
+class CSRRecommendationStatsController:
+    #Controller for monitoring: which scorer ranks the "recommended" order, and how fast#
+    def stats(self) -> dict:
+        return RequestRecommendation.stats()
+
+
+class CSRDashboardSummaryController:
+    #Controller for: As CSR, I want to see my open and completed shortlist totals#
+    def get_summary(self, csr_company_id):
+        return DashboardSummary.csr(csr_company_id)
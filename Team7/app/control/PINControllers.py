@@ -1,4 +1,6 @@
 from ..entity.Request import Request, PINRequestView 
+from ..entity.RequestActivity import RequestActivity
+from ..entity.DashboardSummary import DashboardSummary
 
 
 class PINCreateRequestController:
@@ -10,8 +12,8 @@ class PINCreateRequestController:
             
 class PINViewRequestsController:
     #Controller for: As PIN, I want to view my active requests#
-     def get_active_requests(self, pin_id):
-        return Request.get_active_requests(pin_id)  
+     def get_active_requests(self, pin_id, cursor=None):
+        return Request.get_active_requests(pin_id, cursor)  
 
 class PINSuspendRequestController:
     #Controller for: As PIN, I want to suspend my requests#
@@ -20,13 +22,18 @@ class PINSuspendRequestController:
 
 class PINViewHistoryController:
     #Controller for: As PIN, I want to view my request history#
-    def get_request_history(self, pin_id):
-       return Request.get_pin_request_history(pin_id) 
+    def get_request_history(self, pin_id, cursor=None):
+       return Request.get_pin_request_history(pin_id, cursor) 
+
+class PINExportHistoryController:
+    #Controller for: As PIN, I want to export my request history#
+    def export_request_history(self, pin_id):
+       return Request.export_pin_request_history(pin_id)
 
 class PINSearchRequestsController:
     #Controller for: As PIN, I want to search my requests#
-    def search_pin_requests(self, pin_id, search_term):
-       return Request.search_pin_requests(pin_id, search_term)  
+    def search_pin_requests(self, pin_id, search_term, cursor=None):
+       return Request.search_pin_requests(pin_id, search_term, cursor)  
 
 class PINUpdateRequestController:
     # Controller: As PIN, i want to update existing requests
@@ -54,6 +61,15 @@ class PINRequestShortlistCountController:
         return Request.get_shortlist_count(request_id, pin_id)  
 
 
+class PINRequestActivityController:
+    #Controller for: As PIN, I want to see views and shortlists of my request per hour / day#
+    RANGES = RequestActivity.RANGES
+    DEFAULT_RANGE = RequestActivity.DEFAULT_RANGE
+
+    def get_activity_series(self, request_id, pin_id, range_key):
+        return RequestActivity.series(request_id, pin_id, range_key)
+
+
 class PINCompletedMatchesSearchController:
     """Controller for: As PIN, I want to search my completed matches by service type and date"""
     
@@ -64,5 +80,32 @@ class PINCompletedMatchesSearchController:
 class PINCompletedMatchesHistoryController:
     """Controller for: As PIN, I want to view the history of my completed matches"""
     
-    def get_completed_matches_history(self, pin_id):
-        return Request.get_completed_matches_history(pin_id)  # Changed to Request
+    def get_completed_matches_history(self, pin_id, cursor=None):
+        return Request.get_completed_matches_history(pin_id, cursor)  # Changed to Request
+
+
+class PINRequestsAPIController:
+    #Controller for: As PIN (mobile app), I want my requests as JSON#
+    # Entities return API_FIELDS rows (as_rows=True); the API boundary serializes them
+    def list_requests(self, pin_id, scope="active", cursor=None, per_page=None):
+        if scope == "history":
+            return Request.get_pin_request_history(pin_id, cursor, per_page, as_rows=True)
+        return Request.get_active_requests(pin_id, cursor, per_page, as_rows=True)
+
+    def search_requests(self, pin_id, search_term, cursor=None, per_page=None):
+        return Request.search_pin_requests(pin_id, search_term, cursor, per_page, as_rows=True)
+
+    def get_request(self, request_id, pin_id):
+        return Request.get_request_row(request_id, pin_id)
+
+
+class PINPageVersionController:
+    #Controller for conditional GET: has anything on my request pages changed?#
+    def requests_version(self, pin_id):
+        return Request.pin_requests_version(pin_id)
+
+
+class PINDashboardSummaryController:
+    #Controller for: As PIN, I want to see how many of my requests are in each status#
+    def get_summary(self, pin_id):
+        return DashboardSummary.pin(pin_id)
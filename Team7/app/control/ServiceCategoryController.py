@@ -1,5 +1,6 @@
 # 📦 File: app/control/ServiceCategoryController.py
 from ..entity.ServiceCategory import ServiceCategory
+from ..entity.DashboardSummary import DashboardSummary
 
 
 class CreateServiceCategoryController:
@@ -10,6 +11,13 @@ class ListServiceCategoryController:
     def ListServiceCategory(self, page=1, per_page=20):
         return ServiceCategory.ListServiceCategory(page=page, per_page=per_page)
            
+class ListActiveServiceCategoryController:
+    def ListActiveServiceCategory(self):
+        return ServiceCategory.ListActiveServiceCategory()
+
+    def cache_stats(self) -> dict:
+        return ServiceCategory.active_cache_stats()
+
 class SearchServiceCategoryController:
     def SearchServiceCategory(self, term: str, page=1, per_page=20):
         return ServiceCategory.SearchServiceCategory(term, page=page, per_page=per_page)
@@ -23,4 +31,14 @@ class UpdateServiceCategoryController:
 
 class SuspendedServiceCategoryController:
     def SuspendedServiceCategory(self, category_id: int, is_suspended: int | bool) -> str:
-        return ServiceCategory.SuspendedServiceCategory(category_id, is_suspended)
\ No newline at end of file
+        return ServiceCategory.SuspendedServiceCategory(category_id, is_suspended)
+
+class BulkSuspendServiceCategoryController:
+    def BulkSuspendServiceCategories(self, category_ids, is_suspended: int | bool) -> dict:
+        return ServiceCategory.BulkSuspendServiceCategories(category_ids, is_suspended)
+
+
+class ServiceCategorySummaryController:
+    #Controller for: As Platform Management, I want to see how many requests each category has#
+    def get_summary(self):
+        return DashboardSummary.platform()
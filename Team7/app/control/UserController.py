@@ -1,5 +1,7 @@
 from ..entity.UserAccount import UserAccount
 from ..entity.UserAdmin import UserAdmin
+from ..entity.DashboardSummary import DashboardSummary
+from ..entity.UserImportQueue import UserImportQueue, UserImportJob
 
 class CreateUserController:
     def CreateUserAC(self, name: str, email: str, password: str,
@@ -9,6 +11,23 @@ class CreateUserController:
             name, email, password, profile_id, is_suspended
         )
                 
+class BulkImportUserController:
+    COLUMNS = UserAdmin.IMPORT_COLUMNS
+
+    def BulkImportUsers(self, rows, chunk_size: int = 200, max_rows: int | None = None):
+        # rows: (line_number, dict) pairs from a streaming CSV reader
+        return UserAdmin.BulkImportUsers(rows, chunk_size=chunk_size, max_rows=max_rows)
+
+    def SubmitImport(self, rows, created_by=None):
+        # rows: (line_number, dict) pairs already read from the upload; runs in the background
+        return UserImportQueue.submit(rows, created_by=created_by)
+
+    def GetImportJob(self, job_id):
+        return UserImportJob.GetImportJob(job_id)
+
+    def RecentImportJobs(self, limit: int = 10):
+        return UserImportJob.RecentImportJobs(limit)
+
 class ListUserController:
     def ListUsers(self, page=1, per_page=20):
         return UserAdmin.ListUsers(page=page, per_page=per_page)
@@ -28,6 +47,22 @@ class SuspendedUserController:
     def SuspendedUser(self, user_id: int, is_suspended: int | bool) -> str:
         return UserAdmin.SuspendedUser(user_id, is_suspended)
         
+class BulkSuspendUserController:
+    def BulkSuspendUsers(self, user_ids, is_suspended: int | bool, exclude_ids=()) -> dict:
+        return UserAdmin.BulkSuspendUsers(user_ids, is_suspended, exclude_ids)
+
+    def SuspendUsersByProfile(self, profile_id: int, is_suspended: int | bool, exclude_ids=()) -> dict:
+        return UserAdmin.SuspendUsersByProfile(profile_id, is_suspended, exclude_ids)
+        
 class LoginUserController:
     def login(self, email: str, password: str):
-        return UserAccount.login(email, password)
\ No newline at end of file
+        return UserAccount.login(email, password)
+
+
+class UserSummaryController:
+    #Controller for: As User Admin, I want to see how many users each profile has#
+    def get_summary(self):
+        return DashboardSummary.admin()
+
+    def cache_stats(self) -> dict:
+        return DashboardSummary.cache_stats()
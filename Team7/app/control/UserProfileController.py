@@ -21,4 +21,8 @@ class UpdateUserProfileController:
         
 class SuspendedUserProfileController:
     def SuspendedUserProfile(self, profile_id: int, is_suspended: int | bool) -> str:
-        return UserProfile.SuspendedUserProfile(profile_id, is_suspended)
\ No newline at end of file
+        return UserProfile.SuspendedUserProfile(profile_id, is_suspended)
+
+class BulkSuspendUserProfileController:
+    def BulkSuspendUserProfiles(self, profile_ids, is_suspended: int | bool) -> dict:
+        return UserProfile.BulkSuspendUserProfiles(profile_ids, is_suspended)
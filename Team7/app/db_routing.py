@@ -0,0 +1,83 @@
+# 📦 File: app/db_routing.py
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask_sqlalchemy.session import Session
+
+READER_BIND = "reader"
+
+_use_reader = ContextVar("team7_use_reader", default=False)
+
+
+class RoutingSession(Session):
+    """
+    db.session that sends SELECTs issued inside a `reading()` block (or a
+    @read_only method) to the read-only engine. Flushes always go to the
+    writer, so ORM objects loaded on the reader can still be edited and
+    committed as usual. Without a reader bind everything uses the writer.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and _use_reader.get() and not self._flushing:
+            engine = self._db.engines.get(READER_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@contextmanager
+def reading():
+    """Route the queries in this block to the read-only engine."""
+    token = _use_reader.set(True)
+    try:
+        yield
+    finally:
+        _use_reader.reset(token)
+
+
+def read_only(fn):
+    """
+    Decorator for list/search classmethods (put it under @classmethod).
+    Only use it on methods that never write: the reader connection refuses
+    INSERT/UPDATE/DELETE.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with reading():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def configure_read_engine(app) -> bool:
+    """
+    Add the `reader` bind to SQLALCHEMY_BINDS: the same SQLite file opened
+    with mode=ro and its own pool (READ_ENGINE_OPTIONS). Must run before
+    db.init_app(). In-memory and non-SQLite databases keep a single engine.
+    """
+    if not app.config.get("READ_ENGINE_ENABLED"):
+        return False
+    uri = app.config["SQLALCHEMY_DATABASE_URI"]
+    prefix = "sqlite:///"
+    database = uri[len(prefix):] if uri.startswith(prefix) else ""
+    if not database or database == ":memory:" or "?" in database:
+        return False
+
+    path = database[5:] if database.startswith("file:") else database
+    binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+    binds[READER_BIND] = {
+        **app.config["READ_ENGINE_OPTIONS"],
+        "url": f"{prefix}file:{path}?mode=ro&uri=true",
+    }
+    app.config["SQLALCHEMY_BINDS"] = binds
+    return True
+
+
+def reader_pragmas(pragmas: dict) -> dict:
+    """
+    Writer PRAGMAs minus journal_mode (a database-level setting the writer
+    owns), plus query_only as a second guard next to mode=ro.
+    """
+    pragmas = {k: v for k, v in pragmas.items() if k != "journal_mode"}
+    pragmas["query_only"] = "ON"
+    return pragmas
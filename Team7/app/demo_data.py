@@ -0,0 +1,217 @@
+# 📦 File: app/demo_data.py
+import random
+import time
+from datetime import datetime, timezone
+
+from flask import current_app
+
+from . import db, seed_defaults
+from .entity.UserProfile import UserProfile
+from .entity.UserAdmin import UserAdmin
+from .entity.ServiceCategory import ServiceCategory
+from .entity.Request import Request, PINRequestView
+from .entity.CSREntities import CSRService
+from .entity.RequestActivity import RequestActivity
+from .entity.RequestSearchIndex import RequestSearchIndex
+from .entity.PasswordHasher import PasswordHasher
+
+DEMO_PASSWORD = "demo1234"
+
+# Category -> words used to build titles / descriptions, so search has something to find
+CATEGORY_WORDS = {
+    "Cleaning": ["kitchen", "windows", "floor", "bathroom", "spring", "carpet"],
+    "Gardening": ["garden", "lawn", "hedge", "weeding", "plants", "leaves"],
+    "Home Repairs": ["repair", "leak", "door", "fence", "paint", "plumbing"],
+    "Tutoring": ["math", "english", "homework", "science", "exam", "reading"],
+    "Transport": ["ride", "clinic", "airport", "market", "appointment", "pickup"],
+    "Groceries": ["groceries", "shopping", "delivery", "pharmacy", "market", "weekly"],
+    "Companionship": ["elderly", "visit", "chat", "walk", "reading", "company"],
+    "Pet Care": ["dog", "cat", "walk", "feeding", "grooming", "vet"],
+    "IT Help": ["laptop", "phone", "printer", "wifi", "email", "setup"],
+    "Moving": ["boxes", "furniture", "packing", "lifting", "moving", "van"],
+}
+TITLE_TEMPLATES = ["Need help with {a} and {b}", "{A} {b} help", "Looking for {a} volunteer",
+                   "{A} assistance this week", "Help: {a} / {b}"]
+URGENCY_WEIGHTS = {"low": 30, "medium": 40, "high": 20, "urgent": 10}
+# Recent requests are mostly still open; older ones mostly completed
+RECENT_STATUS_WEIGHTS = {"pending": 60, "approved": 25, "in_progress": 10, "suspended": 5}
+OLDER_STATUS_WEIGHTS = {"completed": 55, "in_progress": 15, "pending": 10, "approved": 10, "suspended": 10}
+
+GENERIC_WORDS = ["help", "volunteer", "support", "community"]
+REQUEST_COLUMNS = ("id", "pin_id", "title", "description", "category", "urgency", "status", "location",
+                   "preferred_date", "created_at", "updated_at", "view_count", "shortlist_count")
+
+CHUNK = 50_000
+BULK_CACHE_KIB = -262144  # 256 MB
+
+
+def _weighted(rnd, weights: dict, k: int):
+    return rnd.choices(list(weights), weights=list(weights.values()), k=k)
+
+
+def _insert_sql(table, columns) -> str:
+    return (f"INSERT INTO {table.name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})")
+
+
+class _TimestampFormatter:
+    """
+    Epoch seconds -> the text SQLAlchemy's SQLite DateTime / Date types store
+    ('YYYY-MM-DD HH:MM:SS.ffffff'), with the date part cached per day.
+    """
+
+    def __init__(self):
+        self._days = {}
+
+    def date(self, ts: int) -> str:
+        day = ts // 86400
+        text = self._days.get(day)
+        if text is None:
+            text = self._days[day] = datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y-%m-%d")
+        return text
+
+    def __call__(self, ts: int) -> str:
+        sec = ts % 86400
+        return f"{self.date(ts)} {sec // 3600:02d}:{sec // 60 % 60:02d}:{sec % 60:02d}.000000"
+
+
+def generate_demo_data(pins: int = 200, csrs: int = 50, categories: int = 10, requests: int = 10_000,
+                       views_per_request: float = 1.0, shortlist_rate: float = 0.2,
+                       days: int = 365, seed: int | None = None) -> dict:
+    """
+    Bulk-insert synthetic users, categories, requests, views and shortlists on
+    top of seed_defaults(). Rows go in with Core executemany inside one
+    transaction per table group; view/shortlist counters are computed in
+    Python so no UPDATE pass is needed. The FTS index is rebuilt once at the end.
+    Returns the number of rows inserted per table.
+    """
+    rnd = random.Random(seed)
+    started = time.perf_counter()
+    seed_defaults()
+
+    profiles = {p.name: p.id for p in UserProfile.query.all()}
+    password = PasswordHasher.hash(DEMO_PASSWORD)  # one hash shared by every demo account
+    counts = {"users": 0, "service_categories": 0, "requests": 0, "pin_request_views": 0, "csr_shortlist": 0}
+
+    # -------------------------------
+    # Users and categories
+    # -------------------------------
+    offset = (db.session.query(db.func.max(UserAdmin.id)).scalar() or 0) + 1
+    users = [{"name": f"PIN User {offset + i}", "email": f"pin{offset + i}@demo.local", "password": password,
+              "profile_id": profiles["PIN"], "is_suspended": False} for i in range(pins)]
+    users += [{"name": f"CSR Rep {offset + i}", "email": f"csr{offset + i}@demo.local", "password": password,
+               "profile_id": profiles["CSR Rep"], "is_suspended": False} for i in range(csrs)]
+
+    existing_categories = {name for (name,) in db.session.query(ServiceCategory.name)}
+    names = list(CATEGORY_WORDS) + [f"Category {i}" for i in range(len(CATEGORY_WORDS) + 1, categories + 1)]
+    new_categories = [{"name": n, "description": f"{n} services", "is_suspended": False}
+                      for n in names[:categories] if n not in existing_categories]
+    db.session.rollback()  # end the read transaction before taking the write lock
+
+    with db.engine.begin() as conn:
+        if users:
+            conn.execute(db.insert(UserAdmin.__table__), users)
+        if new_categories:
+            conn.execute(db.insert(ServiceCategory.__table__), new_categories)
+    counts["users"], counts["service_categories"] = len(users), len(new_categories)
+
+    pin_ids = [i for (i,) in db.session.query(UserAdmin.id).filter(
+        UserAdmin.profile_id == profiles["PIN"], UserAdmin.email.like("pin%@demo.local"))]
+    csr_ids = [i for (i,) in db.session.query(UserAdmin.id).filter(
+        UserAdmin.profile_id == profiles["CSR Rep"], UserAdmin.email.like("csr%@demo.local"))]
+    category_names = [n for (n,) in db.session.query(ServiceCategory.name)
+                      .filter(ServiceCategory.is_suspended.is_(False))] or list(CATEGORY_WORDS)
+    next_id = (db.session.query(db.func.max(Request.id)).scalar() or 0) + 1
+    db.session.rollback()
+    if not requests or not pin_ids:
+        return counts
+
+    # -------------------------------
+    # Requests, views, shortlists
+    # -------------------------------
+    # Rows are plain tuples sent straight to the driver's executemany; with a
+    # million rows, per-row bind processing would cost more than the inserts.
+    request_sql = _insert_sql(Request.__table__, REQUEST_COLUMNS)
+    view_sql = _insert_sql(PINRequestView.__table__, ("request_id", "csr_company_id", "viewed_at"))
+    shortlist_sql = _insert_sql(CSRService.__table__, ("request_id", "csr_company_id", "added_at"))
+    fmt = _TimestampFormatter()
+    now_ts = int(time.time())
+    span = days * 86400
+    recent_cutoff = now_ts - 14 * 86400
+    rand = rnd.random
+
+    with RequestSearchIndex.bulk_load(), db.engine.begin() as conn:
+        # Big page cache for this connection only: index b-trees stay in memory during the load
+        conn.exec_driver_sql(f"PRAGMA cache_size = {BULK_CACHE_KIB}")
+        for chunk_start in range(0, requests, CHUNK):
+            size = min(CHUNK, requests - chunk_start)
+            urgencies = _weighted(rnd, URGENCY_WEIGHTS, size)
+            recent_statuses = _weighted(rnd, RECENT_STATUS_WEIGHTS, size)
+            older_statuses = _weighted(rnd, OLDER_STATUS_WEIGHTS, size)
+            categories_ = rnd.choices(category_names, k=size)
+            owners = rnd.choices(pin_ids, k=size)
+            templates = rnd.choices(TITLE_TEMPLATES, k=size)
+            request_rows, view_rows, shortlist_rows = [], [], []
+
+            for n in range(size):
+                request_id = next_id + chunk_start + n
+                # Skewed towards recent: most activity happened in the last few weeks
+                created = now_ts - int(span * rand() ** 2)
+                status = recent_statuses[n] if created >= recent_cutoff else older_statuses[n]
+                category = categories_[n]
+                words = CATEGORY_WORDS.get(category, GENERIC_WORDS)
+                i = int(rand() * len(words))
+                a, b = words[i], words[(i + 1 + int(rand() * (len(words) - 1))) % len(words)]
+
+                # Views by distinct CSRs, exponentially distributed around views_per_request
+                n_views = min(len(csr_ids), int(rnd.expovariate(1 / views_per_request))) if views_per_request else 0
+                n_shortlisted = 0
+                if n_views:
+                    window = max(1, min(now_ts - created, 14 * 86400))
+                    for csr_id in rnd.sample(csr_ids, n_views):
+                        viewed = created + int(rand() * window)
+                        view_rows.append((request_id, csr_id, fmt(viewed)))
+                        if rand() < shortlist_rate:
+                            shortlist_rows.append((request_id, csr_id, fmt(min(now_ts, viewed + int(rand() * 259200)))))
+                            n_shortlisted += 1
+
+                updated = created if status == "pending" else min(now_ts, created + int(rand() * 30 * 86400))
+                request_rows.append((
+                    request_id,
+                    owners[n],
+                    templates[n].format(a=a, b=b, A=a.capitalize()),
+                    f"Looking for someone to help with {a} and {b}. {category} request, {words[i - 1]} if possible.",
+                    category,
+                    urgencies[n],
+                    status,
+                    f"Block {int(rand() * 999) + 1}, #{int(rand() * 20) + 1:02d}-{int(rand() * 150) + 1:02d}",
+                    fmt.date(created + int(rand() * 21 + 1) * 86400),
+                    fmt(created),
+                    fmt(updated),
+                    n_views,
+                    n_shortlisted,
+                ))
+
+            conn.exec_driver_sql(request_sql, request_rows)
+            if view_rows:
+                conn.exec_driver_sql(view_sql, view_rows)
+            if shortlist_rows:
+                conn.exec_driver_sql(shortlist_sql, shortlist_rows)
+            counts["requests"] += len(request_rows)
+            counts["pin_request_views"] += len(view_rows)
+            counts["csr_shortlist"] += len(shortlist_rows)
+
+        # Back to the configured size before the connection returns to the pool
+        conn.exec_driver_sql(f"PRAGMA cache_size = {int(current_app.config['SQLITE_PRAGMAS'].get('cache_size', -2000))}")
+
+    # Views and shortlists went in as raw rows; recompute the analytics rollups in one pass
+    RequestActivity.rebuild()
+
+    with db.engine.connect() as conn:
+        # Fresh planner statistics for the new row counts; a sampled ANALYZE is enough
+        conn.exec_driver_sql("PRAGMA analysis_limit = 1000")
+        conn.exec_driver_sql("ANALYZE")
+    ServiceCategory.invalidate_active_cache()
+    print(f"🌱 Demo data in {time.perf_counter() - started:.1f}s: "
+          + ", ".join(f"{k}={v:,}" for k, v in counts.items()))
+    return counts
@@ -0,0 +1,47 @@
+# 📦 File: app/entity/BulkSuspend.py
+from .. import db
+
+# Older SQLite builds allow 999 bound parameters per statement
+MAX_IDS_PER_STATEMENT = 900
+
+
+def set_suspended(model, is_suspended, ids=None, where=None, exclude_ids=()) -> dict:
+    """
+    Set `is_suspended` on many rows of `model` in one transaction, selected
+    either by primary key (`ids`) or by a condition (`where`). Each batch is
+    one UPDATE ... WHERE <rows> AND is_suspended != <new value>, so rows that
+    are already in that state are not written; a COUNT of the same rows then
+    splits the rest into no-op vs. not found.
+    data = {"requested", "changed", "noop", "not_found"}
+    """
+    new_val = bool(is_suspended)
+    table = model.__table__
+    exclude = {int(i) for i in exclude_ids if i is not None}
+    try:
+        if ids is not None:
+            ids = sorted({int(i) for i in ids} - exclude)
+            conditions = [table.c.id.in_(ids[i:i + MAX_IDS_PER_STATEMENT])
+                          for i in range(0, len(ids), MAX_IDS_PER_STATEMENT)]
+        else:
+            conditions = [db.and_(where, table.c.id.notin_(exclude)) if exclude else where]
+
+        changed = matched = 0
+        for condition in conditions:
+            changed += db.session.execute(
+                table.update()
+                .where(condition, table.c.is_suspended != new_val)
+                .values(is_suspended=new_val)
+            ).rowcount
+            matched += db.session.execute(
+                db.select(db.func.count()).select_from(table).where(condition)
+            ).scalar()
+        db.session.commit()
+
+        requested = len(ids) if ids is not None else matched
+        return {"ok": True, "data": {"requested": requested, "changed": changed,
+                                     "noop": matched - changed, "not_found": requested - matched},
+                "errors": []}
+    except Exception as e:
+        db.session.rollback()
+        return {"ok": False, "data": {"requested": 0, "changed": 0, "noop": 0, "not_found": 0},
+                "errors": [f"Database error: {e}"]}
@@ -1,10 +1,23 @@
 # app/entity/CSREntities.py
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from .. import db
+from ..db_routing import read_only
 from .Request import Request, PINRequestView
+from .RequestActivity import RequestActivity
+from .RequestRecommendation import RequestRecommendation
+from .DashboardSummary import DashboardSummary
+from .RequestSearchIndex import RequestSearchIndex
+from .KeysetPagination import DEFAULT_PER_PAGE, EXPORT_BATCH_SIZE
 from datetime import datetime, timedelta
 
 class CSRService(db.Model):
     __tablename__ = 'csr_shortlist'
+    __table_args__ = (
+        # Shortlist / completed history for one CSR, ordered by added_at
+        db.Index('ix_csr_shortlist_csr_added', 'csr_company_id', 'added_at'),
+        # One shortlist row per (request, CSR); add_to_shortlist relies on it for ON CONFLICT
+        db.Index('uq_csr_shortlist_request_csr', 'request_id', 'csr_company_id', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     request_id = db.Column(db.Integer, db.ForeignKey('requests.id'), nullable=False)
@@ -12,13 +25,41 @@ class CSRService(db.Model):
     added_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     request = db.relationship('Request', backref=db.backref('shortlisted_by', lazy=True))
+
+    @classmethod
+    def remove_duplicates(cls) -> int:
+        """
+        Keep the first shortlist row (lowest id) per (request, CSR) so that
+        uq_csr_shortlist_request_csr can be built on databases from before it
+        existed, and recount shortlist_count for the requests affected.
+        Returns the number of rows deleted.
+        """
+        affected = [row[0] for row in db.session.execute(db.text(
+            "SELECT DISTINCT request_id FROM csr_shortlist"
+            " GROUP BY request_id, csr_company_id HAVING count(*) > 1"
+        ))]
+        if not affected:
+            return 0
+        deleted = db.session.execute(db.text(
+            "DELETE FROM csr_shortlist WHERE id NOT IN ("
+            " SELECT min(id) FROM csr_shortlist GROUP BY request_id, csr_company_id)"
+        )).rowcount
+        db.session.execute(
+            db.text("UPDATE requests SET shortlist_count ="
+                    " (SELECT count(*) FROM csr_shortlist WHERE request_id = requests.id)"
+                    " WHERE id IN :ids").bindparams(db.bindparam("ids", expanding=True)),
+            {"ids": affected},
+        )
+        db.session.commit()
+        return deleted
     # -----------------------------
     # Completed services (history & search)
     # -----------------------------
     
     #Entity for: As CSR Representative, I want to view the history of completed volunteer services#
     @classmethod
-    def get_completed_services_history(cls, csr_company_id):
+    @read_only
+    def get_completed_services_history(cls, csr_company_id, cursor=None, per_page=DEFAULT_PER_PAGE):
         try:
             # Get requests that were completed by this CSR
             query = Request.query.join(CSRService).filter(
@@ -26,12 +67,27 @@ class CSRService(db.Model):
                 Request.status == 'completed'
             )
             
-            return query.order_by(Request.updated_at.desc()).all()
+            return Request.newest_first_page(query, cursor, per_page, sort_column='updated_at')
+        except Exception as e:
+            return f"error:{str(e)}"
+
+    #Entity for: As CSR Representative, I want to export all my completed volunteer services#
+    @classmethod
+    @read_only
+    def export_completed_services(cls, csr_company_id, batch_size=EXPORT_BATCH_SIZE):
+        try:
+            query = Request.projected(Request.query.join(CSRService).filter(
+                CSRService.csr_company_id == csr_company_id,
+                Request.status == 'completed'
+            )).order_by(Request.updated_at.desc(), Request.id.desc())
+            # Runs now; rows are then fetched batch_size at a time while the caller iterates
+            return db.session.execute(query.statement.execution_options(yield_per=batch_size))
         except Exception as e:
             return f"error:{str(e)}"
 
     #Entity for: As CSR Representative, I want to search for completed volunteer services by type and date#
     @classmethod
+    @read_only
     def search_completed_services(cls, csr_company_id, search_title=None, search_date=None):
         try:
             query = Request.query.join(CSRService).filter(
@@ -57,11 +113,39 @@ class CSRService(db.Model):
     
     #Entity for: As CSR, I want to search for available service requests#
     @classmethod
-    def search_available_requests(cls, search_term=None, category=None, urgency=None):
+    @read_only
+    def search_available_requests(cls, search_term=None, category=None, urgency=None,
+                                  cursor=None, per_page=DEFAULT_PER_PAGE, as_rows=False, csr_company_id=None,
+                                  sort="newest"):
+        """
+        With `csr_company_id`, the returned page also carries `shortlisted_ids`
+        and `viewed_ids`: which of its requests that CSR already shortlisted
+        or viewed (see `flag_seen`). sort="recommended" ranks the requests for
+        that CSR (RequestRecommendation); a search term keeps relevance order.
+        """
         try:
+            if sort == "recommended" and not search_term and csr_company_id is not None:
+                page = RequestRecommendation.recommended_page(csr_company_id, category, urgency,
+                                                              cursor, per_page, as_rows)
+                return page if isinstance(page, str) else cls.flag_seen(page, csr_company_id)
+
             query = Request.query.filter(Request.status.in_(['pending', 'approved']))
+            if as_rows:
+                query = Request.projected(query)
+            
+            if category:
+                query = query.filter(Request.category == category)
+            
+            if urgency:
+                query = query.filter(Request.urgency == urgency)
             
             if search_term:
+                # Ranked full-text match; falls back to LIKE if FTS5 is unavailable
+                ranked = RequestSearchIndex.apply(query, search_term)
+                if ranked is not None:
+                    page = RequestSearchIndex.ranked_page(ranked, cursor, per_page, as_rows=as_rows)
+                    return cls.flag_seen(page, csr_company_id)
+                
                 search_pattern = f"%{search_term}%"
                 query = query.filter(
                     db.or_(
@@ -71,16 +155,33 @@ class CSRService(db.Model):
                     )
                 )
             
-            if category:
-                query = query.filter(Request.category == category)
-            
-            if urgency:
-                query = query.filter(Request.urgency == urgency)
-            
-            return query.order_by(Request.created_at.desc()).all()
+            return cls.flag_seen(Request.newest_first_page(query, cursor, per_page), csr_company_id)
         except Exception as e:
             return f"error:{str(e)}"
 
+    @classmethod
+    def flag_seen(cls, page, csr_company_id):
+        """
+        Set page.shortlisted_ids / page.viewed_ids to the ids on `page` that
+        `csr_company_id` has in csr_shortlist / pin_request_views: one
+        IN (...) query each over the page's ids, both answered from the
+        (request_id, csr_company_id) indexes. No CSR: the page is returned as is.
+        """
+        if csr_company_id is None:
+            return page
+        ids = [item.id for item in page]
+        page.shortlisted_ids, page.viewed_ids = frozenset(), frozenset()
+        if ids:
+            page.shortlisted_ids = frozenset(
+                rid for (rid,) in db.session.query(cls.request_id)
+                .filter(cls.csr_company_id == csr_company_id, cls.request_id.in_(ids))
+            )
+            page.viewed_ids = frozenset(
+                rid for (rid,) in db.session.query(PINRequestView.request_id)
+                .filter(PINRequestView.csr_company_id == csr_company_id, PINRequestView.request_id.in_(ids))
+            )
+        return page
+
 
     # -----------------------------
     # Request details
@@ -106,29 +207,34 @@ class CSRService(db.Model):
     @classmethod
     def add_to_shortlist(cls, request_id, csr_company_id):
         try:
-            existing = CSRService.query.filter_by(
-                request_id=request_id, 
-                csr_company_id=csr_company_id
-            ).first()
-            
-            if existing:
-                return "already_shortlisted"
-            
-            # ✅ NEW: Get the request and increment shortlist_count
-            request = Request.query.get(request_id)
-            if not request:
-                return "request_not_found"
-            
-            shortlist = CSRService(
-                request_id=request_id,
-                csr_company_id=csr_company_id,
-                added_at=datetime.utcnow()
+            shortlist = cls.__table__
+            requests = Request.__table__
+
+            # INSERT ... SELECT ... WHERE the request exists ON CONFLICT DO NOTHING:
+            # one statement, and the unique index stops double clicks adding twice
+            now = datetime.utcnow()
+            source = db.select(
+                db.literal(request_id), db.literal(csr_company_id), db.literal(now)
+            ).where(db.exists().where(requests.c.id == request_id))
+            insert = sqlite_insert(shortlist).from_select(
+                ['request_id', 'csr_company_id', 'added_at'], source
+            ).on_conflict_do_nothing(index_elements=['request_id', 'csr_company_id'])
+
+            if db.session.execute(insert).rowcount == 0:
+                exists = db.session.execute(
+                    db.select(requests.c.id).where(requests.c.id == request_id)
+                ).first()
+                db.session.rollback()
+                return "already_shortlisted" if exists else "request_not_found"
+
+            db.session.execute(
+                requests.update()
+                .where(requests.c.id == request_id)
+                .values(shortlist_count=db.func.coalesce(requests.c.shortlist_count, 0) + 1)
             )
-            db.session.add(shortlist)
-            
-            # ✅ NEW: Increment the shortlist count
-            request.shortlist_count += 1
+            RequestActivity.record([(request_id, now, "shortlists", 1)])
             db.session.commit()
+            DashboardSummary.invalidate(("csr", csr_company_id))
             return "success"
         except Exception as e:
             db.session.rollback()
@@ -137,13 +243,23 @@ class CSRService(db.Model):
     # User Story 4: Search shortlisted requests
     #Entity for: As CSR, I want to search through my shortlisted requests#
     @classmethod
-    def search_shortlisted_requests(cls, csr_company_id, search_term=None):
+    @read_only
+    def search_shortlisted_requests(cls, csr_company_id, search_term=None, as_rows=False):
         try:
             query = Request.query.join(CSRService).filter(
                 CSRService.csr_company_id == csr_company_id
             )
+            if as_rows:
+                query = Request.projected(query)
             
             if search_term:
+                ranked = RequestSearchIndex.apply(query, search_term, columns=('title', 'description'))
+                if ranked is not None:
+                    rows = ranked.order_by(
+                        RequestSearchIndex.rank_expression(), CSRService.added_at.desc()
+                    ).all()
+                    return rows if as_rows else RequestSearchIndex.attach_snippets(rows)
+                
                 search_pattern = f"%{search_term}%"
                 query = query.filter(
                     db.or_(
@@ -156,6 +272,23 @@ class CSRService(db.Model):
         except Exception as e:
             return f"error:{str(e)}"
 
+    #Validator for conditional GET: shortlist and completed-services pages#
+    @classmethod
+    @read_only
+    def shortlist_version(cls, csr_company_id):
+        """
+        (row count, newest added_at, newest request updated_at) of one CSR's
+        shortlist: an add or remove changes the first two, any edit, status
+        change or counter bump on a shortlisted request the third.
+        """
+        try:
+            return tuple(db.session.query(
+                db.func.count(CSRService.id), db.func.max(CSRService.added_at), db.func.max(Request.updated_at)
+            ).join(Request, Request.id == CSRService.request_id)
+             .filter(CSRService.csr_company_id == csr_company_id).one())
+        except Exception as e:
+            return f"error:{str(e)}"
+
     # User Story 5: View shortlisted request details
     #Entity for: As CSR, I want to view the details of my shortlisted requests#
     @classmethod
@@ -183,24 +316,28 @@ class CSRService(db.Model):
     @classmethod
     def remove_from_shortlist(cls, request_id, csr_company_id):
         try:
-            shortlist = CSRService.query.filter_by(   
-                request_id=request_id, 
-                csr_company_id=csr_company_id
-            ).first()
-            
-            if not shortlist:
+            shortlist = cls.__table__
+            requests = Request.__table__
+
+            deleted = db.session.execute(
+                shortlist.delete().where(
+                    shortlist.c.request_id == request_id,
+                    shortlist.c.csr_company_id == csr_company_id,
+                )
+            ).rowcount
+            if deleted == 0:
+                db.session.rollback()
                 return "not_found"
-            
-  
-            request = Request.query.get(request_id)
-            if request and request.shortlist_count > 0:
-                request.shortlist_count -= 1
-            
-            db.session.delete(shortlist)
+
+            db.session.execute(
+                requests.update()
+                .where(requests.c.id == request_id, requests.c.shortlist_count > 0)
+                .values(shortlist_count=requests.c.shortlist_count - deleted)
+            )
+            RequestActivity.record([(request_id, datetime.utcnow(), "unshortlists", deleted)])
             db.session.commit()
+            DashboardSummary.invalidate(("csr", csr_company_id))
             return "success"
         except Exception as e:
             db.session.rollback()
             return f"error:{str(e)}"
-
-
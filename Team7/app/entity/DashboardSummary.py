@@ -0,0 +1,160 @@
+# 📦 File: app/entity/DashboardSummary.py
+from .. import db
+from ..cache import TTLCache
+from ..db_routing import read_only
+
+# Request statuses that still need (or are getting) help
+OPEN_STATUSES = ("pending", "approved", "in_progress")
+
+ADMIN = "admin"
+PLATFORM = "platform"
+
+
+class DashboardSummary:
+    """
+    Counts shown on the four dashboards, each from one GROUP BY query and
+    cached for DASHBOARD_SUMMARY_TTL seconds:
+
+      admin     users per profile, and how many are suspended
+      platform  requests per category (open / completed / total)
+      pin       one PIN's requests per status
+      csr       one CSR's shortlist per request status (open / completed)
+
+    Entity methods that write the underlying rows call `invalidate` after
+    their commit, so a change shows on the next page load in this process.
+    Other processes only see it when their entry expires (the TTL), as do
+    changes nothing invalidates explicitly (e.g. the status of a request
+    on somebody's shortlist).
+    """
+
+    _cache = TTLCache(max_size=2_000, ttl=30, name="dashboard_summaries")
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("DASHBOARD_SUMMARY_TTL", 30)
+        app.config.setdefault("DASHBOARD_SUMMARY_CACHE_SIZE", 2_000)
+        cls._cache = TTLCache(
+            max_size=int(app.config["DASHBOARD_SUMMARY_CACHE_SIZE"]),
+            ttl=float(app.config["DASHBOARD_SUMMARY_TTL"]),
+            name="dashboard_summaries",
+        )
+
+    @classmethod
+    def invalidate(cls, *keys):
+        """Drop the given summaries (ADMIN, PLATFORM, ("pin", id), ("csr", id)); none = all."""
+        if not keys:
+            cls._cache.invalidate()
+        for key in keys:
+            cls._cache.invalidate(key)
+
+    @classmethod
+    def cache_stats(cls) -> dict:
+        return cls._cache.stats()
+
+    @classmethod
+    def _cached(cls, key, loader):
+        try:
+            return cls._cache.get_or_set(key, loader)
+        except Exception as e:
+            db.session.rollback()
+            return f"error:{str(e)}"
+
+    # -------------------------------
+    # Summaries
+    # -------------------------------
+    @classmethod
+    def admin(cls):
+        """Entity for: As User Admin, I want to see how many users each profile has."""
+        return cls._cached(ADMIN, cls._load_admin)
+
+    @classmethod
+    def platform(cls):
+        """Entity for: As Platform Management, I want to see how many requests each category has."""
+        return cls._cached(PLATFORM, cls._load_platform)
+
+    @classmethod
+    def pin(cls, pin_id):
+        """Entity for: As PIN, I want to see how many of my requests are in each status."""
+        return cls._cached(("pin", pin_id), lambda: cls._load_pin(pin_id))
+
+    @classmethod
+    def csr(cls, csr_company_id):
+        """Entity for: As CSR, I want to see my open and completed shortlist totals."""
+        return cls._cached(("csr", csr_company_id), lambda: cls._load_csr(csr_company_id))
+
+    # -------------------------------
+    # Loaders (plain dicts: cached values are shared across requests)
+    # -------------------------------
+    @staticmethod
+    def _status_totals(by_status: dict) -> dict:
+        return {
+            "by_status": by_status,
+            "total": sum(by_status.values()),
+            "open": sum(by_status.get(s, 0) for s in OPEN_STATUSES),
+            "completed": by_status.get("completed", 0),
+        }
+
+    @classmethod
+    @read_only
+    def _load_admin(cls):
+        from .UserAdmin import UserAdmin
+        from .UserProfile import UserProfile
+        rows = (db.session.query(
+                    UserProfile.name, UserProfile.is_suspended,
+                    db.func.count(UserAdmin.id),
+                    db.func.coalesce(db.func.sum(db.cast(UserAdmin.is_suspended, db.Integer)), 0))
+                .outerjoin(UserAdmin, UserAdmin.profile_id == UserProfile.id)
+                .group_by(UserProfile.id)
+                .order_by(UserProfile.id)
+                .all())
+        profiles = [{"name": name, "is_suspended": bool(suspended_profile), "users": users, "suspended": suspended}
+                    for name, suspended_profile, users, suspended in rows]
+        return {
+            "profiles": profiles,
+            "users": sum(p["users"] for p in profiles),
+            "suspended": sum(p["suspended"] for p in profiles),
+        }
+
+    @classmethod
+    @read_only
+    def _load_platform(cls):
+        from .Request import Request
+        from .ServiceCategory import ServiceCategory
+        counts = {}
+        for category, status, n in (db.session.query(Request.category, Request.status, db.func.count())
+                                    .group_by(Request.category, Request.status)):
+            counts.setdefault(category, {})[status] = n
+        suspended = dict(db.session.query(ServiceCategory.name, ServiceCategory.is_suspended))
+
+        categories = [
+            {"name": name, "is_suspended": bool(suspended.get(name)), **cls._status_totals(counts.get(name, {}))}
+            for name in sorted(set(counts) | set(suspended))
+        ]
+        return {
+            "categories": categories,
+            "requests": sum(c["total"] for c in categories),
+            "open": sum(c["open"] for c in categories),
+            "completed": sum(c["completed"] for c in categories),
+            "active_categories": sum(1 for is_suspended in suspended.values() if not is_suspended),
+            "suspended_categories": sum(1 for is_suspended in suspended.values() if is_suspended),
+        }
+
+    @classmethod
+    @read_only
+    def _load_pin(cls, pin_id):
+        from .Request import Request
+        by_status = dict(db.session.query(Request.status, db.func.count())
+                         .filter(Request.pin_id == pin_id)
+                         .group_by(Request.status))
+        return cls._status_totals(by_status)
+
+    @classmethod
+    @read_only
+    def _load_csr(cls, csr_company_id):
+        from .Request import Request
+        from .CSREntities import CSRService
+        by_status = dict(db.session.query(Request.status, db.func.count())
+                         .join(CSRService, CSRService.request_id == Request.id)
+                         .filter(CSRService.csr_company_id == csr_company_id)
+                         .group_by(Request.status))
+        return cls._status_totals(by_status)
@@ -0,0 +1,147 @@
+# 📦 File: app/entity/KeysetPagination.py
+import base64
+import json
+from datetime import datetime
+
+from .. import db
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+# Rows fetched per round trip when streaming a whole result (exports)
+EXPORT_BATCH_SIZE = 1000
+
+
+class KeysetPage(list):
+    """
+    One page of results. Still a plain list for templates and callers that
+    only iterate; next_cursor / prev_cursor are opaque tokens for the
+    neighbouring pages (None when there is no such page).
+    """
+
+    def __init__(self, items, next_cursor=None, prev_cursor=None, per_page=DEFAULT_PER_PAGE):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.per_page = per_page
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+
+# -------------------------------
+# Cursor tokens
+# -------------------------------
+def encode_cursor(values, direction: str = "next") -> str:
+    """Pack a sort key (e.g. (created_at, id)) into a URL-safe token."""
+    payload = {
+        "d": direction,
+        "v": [{"dt": v.isoformat()} if isinstance(v, datetime) else v for v in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str | None, size: int):
+    """
+    Unpack a token from encode_cursor. Returns (direction, values), or None
+    for a missing or malformed token (callers then show the first page).
+    """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        direction = payload["d"]
+        values = [
+            datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v
+            for v in payload["v"]
+        ]
+        if direction not in ("next", "prev") or len(values) != size:
+            return None
+        return direction, values
+    except Exception:
+        return None
+
+
+# -------------------------------
+# Query helper
+# -------------------------------
+def _stored_forms(value):
+    """
+    The lowest and highest text a DateTime column can hold for `value`.
+    SQLite compares DATETIME as text: SQLAlchemy writes
+    'YYYY-MM-DD HH:MM:SS.ffffff', but older rows hold 'YYYY-MM-DD HH:MM:SS',
+    which sorts before any fraction of the same second. Bounds built from
+    these forms match both, and stay plain comparisons on the (indexed)
+    column.
+    """
+    seconds = value.strftime("%Y-%m-%d %H:%M:%S")
+    highest = f"{seconds}.{value.microsecond:06d}"
+    lowest = highest if value.microsecond else seconds
+    return db.literal(lowest, db.String), db.literal(highest, db.String)
+
+
+def _after(keys, values):
+    """
+    Rows strictly after `values` in the order given by `keys`
+    ([(column, descending), ...]). Written as
+        k0 <= v0 AND (k0 < v0 OR <rest>)
+    so the leading column stays usable as an index range.
+    """
+    (col, desc), value = keys[0], values[0]
+    lowest = highest = value
+    if isinstance(value, datetime) and isinstance(getattr(col, "type", None), db.DateTime):
+        lowest, highest = _stored_forms(value)
+    strictly = col < lowest if desc else col > highest
+    if len(keys) == 1:
+        return strictly
+    or_equal = col <= highest if desc else col >= lowest
+    return db.and_(or_equal, db.or_(strictly, _after(keys[1:], values[1:])))
+
+
+def keyset_paginate(query, keys, key, cursor=None, per_page=DEFAULT_PER_PAGE, transform=None):
+    """
+    Fetch one page of `query` ordered by `keys`, a list of
+    (column, descending) pairs whose last entry must be unique (the id).
+
+    key(item) returns the sort-key values of a result item; `transform`
+    optionally converts raw rows into items (e.g. attach search snippets).
+    Returns a KeysetPage.
+    """
+    per_page = max(1, min(int(per_page or DEFAULT_PER_PAGE), MAX_PER_PAGE))
+    decoded = decode_cursor(cursor, len(keys))
+    direction, values = decoded if decoded else ("next", None)
+
+    # A "prev" page is read backwards from the cursor, then flipped
+    scan_keys = keys if direction == "next" else [(col, not desc) for col, desc in keys]
+    if values is not None:
+        query = query.filter(_after(scan_keys, values))
+    query = query.order_by(*[col.desc() if desc else col.asc() for col, desc in scan_keys])
+
+    rows = query.limit(per_page + 1).all()
+    more = len(rows) > per_page
+    rows = rows[:per_page]
+    if direction == "prev":
+        rows.reverse()
+    items = transform(rows) if transform else rows
+
+    if not items:
+        return KeysetPage([], per_page=per_page)
+
+    first, last = key(items[0]), key(items[-1])
+    if direction == "next":
+        has_next, has_prev = more, values is not None
+    else:
+        has_next, has_prev = True, more
+
+    return KeysetPage(
+        items,
+        next_cursor=encode_cursor(last, "next") if has_next else None,
+        prev_cursor=encode_cursor(first, "prev") if has_prev else None,
+        per_page=per_page,
+    )
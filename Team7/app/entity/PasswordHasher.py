@@ -0,0 +1,150 @@
+# 📦 File: app/entity/PasswordHasher.py
+import hmac
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash, check_password_hash
+
+
+class PasswordHasher:
+    """
+    Password hashing on a bounded worker pool.
+
+    scrypt/pbkdf2 cost ~100 ms of CPU each. Running them on a fixed pool of
+    PASSWORD_HASH_WORKERS threads caps how many cores a login spike can take,
+    and PASSWORD_HASH_MAX_PENDING bounds the backlog: past it, hash() and
+    verify() raise Busy at once instead of piling up. hash_many() (bulk
+    imports) waits up to PASSWORD_HASH_TIMEOUT for a slot instead. hashlib
+    releases the GIL, so other request threads keep running while a hash is
+    computed.
+    """
+
+    DEFAULT_METHOD = "scrypt:32768:8:1"
+
+    _method = DEFAULT_METHOD
+    _method_params = ("scrypt", 32768, 8, 1)
+    _timeout = 10.0
+    _pool = None
+    _slots = None
+    _workers = 1
+
+    class Busy(Exception):
+        """The hashing pool is saturated; try again shortly."""
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("PASSWORD_HASH_METHOD", cls.DEFAULT_METHOD)
+        app.config.setdefault("PASSWORD_HASH_WORKERS", 2)
+        app.config.setdefault("PASSWORD_HASH_MAX_PENDING", 32)
+        app.config.setdefault("PASSWORD_HASH_TIMEOUT", 10.0)
+
+        cls._method = app.config["PASSWORD_HASH_METHOD"]
+        cls._method_params = cls.method_params(cls._method)
+        cls._timeout = float(app.config["PASSWORD_HASH_TIMEOUT"])
+        cls._workers = int(app.config["PASSWORD_HASH_WORKERS"])
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=False)
+        cls._pool = ThreadPoolExecutor(
+            max_workers=cls._workers,
+            thread_name_prefix="password-hash",
+        )
+        cls._slots = threading.BoundedSemaphore(
+            cls._workers + int(app.config["PASSWORD_HASH_MAX_PENDING"])
+        )
+
+    # -------------------------------
+    # Pool
+    # -------------------------------
+    @classmethod
+    def _run(cls, fn, *args):
+        if cls._pool is None:  # scripts / shell without create_app()
+            return fn(*args)
+        if not cls._slots.acquire(blocking=False):  # backlog full: fail fast
+            raise cls.Busy()
+        try:
+            future = cls._pool.submit(fn, *args)
+        except Exception:
+            cls._slots.release()
+            raise
+        # The slot belongs to the job, not the caller: a job that outlives the
+        # caller's timeout keeps counting against the backlog until it ends
+        future.add_done_callback(lambda _: cls._slots.release())
+        try:
+            return future.result(timeout=cls._timeout)
+        except FutureTimeout:
+            future.cancel()  # still queued: drop it (running jobs can't be stopped)
+            raise cls.Busy()
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+    @staticmethod
+    def is_hashed(stored: str) -> bool:
+        method = (stored or "").split("$", 1)[0]
+        return "$" in (stored or "") and method.startswith(("scrypt", "pbkdf2"))
+
+    @staticmethod
+    def method_params(method: str):
+        """
+        'scrypt' / 'pbkdf2:sha256' / a stored hash's prefix -> the full
+        parameters werkzeug hashes with, e.g. ("scrypt", 32768, 8, 1) or
+        ("pbkdf2", "sha256", 1000000). None if it cannot be parsed.
+        """
+        name, *args = (method or "").split(":")
+        try:
+            if name == "scrypt":
+                n, r, p = map(int, args) if args else (2**15, 8, 1)
+                return name, n, r, p
+            if name == "pbkdf2" and len(args) <= 2:
+                hash_name = args[0] if args else "sha256"
+                iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+                return name, hash_name, iterations
+        except ValueError:
+            pass
+        return None
+
+    @classmethod
+    def hash(cls, password: str) -> str:
+        return cls._run(generate_password_hash, password, cls._method)
+
+    @classmethod
+    def hash_many(cls, passwords) -> list[str]:
+        """
+        Hash a batch (bulk imports) using every worker at once. At most
+        `workers` of the batch's jobs are queued at a time, so logins
+        waiting behind an import only wait for those.
+        """
+        passwords = list(passwords)
+        if cls._pool is None:
+            return [generate_password_hash(p, cls._method) for p in passwords]
+
+        in_flight = threading.BoundedSemaphore(cls._workers)
+        futures = []
+        for password in passwords:
+            in_flight.acquire()
+            if not cls._slots.acquire(timeout=cls._timeout):
+                in_flight.release()
+                raise cls.Busy()
+            future = cls._pool.submit(generate_password_hash, password, cls._method)
+            future.add_done_callback(lambda _: (cls._slots.release(), in_flight.release()))
+            futures.append(future)
+        try:
+            return [future.result(timeout=cls._timeout) for future in futures]
+        except FutureTimeout:
+            for future in futures:
+                future.cancel()
+            raise cls.Busy()
+
+    @classmethod
+    def verify(cls, stored: str, password: str) -> tuple[bool, bool]:
+        """
+        Check `password` against a stored value.
+        Returns (ok, needs_rehash); needs_rehash is True for legacy plain-text
+        values and for hashes made with a different method/cost than configured.
+        """
+        if not cls.is_hashed(stored):
+            ok = hmac.compare_digest((stored or "").encode(), (password or "").encode())
+            return ok, ok
+
+        ok = cls._run(check_password_hash, stored, password)
+        return ok, ok and cls.method_params(stored.split("$", 1)[0]) != cls._method_params
@@ -1,9 +1,24 @@
 from .. import db
+from ..db_routing import read_only
 from datetime import datetime, timedelta
 from .UserAccount import UserAccount
+from .KeysetPagination import keyset_paginate, DEFAULT_PER_PAGE, EXPORT_BATCH_SIZE
+from .RequestActivity import RequestActivity
+from .DashboardSummary import DashboardSummary, PLATFORM
 
 class Request(db.Model):
     __tablename__ = 'requests'
+    __table_args__ = (
+        # PIN pages: filter by owner + status, newest first
+        db.Index('ix_requests_pin_status_created', 'pin_id', 'status', 'created_at'),
+        # CSR browse: open requests, newest first
+        db.Index('ix_requests_status_created', 'status', 'created_at'),
+        # Page validators (ETags): newest change per PIN, and across all requests
+        db.Index('ix_requests_pin_updated', 'pin_id', 'updated_at'),
+        db.Index('ix_requests_updated_at', 'updated_at'),
+        # Platform dashboard: requests per category and status, read from the index alone
+        db.Index('ix_requests_category_status', 'category', 'status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     pin_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -21,6 +36,10 @@ class Request(db.Model):
     
     # Relationship to UserAccount
     pin_user = db.relationship('UserAdmin', backref=db.backref('requests', lazy=True))
+
+    # Columns the JSON API returns; read as plain rows via `projected`
+    API_FIELDS = ('id', 'pin_id', 'title', 'description', 'category', 'urgency', 'status', 'location',
+                  'preferred_date', 'created_at', 'updated_at', 'view_count', 'shortlist_count')
     
     def __init__(self, pin_id, title, description, category, urgency='medium', location=None, preferred_date=None):
         self.pin_id = pin_id
@@ -46,6 +65,23 @@ class Request(db.Model):
             'view_count': self.view_count,
             'shortlist_count': self.shortlist_count
         }
+
+    @classmethod
+    def projected(cls, query):
+        """The same query returning rows of API_FIELDS values instead of Request objects."""
+        return query.with_entities(*(getattr(cls, name) for name in cls.API_FIELDS))
+
+    @classmethod
+    def newest_first_page(cls, query, cursor=None, per_page=DEFAULT_PER_PAGE, sort_column='created_at'):
+        """One keyset page of a Request query ordered by (sort_column, id) descending."""
+        column = getattr(cls, sort_column)
+        return keyset_paginate(
+            query,
+            [(column, True), (cls.id, True)],
+            key=lambda r: (getattr(r, sort_column), r.id),
+            cursor=cursor,
+            per_page=per_page,
+        )
             
     # -----------------------------
     # Shortlists
@@ -66,6 +102,7 @@ class Request(db.Model):
     # Completed matches
     # -----------------------------
     @classmethod
+    @read_only
     def search_completed_matches(cls, pin_id, search_title=None, search_date=None):
         """Entity for: As PIN, I want to search my completed matches by title and date"""
         try:
@@ -92,13 +129,15 @@ class Request(db.Model):
             
 
     @classmethod
-    def get_completed_matches_history(cls, pin_id):
+    @read_only
+    def get_completed_matches_history(cls, pin_id, cursor=None, per_page=DEFAULT_PER_PAGE):
         """Entity for: As PIN, I want to view the history of my completed matches"""
         try:
-            return cls.query.filter_by(
+            query = cls.query.filter_by(
                 pin_id=pin_id, 
                 status='completed'
-            ).order_by(cls.created_at.desc()).all()
+            )
+            return cls.newest_first_page(query, cursor, per_page)
         except Exception as e:
             return f"error:{str(e)}"
             
@@ -117,18 +156,22 @@ class Request(db.Model):
             )
             db.session.add(request)
             db.session.commit()
+            DashboardSummary.invalidate(PLATFORM, ("pin", pin_id))
             return "success"  
         except Exception as e:
             return f"error:{str(e)}"
 
     @classmethod
-    def get_active_requests(cls, pin_id):
+    @read_only
+    def get_active_requests(cls, pin_id, cursor=None, per_page=DEFAULT_PER_PAGE, as_rows=False):
         """Entity for: As PIN, I want to view my active requests"""
         try:
-            requests = cls.query.filter_by(pin_id=pin_id).filter(
+            query = cls.query.filter_by(pin_id=pin_id).filter(
                 cls.status.notin_(['completed', 'suspended'])
-            ).all()
-            return requests  # Return list of requests
+            )
+            if as_rows:
+                query = cls.projected(query)
+            return cls.newest_first_page(query, cursor, per_page)  # Return page of requests
         except Exception as e:
             return f"error:{str(e)}"  # Return error string
 
@@ -140,6 +183,7 @@ class Request(db.Model):
             request = cls.query.filter_by(id=request_id, pin_id=pin_id).first()
             request.status = 'suspended'
             db.session.commit()
+            DashboardSummary.invalidate(PLATFORM, ("pin", pin_id))
             return "success"  
         except Exception as e:
             return f"error:{str(e)}"
@@ -164,6 +208,7 @@ class Request(db.Model):
             
             request.updated_at = datetime.utcnow()
             db.session.commit()
+            DashboardSummary.invalidate(PLATFORM, ("pin", pin_id))
             return "success"
             
         except Exception as e:
@@ -174,28 +219,96 @@ class Request(db.Model):
     # Read (active / history / search)
     # -----------------------------
     @classmethod
-    def get_pin_request_history(cls, pin_id):
+    @read_only
+    def get_pin_request_history(cls, pin_id, cursor=None, per_page=DEFAULT_PER_PAGE, as_rows=False):
         """Entity for: As PIN, I want to view my request history"""
         try:
-            requests = cls.query.filter_by(pin_id=pin_id).filter(
+            query = cls.query.filter_by(pin_id=pin_id).filter(
                 cls.status.in_(['completed', 'suspended'])
-            ).order_by(cls.created_at.desc()).all()
-            return requests  # Return request objects 
+            )
+            if as_rows:
+                query = cls.projected(query)
+            return cls.newest_first_page(query, cursor, per_page)  # Return page of requests
         except Exception as e:
             return f"error:{str(e)}"  # Return error string
 
     @classmethod
-    def search_pin_requests(cls, pin_id, search_term):
+    @read_only
+    def export_pin_request_history(cls, pin_id, batch_size=EXPORT_BATCH_SIZE):
+        """Entity for: As PIN, I want to export my whole request history"""
+        try:
+            query = cls.projected(cls.query.filter_by(pin_id=pin_id).filter(
+                cls.status.in_(['completed', 'suspended'])
+            )).order_by(cls.created_at.desc(), cls.id.desc())
+            # Runs now; rows are then fetched batch_size at a time while the caller iterates
+            return db.session.execute(query.statement.execution_options(yield_per=batch_size))
+        except Exception as e:
+            return f"error:{str(e)}"  # Return error string
+
+    @classmethod
+    @read_only
+    def search_pin_requests(cls, pin_id, search_term, cursor=None, per_page=DEFAULT_PER_PAGE, as_rows=False):
         """Entity for: As PIN, I want to search my requests by title"""
         try:
+            from .RequestSearchIndex import RequestSearchIndex
+
+            query = cls.query.filter_by(pin_id=pin_id)
+            if as_rows:
+                query = cls.projected(query)
+            ranked = RequestSearchIndex.apply(query, search_term, columns=('title',))
+            if ranked is not None:
+                return RequestSearchIndex.ranked_page(ranked, cursor, per_page, as_rows=as_rows)
+
             search_pattern = f"%{search_term}%"
-            requests = cls.query.filter_by(pin_id=pin_id).filter(
+            query = query.filter(
                 cls.title.ilike(search_pattern)  
-            ).order_by(cls.created_at.desc()).all()
-            return requests  # Return request objects 
+            )
+            return cls.newest_first_page(query, cursor, per_page)  # Return page of requests
         except Exception as e:
             return f"error:{str(e)}"  # Return error string
 
+    @classmethod
+    @read_only
+    def get_request_row(cls, request_id, pin_id=None):
+        """Entity for the JSON API: one request as an API_FIELDS row, optionally only if pin_id owns it"""
+        try:
+            query = cls.projected(cls.query.filter_by(id=request_id))
+            if pin_id is not None:
+                query = query.filter_by(pin_id=pin_id)
+            row = query.first()
+            return row if row is not None else "not_found"
+        except Exception as e:
+            return f"error:{str(e)}"
+
+    # -------------------------------
+    # Validators for conditional GET (app/http_cache.py)
+    # -------------------------------
+    # Every insert and update sets updated_at (onupdate also fires for Core
+    # UPDATEs such as the view/shortlist counters) and requests are never
+    # deleted, so these change whenever a page built from the rows could.
+    @classmethod
+    @read_only
+    def pin_requests_version(cls, pin_id):
+        """(row count, newest updated_at) of one PIN's requests; an index-only scan"""
+        try:
+            return tuple(db.session.query(db.func.count(cls.id), db.func.max(cls.updated_at))
+                         .filter(cls.pin_id == pin_id).one())
+        except Exception as e:
+            return f"error:{str(e)}"
+
+    @classmethod
+    @read_only
+    def requests_version(cls):
+        """(highest id, newest updated_at) over all requests; two index lookups"""
+        try:
+            # Separate scalar subqueries so SQLite answers each MAX from its index
+            return tuple(db.session.execute(db.select(
+                db.select(db.func.max(cls.id)).scalar_subquery(),
+                db.select(db.func.max(cls.updated_at)).scalar_subquery(),
+            )).one())
+        except Exception as e:
+            return f"error:{str(e)}"
+
     @classmethod
     def get_request_for_display(cls, request_id, pin_id):
         """Entity for: As PIN, I want to update my ACTIVE requests - Get request data for display"""
@@ -215,6 +328,10 @@ class Request(db.Model):
       
 class PINRequestView(db.Model):
     __tablename__ = 'pin_request_views'
+    __table_args__ = (
+        # track_view: has this CSR already viewed this request?
+        db.Index('ix_pin_request_views_request_csr', 'request_id', 'csr_company_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     request_id = db.Column(db.Integer, db.ForeignKey('requests.id'), nullable=False)
@@ -246,6 +363,7 @@ class PINRequestView(db.Model):
                 request = Request.query.get(request_id)
                 if request:
                     request.view_count += 1
+                    RequestActivity.record([(request_id, view.viewed_at, "views", 1)])
                 
                 db.session.commit()
                 return "success"
@@ -254,6 +372,55 @@ class PINRequestView(db.Model):
             db.session.rollback()
             return f"error:{str(e)}"
 
+    @classmethod
+    def record_views(cls, events):
+        """
+        Batch version of track_view for queued events [(request_id, csr_company_id, viewed_at)].
+        First views are inserted and view_count bumped in one transaction.
+        Returns the number of new views recorded, or an error string.
+        """
+        try:
+            # Keep the earliest event per (request, CSR) pair
+            first_seen = {}
+            for request_id, csr_company_id, viewed_at in events:
+                key = (request_id, csr_company_id)
+                if key not in first_seen or viewed_at < first_seen[key]:
+                    first_seen[key] = viewed_at
+            if not first_seen:
+                return 0
+
+            already = set(
+                db.session.query(cls.request_id, cls.csr_company_id)
+                .filter(db.tuple_(cls.request_id, cls.csr_company_id).in_(list(first_seen)))
+                .all()
+            )
+            new_views = [
+                {"request_id": rid, "csr_company_id": csr, "viewed_at": first_seen[(rid, csr)]}
+                for rid, csr in first_seen if (rid, csr) not in already
+            ]
+            if not new_views:
+                return 0
+
+            per_request = {}
+            for view in new_views:
+                per_request[view["request_id"]] = per_request.get(view["request_id"], 0) + 1
+
+            db.session.execute(db.insert(cls), new_views)
+            # Core table: one executemany UPDATE, counters incremented in SQL
+            requests = Request.__table__
+            db.session.execute(
+                requests.update()
+                .where(requests.c.id == db.bindparam("rid"))
+                .values(view_count=db.func.coalesce(requests.c.view_count, 0) + db.bindparam("n")),
+                [{"rid": rid, "n": n} for rid, n in per_request.items()],
+            )
+            RequestActivity.record([(v["request_id"], v["viewed_at"], "views", 1) for v in new_views])
+            db.session.commit()
+            return len(new_views)
+        except Exception as e:
+            db.session.rollback()
+            return f"error:{str(e)}"
+
     @classmethod
     def get_view_count(cls, request_id, pin_id):
         """Get the view count for a specific request"""
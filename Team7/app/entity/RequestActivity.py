@@ -0,0 +1,189 @@
+# 📦 File: app/entity/RequestActivity.py
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .. import db
+from ..db_routing import read_only
+
+# One point of a series; periods without activity are filled with zeros
+ActivityPoint = namedtuple("ActivityPoint", "bucket views shortlists unshortlists")
+
+COUNTERS = ("views", "shortlists", "unshortlists")
+
+
+class RequestActivityHourly(db.Model):
+    """Views / shortlist adds / removals per request per UTC hour (bucket = start of the hour)."""
+    __tablename__ = 'request_activity_hourly'
+    # Clustered on (request_id, bucket): a request's series is one contiguous range read
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    request_id = db.Column(db.Integer, db.ForeignKey('requests.id'), primary_key=True)
+    bucket = db.Column(db.DateTime, primary_key=True)
+    views = db.Column(db.Integer, nullable=False, default=0)
+    shortlists = db.Column(db.Integer, nullable=False, default=0)
+    unshortlists = db.Column(db.Integer, nullable=False, default=0)
+
+
+class RequestActivityDaily(db.Model):
+    """Same counters per request per UTC day."""
+    __tablename__ = 'request_activity_daily'
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    request_id = db.Column(db.Integer, db.ForeignKey('requests.id'), primary_key=True)
+    bucket = db.Column(db.Date, primary_key=True)
+    views = db.Column(db.Integer, nullable=False, default=0)
+    shortlists = db.Column(db.Integer, nullable=False, default=0)
+    unshortlists = db.Column(db.Integer, nullable=False, default=0)
+
+
+class RequestActivity:
+    """
+    Hourly and daily rollups of request activity, so analytics read a few
+    pre-aggregated rows instead of scanning pin_request_views.
+
+    Maintained incrementally: whoever records a view or a shortlist change
+    calls `record` inside the same transaction, which upserts
+    (counter += n) into both tables. `rebuild` recomputes both from
+    pin_request_views / csr_shortlist after bulk loads that bypass `record`.
+
+    Hourly rows are only read by the 24h range, so they are kept for
+    HOURLY_RETENTION and then deleted: by the first `record` of each hour
+    (per process) and by `rebuild`. Daily rows are kept.
+    """
+
+    # ?range= values of the analytics page: (granularity, periods)
+    RANGES = {"24h": ("hour", 24), "7d": ("day", 7), "30d": ("day", 30), "90d": ("day", 90)}
+    DEFAULT_RANGE = "7d"
+    HOURLY_RETENTION = timedelta(hours=48)  # twice the longest hourly range
+
+    _MODELS = {"hour": RequestActivityHourly, "day": RequestActivityDaily}
+    _pruned_hour = None  # hour bucket of this process's last prune_hourly from `record`
+
+    @staticmethod
+    def _bucket(at: datetime, granularity: str):
+        return at.replace(minute=0, second=0, microsecond=0) if granularity == "hour" else at.date()
+
+    @classmethod
+    def _upsert(cls, model):
+        table = model.__table__
+        insert = sqlite_insert(table)
+        return insert.on_conflict_do_update(
+            index_elements=['request_id', 'bucket'],
+            set_={c: table.c[c] + insert.excluded[c] for c in COUNTERS},
+        )
+
+    @classmethod
+    def record(cls, events):
+        """
+        Add events [(request_id, at, counter, n)] to both rollups, counter
+        being one of COUNTERS. Does not commit: runs in the caller's
+        transaction, so the rollups commit or roll back with the write they
+        describe.
+        """
+        for granularity, model in cls._MODELS.items():
+            totals = {}
+            for request_id, at, counter, n in events:
+                key = (request_id, cls._bucket(at, granularity))
+                row = totals.get(key)
+                if row is None:
+                    row = totals[key] = {"request_id": key[0], "bucket": key[1], **dict.fromkeys(COUNTERS, 0)}
+                row[counter] += n
+            if totals:
+                db.session.execute(cls._upsert(model), list(totals.values()))
+
+        hour = cls._bucket(datetime.utcnow(), "hour")
+        if cls._pruned_hour != hour:
+            cls._pruned_hour = hour
+            cls.prune_hourly()
+
+    @classmethod
+    def prune_hourly(cls, now=None) -> int:
+        """
+        Delete hourly rows older than HOURLY_RETENTION. Does not commit.
+        Returns the number of rows deleted.
+        """
+        cutoff = cls._bucket(now or datetime.utcnow(), "hour") - cls.HOURLY_RETENTION
+        return db.session.execute(
+            db.delete(RequestActivityHourly).where(RequestActivityHourly.bucket < cutoff)
+        ).rowcount
+
+    @classmethod
+    @read_only
+    def series(cls, request_id, pin_id, range_key=DEFAULT_RANGE, now=None):
+        """
+        Entity for: As PIN, I want to see views and shortlists of my request over time.
+        One indexed range read on the rollup for `range_key`, restricted to
+        requests `pin_id` owns. Returns a list of ActivityPoint, oldest first,
+        one per hour/day (UTC) including empty ones.
+        """
+        try:
+            granularity, periods = cls.RANGES[range_key]
+            model = cls._MODELS[granularity]
+            step = timedelta(hours=1) if granularity == "hour" else timedelta(days=1)
+            last = cls._bucket(now or datetime.utcnow(), granularity)
+            first = last - step * (periods - 1)
+
+            from .Request import Request
+            rows = (db.session.query(model.bucket, model.views, model.shortlists, model.unshortlists)
+                    .join(Request, db.and_(Request.id == model.request_id, Request.pin_id == pin_id))
+                    .filter(model.request_id == request_id, model.bucket >= first)
+                    .all())
+            found = {row.bucket: row for row in rows}
+            points = []
+            for i in range(periods):
+                bucket = first + step * i
+                row = found.get(bucket)
+                points.append(ActivityPoint(bucket, *(row[1:] if row else (0, 0, 0))))
+            return points
+        except Exception as e:
+            return f"error:{str(e)}"
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """
+        Recompute both rollups from pin_request_views and csr_shortlist (for
+        bulk loads and first deploys). Shortlist removals are not stored
+        anywhere else, so their history restarts at zero. Hourly rows are
+        only rebuilt for the last HOURLY_RETENTION.
+        Returns the number of daily rows written.
+        """
+        formats = {"hour": "strftime('%Y-%m-%d %H:00:00.000000', {col})", "day": "date({col})"}
+        since = (cls._bucket(datetime.utcnow(), "hour") - cls.HOURLY_RETENTION).strftime("%Y-%m-%d %H:%M:%S")
+        written = 0
+        for granularity, model in cls._MODELS.items():
+            table = model.__tablename__
+            view_bucket = formats[granularity].format(col="viewed_at")
+            shortlist_bucket = formats[granularity].format(col="added_at")
+            recent = {"hour": " AND {col} >= :since", "day": ""}[granularity]
+            db.session.execute(db.text(f"DELETE FROM {table}"))
+            result = db.session.execute(db.text(
+                f"INSERT INTO {table} (request_id, bucket, views, shortlists, unshortlists) "
+                f"SELECT request_id, bucket, sum(views), sum(shortlists), 0 FROM ("
+                f" SELECT request_id, {view_bucket} AS bucket, 1 AS views, 0 AS shortlists"
+                f" FROM pin_request_views WHERE viewed_at IS NOT NULL{recent.format(col='viewed_at')}"
+                f" UNION ALL"
+                f" SELECT request_id, {shortlist_bucket}, 0, 1"
+                f" FROM csr_shortlist WHERE added_at IS NOT NULL{recent.format(col='added_at')}"
+                f") GROUP BY request_id, bucket"
+            ), {"since": since} if recent else {})
+            written = result.rowcount
+        db.session.commit()
+        return written
+
+    @classmethod
+    def ensure(cls) -> str:
+        """
+        Backfill empty rollups on a database that already has views or
+        shortlists (first start after upgrading). Returns 'rebuilt' or 'ok'.
+        """
+        has_rollups = db.session.query(RequestActivityDaily.request_id).first() is not None
+        has_activity = db.session.execute(db.text(
+            "SELECT EXISTS (SELECT 1 FROM pin_request_views) OR EXISTS (SELECT 1 FROM csr_shortlist)"
+        )).scalar()
+        if has_rollups or not has_activity:
+            return "ok"
+        rows = cls.rebuild()
+        print(f"✅ Backfilled request activity rollups ({rows} daily rows)")
+        return "rebuilt"
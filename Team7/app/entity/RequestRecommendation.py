@@ -0,0 +1,298 @@
+# 📦 File: app/entity/RequestRecommendation.py
+import heapq
+import threading
+import time
+from datetime import datetime
+
+try:
+    import numpy  # optional: scores the whole open set in a few array operations
+except ImportError:
+    numpy = None
+
+from .. import db
+from ..cache import TTLCache
+from ..db_routing import read_only
+from .KeysetPagination import KeysetPage, DEFAULT_PER_PAGE, encode_cursor, decode_cursor
+
+# Same statuses as CSRService.search_available_requests
+OPEN_STATUSES = ("pending", "approved")
+
+# Points for a full match per feature; a CSR's affinity for a value is the
+# share (0..1) of their history with it, so a request scores at most sum(WEIGHTS)
+WEIGHTS = {"category": 3.0, "urgency": 1.0, "area": 2.0}
+FEATURES = tuple(WEIGHTS)
+
+# A completed service says more about a CSR than a request they only shortlisted
+COMPLETED_WEIGHT = 2.0
+SHORTLISTED_WEIGHT = 1.0
+
+
+def location_area(location):
+    """'Block 12, #03-45' -> 'block 12': the part before the first comma, normalized."""
+    if not location:
+        return None
+    return " ".join(location.split(",", 1)[0].lower().split()) or None
+
+
+class _OpenSet:
+    """
+    Open requests newest first, each feature stored as an integer code per
+    request (vocab[feature][value] -> code; code len(vocab) = no value).
+    Immutable once built, so concurrent requests share it without locks.
+    """
+
+    def __init__(self, rows):
+        self.built_at = datetime.utcnow()
+        self.built_monotonic = time.monotonic()
+        self.ids = [row[0] for row in rows]
+        self.vocab = {feature: {} for feature in FEATURES}
+        codes = {feature: [] for feature in FEATURES}
+        for _id, category, urgency, location in rows:
+            for feature, value in zip(FEATURES, (category, urgency, location_area(location))):
+                if value is None:
+                    codes[feature].append(-1)  # remapped to the "no value" slot below
+                else:
+                    codes[feature].append(self.vocab[feature].setdefault(value, len(self.vocab[feature])))
+        self.codes = {}
+        for feature, values in codes.items():
+            missing = len(self.vocab[feature])
+            values = [missing if code < 0 else code for code in values]
+            self.codes[feature] = numpy.array(values, dtype=numpy.int32) if numpy is not None else values
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class RequestRecommendation:
+    """
+    "Recommended" order of the CSR search page: open requests ranked by how
+    well their category, urgency and area match the CSR's shortlist and
+    completed-service history.
+
+    Both inputs are computed once and reused across requests:
+    - The open set (ids + integer feature codes) is built by the first
+      request that needs it. Once it is older than
+      RECOMMENDATION_SNAPSHOT_TTL seconds, the next request starts a
+      rebuild on a background thread and keeps serving the old snapshot
+      until the new one replaces it, so requests never wait for a rebuild.
+    - Each CSR's affinity (value -> share of their history) is cached for
+      RECOMMENDATION_AFFINITY_TTL seconds and reloaded by the first request
+      after it expires (one small GROUP BY; concurrent requests for the
+      same CSR wait for that one load).
+    Ranking is then one batch over the open set: with NumPy a table lookup
+    per feature and a stable argsort, otherwise the same in pure Python
+    (slower, same order). Equal scores keep newest first, so a CSR with no
+    history sees the usual newest-first list.
+    """
+
+    _app = None
+    _snapshot = None
+    _snapshot_ttl = 60.0
+    _building = threading.Lock()  # held while the open set is (re)built
+    _affinities = TTLCache(max_size=5_000, ttl=900, name="csr_affinities")
+    last_rank_ms = None  # duration of the most recent ranking, for stats()
+    last_build_ms = None  # duration of the most recent open-set build
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("RECOMMENDATION_SNAPSHOT_TTL", 60)
+        app.config.setdefault("RECOMMENDATION_AFFINITY_TTL", 900)
+        app.config.setdefault("RECOMMENDATION_AFFINITY_CACHE_SIZE", 5_000)
+        cls._app = app
+        cls._snapshot = None
+        cls._snapshot_ttl = float(app.config["RECOMMENDATION_SNAPSHOT_TTL"])
+        cls._affinities = TTLCache(
+            max_size=int(app.config["RECOMMENDATION_AFFINITY_CACHE_SIZE"]),
+            ttl=float(app.config["RECOMMENDATION_AFFINITY_TTL"]),
+            name="csr_affinities",
+        )
+
+    # -------------------------------
+    # Precomputed inputs
+    # -------------------------------
+    @classmethod
+    @read_only
+    def _load_open_set(cls):
+        from .Request import Request
+        rows = (db.session.query(Request.id, Request.category, Request.urgency, Request.location)
+                .filter(Request.status.in_(OPEN_STATUSES))
+                .order_by(Request.created_at.desc(), Request.id.desc())
+                .all())
+        return _OpenSet(rows)
+
+    @classmethod
+    @read_only
+    def _load_affinity(cls, csr_company_id):
+        """{"category": {value: share}, "urgency": {...}, "area": {...}, "computed_at": datetime}"""
+        from .Request import Request
+        from .CSREntities import CSRService
+        completed = Request.status == "completed"
+        rows = (db.session.query(Request.category, Request.urgency, Request.location, completed, db.func.count())
+                .join(CSRService, CSRService.request_id == Request.id)
+                .filter(CSRService.csr_company_id == csr_company_id)
+                .group_by(Request.category, Request.urgency, Request.location, completed)
+                .all())
+        totals = {feature: {} for feature in FEATURES}
+        history = 0.0
+        for category, urgency, location, is_completed, n in rows:
+            weight = n * (COMPLETED_WEIGHT if is_completed else SHORTLISTED_WEIGHT)
+            history += weight
+            for feature, value in zip(FEATURES, (category, urgency, location_area(location))):
+                if value is not None:
+                    totals[feature][value] = totals[feature].get(value, 0.0) + weight
+        affinity = {feature: {value: weight / history for value, weight in values.items()}
+                    for feature, values in totals.items()}
+        affinity["computed_at"] = datetime.utcnow()
+        return affinity
+
+    @classmethod
+    def _build_open_set(cls):
+        started = time.perf_counter()
+        cls._snapshot = cls._load_open_set()
+        cls.last_build_ms = (time.perf_counter() - started) * 1000
+
+    @classmethod
+    def _refresh_in_background(cls):
+        """Thread body; the caller acquired cls._building for it."""
+        try:
+            with cls._app.app_context():
+                cls._build_open_set()
+        except Exception as e:
+            print(f"[RequestRecommendation] open set refresh failed: {e}")
+        finally:
+            cls._building.release()
+
+    @classmethod
+    def open_set(cls):
+        snapshot = cls._snapshot
+        if snapshot is None:
+            with cls._building:  # first use: one request builds it, the others wait
+                if cls._snapshot is None:
+                    cls._build_open_set()
+            return cls._snapshot
+        stale = time.monotonic() - snapshot.built_monotonic > cls._snapshot_ttl
+        if stale and cls._app is not None and cls._building.acquire(blocking=False):
+            threading.Thread(target=cls._refresh_in_background, name="recommendation-refresh",
+                             daemon=True).start()
+        return snapshot
+
+    @classmethod
+    def affinity(cls, csr_company_id):
+        return cls._affinities.get_or_set(csr_company_id, lambda: cls._load_affinity(csr_company_id))
+
+    @classmethod
+    def version(cls, csr_company_id):
+        """
+        Conditional GET validator part: changes whenever the ranking inputs
+        are refreshed. Returns (open set built_at, affinity computed_at).
+        """
+        try:
+            return cls.open_set().built_at, cls.affinity(csr_company_id)["computed_at"]
+        except Exception as e:
+            db.session.rollback()
+            return f"error:{str(e)}"
+
+    # -------------------------------
+    # Ranking
+    # -------------------------------
+    @staticmethod
+    def _score_tables(open_set, affinity):
+        """Per feature, points by code (the extra last slot, "no value", scores 0)."""
+        tables = {}
+        for feature, weight in WEIGHTS.items():
+            vocab = open_set.vocab[feature]
+            table = [0.0] * (len(vocab) + 1)
+            for value, share in affinity[feature].items():
+                code = vocab.get(value)
+                if code is not None:
+                    table[code] = weight * share
+            tables[feature] = table
+        return tables
+
+    @classmethod
+    def rank(cls, open_set, affinity, limit, category=None, urgency=None):
+        """
+        Positions (indexes into open_set.ids) of the `limit` best requests,
+        best first; equal scores keep the snapshot's newest-first order.
+        """
+        wanted = {"category": category, "urgency": urgency}
+        filters = {}
+        for feature, value in wanted.items():
+            if value:
+                code = open_set.vocab[feature].get(value)
+                if code is None:
+                    return []  # nothing open with that category / urgency
+                filters[feature] = code
+        tables = cls._score_tables(open_set, affinity)
+
+        if numpy is not None:
+            codes = open_set.codes
+            candidates = None  # None = every open request, without an index copy
+            if filters:
+                mask = numpy.ones(len(open_set), dtype=bool)
+                for feature, code in filters.items():
+                    mask &= codes[feature] == code
+                candidates = numpy.flatnonzero(mask)
+                codes = {feature: column[candidates] for feature, column in codes.items()}
+            scores = sum(numpy.asarray(table)[codes[feature]] for feature, table in tables.items())
+            order = numpy.argsort(-scores, kind="stable")[:limit]
+            return (order if candidates is None else candidates[order]).tolist()
+
+        codes = open_set.codes
+        by_category, by_urgency, by_area = tables["category"], tables["urgency"], tables["area"]
+        scores = [by_category[c] + by_urgency[u] + by_area[a]
+                  for c, u, a in zip(codes["category"], codes["urgency"], codes["area"])]
+        candidates = range(len(open_set))
+        for feature, code in filters.items():
+            column = codes[feature]
+            candidates = [i for i in candidates if column[i] == code]
+        # nlargest == sorted(..., reverse=True)[:limit]: stable, so ties stay newest first
+        return heapq.nlargest(limit, candidates, key=scores.__getitem__)
+
+    #Entity for: As CSR, I want to see the requests I am most likely to take first#
+    @classmethod
+    @read_only
+    def recommended_page(cls, csr_company_id, category=None, urgency=None, cursor=None,
+                         per_page=DEFAULT_PER_PAGE, as_rows=False):
+        """
+        One page of the ranking. Cursors hold the offset into the ranking;
+        requests that closed since the snapshot was taken are left out of the
+        page rather than shown as open.
+        """
+        try:
+            from .Request import Request
+            decoded = decode_cursor(cursor, 1)
+            offset = decoded[1][0] if decoded and isinstance(decoded[1][0], int) and decoded[1][0] > 0 else 0
+
+            open_set = cls.open_set()
+            started = time.perf_counter()
+            positions = cls.rank(open_set, cls.affinity(csr_company_id), offset + per_page + 1, category, urgency)
+            cls.last_rank_ms = (time.perf_counter() - started) * 1000
+
+            page_ids = [open_set.ids[p] for p in positions[offset:offset + per_page]]
+            query = Request.query.filter(Request.id.in_(page_ids), Request.status.in_(OPEN_STATUSES))
+            if as_rows:
+                query = Request.projected(query)
+            found = {item.id: item for item in query} if page_ids else {}
+            return KeysetPage(
+                [found[i] for i in page_ids if i in found],
+                next_cursor=encode_cursor([offset + per_page]) if len(positions) > offset + per_page else None,
+                prev_cursor=encode_cursor([max(0, offset - per_page)], "prev") if offset else None,
+                per_page=per_page,
+            )
+        except Exception as e:
+            return f"error:{str(e)}"
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Which scorer is active, open-set size, last ranking time and cache counters."""
+        snapshot = cls._snapshot
+        return {
+            "scorer": "numpy" if numpy is not None else "python",
+            "open_requests": len(snapshot) if snapshot is not None else None,
+            "open_set_built_at": snapshot.built_at.isoformat() if snapshot is not None else None,
+            "open_set_refreshing": cls._building.locked(),
+            "last_build_ms": round(cls.last_build_ms, 3) if cls.last_build_ms is not None else None,
+            "last_rank_ms": round(cls.last_rank_ms, 3) if cls.last_rank_ms is not None else None,
+            "affinities": cls._affinities.stats(),
+        }
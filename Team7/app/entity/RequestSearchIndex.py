@@ -0,0 +1,202 @@
+# 📦 File: app/entity/RequestSearchIndex.py
+import re
+from contextlib import contextmanager
+
+from .. import db
+from .Request import Request
+from .KeysetPagination import keyset_paginate, DEFAULT_PER_PAGE
+
+
+class RequestSearchIndex:
+    """
+    SQLite FTS5 index over Request.title / description / category.
+
+    The virtual table uses `requests` as its external content table and is
+    kept in sync by triggers, so every insert/update/delete of a Request
+    (ORM or raw SQL) updates the index in the same transaction.
+    """
+
+    TABLE = "requests_fts"
+    COLUMNS = ("title", "description", "category")
+    # bm25 column weights, same order as COLUMNS: a title hit counts most
+    WEIGHTS = (10.0, 2.0, 4.0)
+
+    # Markers wrapped around matched terms in highlight()/snippet() output.
+    # Control characters never appear in user text, so the boundary layer can
+    # HTML-escape the text first and then swap these for <mark> tags.
+    MARK_START = "\x02"
+    MARK_END = "\x03"
+
+    _available = None
+
+    # -------------------------------
+    # Schema
+    # -------------------------------
+    @classmethod
+    def _ddl(cls):
+        cols = ", ".join(cls.COLUMNS)
+        new_vals = ", ".join(f"new.{c}" for c in cls.COLUMNS)
+        old_vals = ", ".join(f"old.{c}" for c in cls.COLUMNS)
+        t = cls.TABLE
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {t} USING fts5("
+            f"{cols}, content='requests', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+
+            f"CREATE TRIGGER IF NOT EXISTS {t}_ai AFTER INSERT ON requests BEGIN "
+            f"INSERT INTO {t}(rowid, {cols}) VALUES (new.id, {new_vals}); END",
+
+            f"CREATE TRIGGER IF NOT EXISTS {t}_ad AFTER DELETE ON requests BEGIN "
+            f"INSERT INTO {t}({t}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); END",
+
+            # Only text columns are indexed, so counter/status updates skip the index
+            f"CREATE TRIGGER IF NOT EXISTS {t}_au AFTER UPDATE OF {cols} ON requests BEGIN "
+            f"INSERT INTO {t}({t}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); "
+            f"INSERT INTO {t}(rowid, {cols}) VALUES (new.id, {new_vals}); END",
+        ]
+
+    @classmethod
+    def ensure(cls) -> str:
+        """
+        Create the FTS table and sync triggers if they are missing.
+        A newly created index is populated from existing requests.
+        Returns one of: 'created', 'exists', 'unsupported'.
+        """
+        try:
+            if cls._table_exists():
+                cls._available = True
+                return "exists"
+
+            for stmt in cls._ddl():
+                db.session.execute(db.text(stmt))
+            db.session.commit()
+            cls.rebuild()
+            cls._available = True
+            print(f"✅ Created full-text index {cls.TABLE}")
+            return "created"
+        except Exception as e:
+            # SQLite built without FTS5, or a non-SQLite database
+            db.session.rollback()
+            cls._available = False
+            print(f"⚠️ Full-text search unavailable, falling back to LIKE: {e}")
+            return "unsupported"
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Re-index every request from the content table; returns the row count."""
+        db.session.execute(db.text(f"INSERT INTO {cls.TABLE}({cls.TABLE}) VALUES ('rebuild')"))
+        db.session.commit()
+        return db.session.query(db.func.count(Request.id)).scalar()
+
+    @classmethod
+    @contextmanager
+    def bulk_load(cls):
+        """
+        For bulk inserts into `requests`: drop the per-row insert trigger while
+        the block runs, then restore it and rebuild the index in one pass.
+        """
+        if not cls.available():
+            yield
+            return
+        db.session.execute(db.text(f"DROP TRIGGER IF EXISTS {cls.TABLE}_ai"))
+        db.session.commit()
+        try:
+            yield
+        finally:
+            for stmt in cls._ddl():
+                db.session.execute(db.text(stmt))
+            db.session.commit()
+            cls.rebuild()
+
+    @classmethod
+    def _table_exists(cls) -> bool:
+        return db.session.execute(
+            db.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": cls.TABLE},
+        ).first() is not None
+
+    @classmethod
+    def available(cls) -> bool:
+        if cls._available is None:
+            try:
+                cls._available = cls._table_exists()
+            except Exception:
+                db.session.rollback()
+                cls._available = False
+        return cls._available
+
+    # -------------------------------
+    # Query building
+    # -------------------------------
+    @classmethod
+    def match_expression(cls, term: str, columns=None) -> str | None:
+        """
+        Turn free text into a safe FTS5 query: every word becomes a quoted
+        prefix term and all of them must match. Returns None if the text has
+        no searchable words.
+        """
+        words = re.findall(r"\w+", term or "")
+        if not words:
+            return None
+        expr = " ".join(f'"{w}"*' for w in words)
+        if columns:
+            expr = "{" + " ".join(columns) + "} : (" + expr + ")"
+        return expr
+
+    @classmethod
+    def apply(cls, query, term: str, columns=None):
+        """
+        Restrict a Request query to full-text matches of `term` and add the
+        bm25 rank plus highlighted title and description snippet columns.
+        Callers order by `rank_expression()` (lower is better).
+        Returns None when the index can't be used so callers fall back to LIKE.
+        Unpack the results with `attach_snippets`.
+        """
+        if not cls.available():
+            return None
+        expr = cls.match_expression(term, columns)
+        if expr is None:
+            return None
+
+        fts = db.table(cls.TABLE, db.column("rowid"))
+        fts_ref = db.literal_column(cls.TABLE)
+        return (
+            query.join(fts, fts.c.rowid == Request.id)
+            .filter(fts_ref.op("MATCH")(expr))
+            .add_columns(
+                db.func.highlight(fts_ref, 0, cls.MARK_START, cls.MARK_END).label("search_title"),
+                db.func.snippet(fts_ref, 1, cls.MARK_START, cls.MARK_END, "…", 24).label("search_snippet"),
+                cls.rank_expression().label("search_rank"),
+            )
+        )
+
+    @classmethod
+    def rank_expression(cls):
+        """bm25 score of the current match; lower is better."""
+        return db.func.bm25(db.literal_column(cls.TABLE), *cls.WEIGHTS)
+
+    @classmethod
+    def ranked_page(cls, ranked_query, cursor=None, per_page=DEFAULT_PER_PAGE, as_rows=False):
+        """
+        One keyset page of an `apply`-ed query, best match first. With
+        as_rows (a `Request.projected` query) the flat rows are returned as is.
+        """
+        return keyset_paginate(
+            ranked_query,
+            [(cls.rank_expression(), False), (Request.id, True)],
+            key=lambda r: (r.search_rank, r.id),
+            cursor=cursor,
+            per_page=per_page,
+            transform=None if as_rows else cls.attach_snippets,
+        )
+
+    @staticmethod
+    def attach_snippets(rows):
+        """Convert (Request, search_title, search_snippet, search_rank) rows into Requests."""
+        results = []
+        for request, search_title, search_snippet, search_rank in rows:
+            request.search_title = search_title
+            request.search_snippet = search_snippet
+            request.search_rank = search_rank
+            results.append(request)
+        return results
@@ -0,0 +1,144 @@
+# 📦 File: app/entity/RequestViewQueue.py
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime
+
+from .Request import PINRequestView
+
+
+class RequestViewQueue:
+    """
+    In-process queue for CSR request-view events.
+
+    Detail pages enqueue (request_id, csr_company_id) and return immediately;
+    a background worker writes them with PINRequestView.record_views, one
+    transaction per VIEW_TRACKING_BATCH_SIZE events or VIEW_TRACKING_FLUSH_MS
+    milliseconds, whichever comes first. Set VIEW_TRACKING_MODE = "sync" to
+    write each view inline as before.
+    """
+
+    _STOP = object()
+
+    _app = None
+    _queue = None
+    _worker = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("VIEW_TRACKING_MODE", "async")
+        app.config.setdefault("VIEW_TRACKING_BATCH_SIZE", 100)
+        app.config.setdefault("VIEW_TRACKING_FLUSH_MS", 500)
+        cls._app = app
+
+    # -------------------------------
+    # Producer side
+    # -------------------------------
+    @classmethod
+    def track(cls, request_id, csr_company_id):
+        """Returns 'queued' in async mode, otherwise whatever track_view returns."""
+        if cls._app is None or cls._app.config["VIEW_TRACKING_MODE"] == "sync":
+            return PINRequestView.track_view(request_id, csr_company_id)
+
+        cls._start_worker()
+        cls._queue.put((request_id, csr_company_id, datetime.utcnow()))
+        return "queued"
+
+    @classmethod
+    def flush(cls, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far has been written."""
+        if cls._worker is None or not cls._worker.is_alive():
+            return True
+        done = threading.Event()
+        cls._queue.put(done)
+        return done.wait(timeout)
+
+    @classmethod
+    def shutdown(cls, timeout: float = 5.0):
+        """Write remaining events and stop the worker (registered with atexit)."""
+        with cls._lock:
+            worker = cls._worker
+            if worker is None:
+                return
+            cls._queue.put(cls._STOP)
+            cls._worker = None
+        worker.join(timeout)
+
+    # -------------------------------
+    # Worker side
+    # -------------------------------
+    @classmethod
+    def _start_worker(cls):
+        if cls._worker is not None:
+            return
+        with cls._lock:
+            if cls._worker is not None:
+                return
+            if cls._queue is None:
+                cls._queue = queue.Queue()
+            cls._worker = threading.Thread(
+                target=cls._run, args=(cls._app, cls._queue),
+                name="request-view-writer", daemon=True,
+            )
+            cls._worker.start()
+            atexit.register(cls.shutdown)
+
+    @classmethod
+    def _run(cls, app, q):
+        batch_size = int(app.config["VIEW_TRACKING_BATCH_SIZE"])
+        flush_after = int(app.config["VIEW_TRACKING_FLUSH_MS"]) / 1000.0
+
+        while True:
+            item = q.get()
+            batch, waiters, stop = [], [], False
+            deadline = time.monotonic() + flush_after
+
+            # Collect until the batch is full, the window closes, or someone asks to flush
+            while True:
+                if item is cls._STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+
+                if stop or waiters or len(batch) >= batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if stop or waiters:
+                # Drain whatever is already queued so the flush covers it
+                while True:
+                    try:
+                        extra = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if extra is cls._STOP:
+                        stop = True
+                    elif isinstance(extra, threading.Event):
+                        waiters.append(extra)
+                    else:
+                        batch.append(extra)
+
+            cls._write(app, batch, batch_size)
+            for event in waiters:
+                event.set()
+            if stop:
+                return
+
+    @staticmethod
+    def _write(app, batch, batch_size):
+        for start in range(0, len(batch), batch_size):
+            chunk = batch[start:start + batch_size]
+            with app.app_context():
+                result = PINRequestView.record_views(chunk)
+            if isinstance(result, str):
+                print(f"[RequestViewQueue] dropped {len(chunk)} view events: {result}")
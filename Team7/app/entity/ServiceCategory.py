@@ -1,8 +1,16 @@
 # 📦 File: app/entity/ServiceCategory.py
+from collections import namedtuple
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import or_
 from sqlalchemy.orm import joinedload
 from .. import db
+from ..db_routing import read_only
+from ..cache import TTLCache
+from .BulkSuspend import set_suspended
+from .DashboardSummary import DashboardSummary, PLATFORM
+
+# Detached, read-only copy of a category row; safe to share across requests
+CategoryRow = namedtuple("CategoryRow", ["id", "name", "description", "is_suspended"])
 
 
 class ServiceCategory(db.Model):
@@ -13,6 +21,10 @@ class ServiceCategory(db.Model):
     description = db.Column(db.Text)
     is_suspended = db.Column(db.Boolean, default=False, nullable=False)
 
+    # Active categories change a few times a month but are read on every
+    # request form and CSR search page; writes below invalidate on commit.
+    _active_cache = TTLCache(max_size=8, ttl=300, name="active_categories")
+
     def __repr__(self):
         return f"<ServiceCategory {self.name}>"
 
@@ -42,6 +54,8 @@ class ServiceCategory(db.Model):
 
             db.session.add(row)
             db.session.commit()
+            cls._active_cache.invalidate()
+            DashboardSummary.invalidate(PLATFORM)
             return "success"
 
         except IntegrityError:
@@ -56,6 +70,7 @@ class ServiceCategory(db.Model):
     # Read / List
     # -------------------------------
     @classmethod
+    @read_only
     def ListServiceCategory(cls, page: int | None = None, per_page: int = 20):
         try:
             q = cls.query.order_by(cls.id.asc())
@@ -81,6 +96,37 @@ class ServiceCategory(db.Model):
             db.session.rollback()
             return {"ok": False, "data": [], "errors": [f"Database error: {e}"]}
 
+    @classmethod
+    def ListActiveServiceCategory(cls):
+        """
+        Non-suspended categories ordered by ID ASC, served from an in-process
+        cache. Rows are CategoryRow tuples (id, name, description, is_suspended).
+        """
+        try:
+            rows = cls._active_cache.get_or_set("active", cls._load_active)
+            return {"ok": True, "data": list(rows), "errors": []}
+        except Exception as e:
+            db.session.rollback()
+            return {"ok": False, "data": [], "errors": [f"Database error: {e}"]}
+
+    @classmethod
+    @read_only
+    def _load_active(cls):
+        q = (db.session.query(cls.id, cls.name, cls.description, cls.is_suspended)
+             .filter(cls.is_suspended.is_(False))
+             .order_by(cls.id.asc()))
+        return tuple(CategoryRow(*r) for r in q.all())
+
+    @classmethod
+    def active_cache_stats(cls) -> dict:
+        return cls._active_cache.stats()
+
+    @classmethod
+    def invalidate_active_cache(cls):
+        """For writes that bypass the methods below (bulk loads, raw SQL)."""
+        cls._active_cache.invalidate()
+        DashboardSummary.invalidate(PLATFORM)
+
     # -------------------------------
     # Update
     # -------------------------------
@@ -112,6 +158,8 @@ class ServiceCategory(db.Model):
             row.is_suspended = bool(is_suspended)
 
             db.session.commit()
+            cls._active_cache.invalidate()
+            DashboardSummary.invalidate(PLATFORM)
             return "success"
 
         except Exception as e:
@@ -128,6 +176,7 @@ class ServiceCategory(db.Model):
     # Search
     # -------------------------------
     @classmethod
+    @read_only
     def SearchServiceCategory(cls, term: str, page: int | None = 1, per_page: int = 20):
         like = f"%{(term or '').strip()}%"
         q = cls.query.filter(or_(cls.name.ilike(like), cls.description.ilike(like))).order_by(cls.id.asc())
@@ -150,8 +199,22 @@ class ServiceCategory(db.Model):
                 return "noop"
             row.is_suspended = new_val
             db.session.commit()
+            cls._active_cache.invalidate()
+            DashboardSummary.invalidate(PLATFORM)
             return "success"
         except Exception as e:
             db.session.rollback()
             print(f"[ServiceCategory] set_suspended error id={category_id}: {e}")
-            return "error"
\ No newline at end of file
+            return "error"
+
+    @classmethod
+    def BulkSuspendServiceCategories(cls, category_ids, is_suspended: int | bool) -> dict:
+        """
+        Set the suspension flag on many categories with one UPDATE.
+        Returns {"ok", "data": {"requested", "changed", "noop", "not_found"}, "errors"}.
+        """
+        res = set_suspended(cls, is_suspended, ids=category_ids)
+        if res["data"]["changed"]:
+            cls._active_cache.invalidate()
+            DashboardSummary.invalidate(PLATFORM)
+        return res
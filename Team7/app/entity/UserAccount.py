@@ -4,6 +4,7 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy import or_
 from sqlalchemy.orm import joinedload
 from ..entity.UserAdmin import UserAdmin
+from ..entity.PasswordHasher import PasswordHasher
 
 from .. import db
 
@@ -20,7 +21,21 @@ class UserAccount:
             return {"ok": False, "data": None, "errors": ["Invalid email."]}
         if user.is_suspended:
             return {"ok": False, "data": None, "errors": ["Account suspended."]}
-        if user.password != password:  # later: check_password_hash
+
+        try:
+            ok, needs_rehash = PasswordHasher.verify(user.password, password)
+        except PasswordHasher.Busy:
+            return {"ok": False, "data": None, "errors": ["Server is busy, please try again."]}
+        if not ok:
             return {"ok": False, "data": None, "errors": ["Invalid password."]}
 
+        # Upgrade plain-text or outdated hashes now that we know the password
+        if needs_rehash:
+            try:
+                user.password = PasswordHasher.hash(password)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                print(f"[UserAccount] password rehash failed for id={user.id}: {e}")
+
         return {"ok": True, "data": user, "errors": []}
\ No newline at end of file
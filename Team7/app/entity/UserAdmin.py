@@ -2,10 +2,14 @@ from flask import flash
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 from ..entity.UserProfile import UserProfile  # make sure this import exists
+from ..entity.PasswordHasher import PasswordHasher
 from sqlalchemy import or_
 from sqlalchemy.orm import joinedload
 
 from .. import db
+from ..db_routing import read_only
+from .BulkSuspend import set_suspended
+from .DashboardSummary import DashboardSummary, ADMIN
 
 class UserAdmin(db.Model):
     __tablename__ = 'users'
@@ -32,12 +36,13 @@ class UserAdmin(db.Model):
             user = cls(
                 name=name,
                 email=email,
-                password=password,
+                password=PasswordHasher.hash(password),
                 profile_id=int(profile_id),
                 is_suspended=int(is_suspended),
             )
             db.session.add(user)
             db.session.commit()
+            DashboardSummary.invalidate(ADMIN)
             return "success"
 
         except IntegrityError:
@@ -48,10 +53,130 @@ class UserAdmin(db.Model):
             db.session.rollback()
             return "error"
 
+    # -------------------------------
+    # Bulk import
+    # -------------------------------
+    IMPORT_COLUMNS = ("name", "email", "password", "profile")  # + optional is_suspended
+    _TRUE = {"1", "true", "yes", "y"}
+    _FALSE = {"", "0", "false", "no", "n"}
+
+    @classmethod
+    def BulkImportUsers(cls, rows, chunk_size: int = 200, max_rows: int | None = None, on_chunk=None) -> dict:
+        """
+        Create users from (line_number, csv_row_dict) pairs, e.g. a streaming
+        csv.DictReader. Rows are consumed chunk_size at a time; per chunk there
+        is one SELECT for emails already taken, one batch of password hashes
+        on the hashing pool, one executemany INSERT and one commit, then
+        on_chunk(report) if given (UserImportQueue records progress with it).
+        data = {"created", "duplicate", "invalid", "rows": [{"line", "email", "status", "message"}]}
+        with one entry per input row; status is created / duplicate / invalid.
+        """
+        report = {"created": 0, "duplicate": 0, "invalid": 0, "rows": []}
+        errors = []
+        try:
+            profiles = {name.strip().lower(): pid for pid, name in db.session.query(UserProfile.id, UserProfile.name)}
+            seen = set()
+            chunk = []
+            for count, (line, row) in enumerate(rows, 1):
+                if max_rows is not None and count > max_rows:
+                    errors.append(f"Only the first {max_rows} rows were processed.")
+                    break
+                values = {k.strip().lower(): (v or "").strip() for k, v in row.items() if k}
+                user, problem = cls._import_row(values, profiles)
+                if problem is not None:
+                    cls._report(report, line, values.get("email", "").lower(), "invalid", problem)
+                    continue
+                email = user["email"]
+                if email in seen:
+                    cls._report(report, line, email, "duplicate", "Email appears earlier in this file.")
+                    continue
+                seen.add(email)
+                chunk.append((line, user))
+                if len(chunk) == chunk_size:
+                    cls._import_chunk(chunk, report)
+                    chunk = []
+                    if on_chunk is not None:
+                        on_chunk(report)
+            if chunk:
+                cls._import_chunk(chunk, report)
+
+        except PasswordHasher.Busy:
+            db.session.rollback()
+            errors.append("Password hashing is busy; rows after the last saved chunk were not imported.")
+        except Exception as e:
+            db.session.rollback()
+            errors.append(f"Import stopped: {e}")
+
+        if report["created"]:
+            DashboardSummary.invalidate(ADMIN)
+        report["rows"].sort(key=lambda r: r["line"])
+        return {"ok": not errors, "data": report, "errors": errors}
+
+    @classmethod
+    def _import_row(cls, values, profiles):
+        """Validate one CSV row (lower-cased keys); returns (user_values, None) or (None, problem)."""
+        name, email, password = values.get("name", ""), values.get("email", "").lower(), values.get("password", "")
+        profile_id = profiles.get(values.get("profile", "").lower())
+        suspended = values.get("is_suspended", "").lower()
+
+        if not name or len(name) > 150:
+            return None, "Name is required (max 150 characters)."
+        local, _, domain = email.partition("@")
+        if not local or "." not in domain or len(email) > 190:
+            return None, "A valid email is required."
+        if not password:
+            return None, "Password is required."
+        if profile_id is None:
+            return None, f"Unknown profile '{values.get('profile', '')}'."
+        if suspended not in cls._TRUE | cls._FALSE:
+            return None, "is_suspended must be true/false."
+        return {"name": name, "email": email, "password": password,
+                "profile_id": profile_id, "is_suspended": suspended in cls._TRUE}, None
+
+    @staticmethod
+    def _report(report, line, email, status, message=""):
+        report[status] += 1
+        report["rows"].append({"line": line, "email": email, "status": status, "message": message})
+
+    @classmethod
+    def _import_chunk(cls, chunk, report):
+        emails = [user["email"] for _, user in chunk]
+        taken = {email for (email,) in db.session.query(cls.email).filter(cls.email.in_(emails))}
+        new = []
+        for line, user in chunk:
+            if user["email"] in taken:
+                cls._report(report, line, user["email"], "duplicate", "A user with this email already exists.")
+            else:
+                new.append((line, user))
+        db.session.rollback()  # end the read transaction while passwords are hashed
+        if not new:
+            return
+
+        hashes = PasswordHasher.hash_many(user["password"] for _, user in new)
+        for (_, user), hashed in zip(new, hashes):
+            user["password"] = hashed
+        try:
+            db.session.execute(db.insert(cls), [user for _, user in new])
+            db.session.commit()
+            for line, user in new:
+                cls._report(report, line, user["email"], "created")
+        except IntegrityError:
+            # An email was taken after the check (concurrent create): retry row by row
+            db.session.rollback()
+            for line, user in new:
+                try:
+                    db.session.execute(db.insert(cls), [user])
+                    db.session.commit()
+                    cls._report(report, line, user["email"], "created")
+                except IntegrityError:
+                    db.session.rollback()
+                    cls._report(report, line, user["email"], "duplicate", "A user with this email already exists.")
+
     # -------------------------------
     # Read / List
     # -------------------------------
     @classmethod
+    @read_only
     def ListUsers(cls, page: int | None = None, per_page: int = 20):
         """
         Return all users joined with their profiles, ordered by ID ASC.
@@ -109,11 +234,12 @@ class UserAdmin(db.Model):
             user.name = name
             user.email = email
             if password:  # only change if provided
-                user.password = password
+                user.password = PasswordHasher.hash(password)
             user.profile_id = int(profile_id)
             user.is_suspended = int(is_suspended)
 
             db.session.commit()
+            DashboardSummary.invalidate(ADMIN)
             return "success"
 
         except Exception as e:
@@ -133,6 +259,7 @@ class UserAdmin(db.Model):
     # Search
     # -------------------------------
     @classmethod
+    @read_only
     def SearchUser(cls, term: str, page: int | None = None, per_page: int = 20):
         like = f"%{(term or '').strip()}%"
         q = (
@@ -177,8 +304,28 @@ class UserAdmin(db.Model):
 
             row.is_suspended = new_val
             db.session.commit()
+            DashboardSummary.invalidate(ADMIN)
             return "success"
         except Exception as e:
             db.session.rollback()
             print(f"[{cls.__name__}] set_suspended error for id={user_id}: {e}")
-            return "error"         
\ No newline at end of file
+            return "error"
+
+    @classmethod
+    def BulkSuspendUsers(cls, user_ids, is_suspended: int | bool, exclude_ids=()) -> dict:
+        """
+        Set the suspension flag on many users with one UPDATE.
+        exclude_ids (e.g. the acting admin) are never touched.
+        Returns {"ok", "data": {"requested", "changed", "noop", "not_found"}, "errors"}.
+        """
+        result = set_suspended(cls, is_suspended, ids=user_ids, exclude_ids=exclude_ids)
+        DashboardSummary.invalidate(ADMIN)
+        return result
+
+    @classmethod
+    def SuspendUsersByProfile(cls, profile_id: int, is_suspended: int | bool, exclude_ids=()) -> dict:
+        """Suspend / unsuspend every user with this profile in one UPDATE; same result shape."""
+        result = set_suspended(cls, is_suspended, where=cls.__table__.c.profile_id == int(profile_id),
+                               exclude_ids=exclude_ids)
+        DashboardSummary.invalidate(ADMIN)
+        return result
@@ -0,0 +1,230 @@
+# 📦 File: app/entity/UserImportQueue.py
+import atexit
+import json
+import queue
+import threading
+from datetime import datetime
+
+from .. import db
+from ..db_routing import read_only
+from .UserAdmin import UserAdmin
+
+
+class UserImportJob(db.Model):
+    """
+    One CSV user import: status and counts while it runs, the per-row
+    report once it is done. Stored in the database so any worker process
+    can serve the report page, whichever process runs the import.
+    """
+    __tablename__ = 'user_import_jobs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+    status = db.Column(db.String(20), nullable=False, default="queued")  # queued / running / done / failed / interrupted
+    total_rows = db.Column(db.Integer, nullable=False, default=0)
+    processed_rows = db.Column(db.Integer, nullable=False, default=0)
+    created = db.Column(db.Integer, nullable=False, default=0)
+    duplicate = db.Column(db.Integer, nullable=False, default=0)
+    invalid = db.Column(db.Integer, nullable=False, default=0)
+    report = db.Column(db.Text)   # JSON list of {"line", "email", "status", "message"}
+    errors = db.Column(db.Text)   # JSON list of strings
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime)
+
+    FINISHED = ("done", "failed", "interrupted")
+
+    def to_dict(self, include_rows=False):
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "finished": self.status in self.FINISHED,
+            "total_rows": self.total_rows,
+            "processed_rows": self.processed_rows,
+            "created": self.created,
+            "duplicate": self.duplicate,
+            "invalid": self.invalid,
+            "errors": json.loads(self.errors) if self.errors else [],
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+        if include_rows:
+            data["rows"] = json.loads(self.report) if self.report else []
+        return data
+
+    #Entity for: As User Admin, I want to follow a CSV import until its report is ready#
+    @classmethod
+    @read_only
+    def GetImportJob(cls, job_id) -> dict:
+        try:
+            job = db.session.get(cls, job_id)
+            if job is None:
+                return {"ok": False, "data": None, "errors": ["Import not found."]}
+            return {"ok": True, "data": job.to_dict(include_rows=job.status in cls.FINISHED), "errors": []}
+        except Exception as e:
+            return {"ok": False, "data": None, "errors": [str(e)]}
+
+    @classmethod
+    @read_only
+    def RecentImportJobs(cls, limit: int = 10) -> dict:
+        try:
+            jobs = cls.query.order_by(cls.id.desc()).limit(limit).all()
+            return {"ok": True, "data": [job.to_dict() for job in jobs], "errors": []}
+        except Exception as e:
+            return {"ok": False, "data": [], "errors": [str(e)]}
+
+    @classmethod
+    def _update(cls, job_id, **values):
+        values["updated_at"] = datetime.utcnow()
+        db.session.execute(db.update(cls).where(cls.id == job_id).values(**values))
+        db.session.commit()
+
+
+class UserImportQueue:
+    """
+    Runs CSV user imports off the request thread.
+
+    The upload request parses the file, stores a queued UserImportJob and
+    returns; one background worker per process runs the jobs in order with
+    UserAdmin.BulkImportUsers, writing the counts after every chunk so the
+    report page can show progress. Passwords are still hashed on the
+    PasswordHasher pool, so an import and logins share the same cores.
+    Set USER_IMPORT_MODE = "sync" to run the import inside the request.
+    """
+
+    _STOP = object()
+
+    _app = None
+    _queue = None
+    _worker = None
+    _pending = set()  # job ids queued or running in this process
+    _lock = threading.Lock()
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("USER_IMPORT_MODE", "async")
+        app.config.setdefault("USER_IMPORT_CHUNK_SIZE", 50)
+        app.config.setdefault("USER_IMPORT_MAX_ROWS", 5000)
+        cls._app = app
+
+    # -------------------------------
+    # Producer side
+    # -------------------------------
+    @classmethod
+    def submit(cls, rows, created_by=None) -> dict:
+        """
+        rows: list of (line_number, csv_row_dict). Returns {"ok", "data": job_id, "errors"};
+        in sync mode the job has already finished when this returns.
+        """
+        try:
+            job = UserImportJob(created_by=created_by, status="queued",
+                                total_rows=min(len(rows), cls._app.config["USER_IMPORT_MAX_ROWS"]))
+            db.session.add(job)
+            db.session.commit()
+            job_id = job.id
+        except Exception as e:
+            db.session.rollback()
+            return {"ok": False, "data": None, "errors": [str(e)]}
+
+        if cls._app.config["USER_IMPORT_MODE"] == "sync":
+            cls._import(cls._app, job_id, rows)
+        else:
+            cls._start_worker()
+            with cls._lock:
+                cls._pending.add(job_id)
+            cls._queue.put((job_id, rows))
+        return {"ok": True, "data": job_id, "errors": []}
+
+    @classmethod
+    def flush(cls, timeout: float = 60.0) -> bool:
+        """Block until every job queued so far has finished."""
+        if cls._worker is None or not cls._worker.is_alive():
+            return True
+        done = threading.Event()
+        cls._queue.put(done)
+        return done.wait(timeout)
+
+    @classmethod
+    def shutdown(cls, timeout: float = 5.0):
+        """
+        Stop the worker after its current job (registered with atexit). Jobs
+        that do not finish within `timeout` are marked interrupted, so their
+        report page stops waiting.
+        """
+        with cls._lock:
+            worker = cls._worker
+            if worker is None:
+                return
+            cls._queue.put(cls._STOP)
+            cls._worker = None
+        worker.join(timeout)
+        with cls._lock:
+            unfinished, cls._pending = list(cls._pending), set()
+        if unfinished:
+            with cls._app.app_context():
+                for job_id in unfinished:
+                    UserImportJob._update(job_id, status="interrupted", finished_at=datetime.utcnow(),
+                                          errors=json.dumps(["The server stopped before this import finished."]))
+
+    # -------------------------------
+    # Worker side
+    # -------------------------------
+    @classmethod
+    def _start_worker(cls):
+        if cls._worker is not None:
+            return
+        with cls._lock:
+            if cls._worker is not None:
+                return
+            if cls._queue is None:
+                cls._queue = queue.Queue()
+            cls._worker = threading.Thread(
+                target=cls._run, args=(cls._app, cls._queue),
+                name="user-import", daemon=True,
+            )
+            cls._worker.start()
+            atexit.register(cls.shutdown)
+
+    @classmethod
+    def _run(cls, app, q):
+        while True:
+            item = q.get()
+            if item is cls._STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            job_id, rows = item
+            cls._import(app, job_id, rows)
+            with cls._lock:
+                cls._pending.discard(job_id)
+
+    @staticmethod
+    def _import(app, job_id, rows):
+        with app.app_context():
+            try:
+                UserImportJob._update(job_id, status="running")
+                res = UserAdmin.BulkImportUsers(
+                    rows,
+                    chunk_size=int(app.config["USER_IMPORT_CHUNK_SIZE"]),
+                    max_rows=int(app.config["USER_IMPORT_MAX_ROWS"]),
+                    on_chunk=lambda report: UserImportJob._update(job_id, **UserImportQueue._counts(report)),
+                )
+                data = res["data"]
+                UserImportJob._update(job_id, status="done", finished_at=datetime.utcnow(),
+                                      report=json.dumps(data["rows"]), errors=json.dumps(res["errors"]),
+                                      **UserImportQueue._counts(data))
+            except Exception as e:
+                db.session.rollback()
+                print(f"[UserImportQueue] import {job_id} failed: {e}")
+                try:
+                    UserImportJob._update(job_id, status="failed", finished_at=datetime.utcnow(),
+                                          errors=json.dumps([f"Import stopped: {e}"]))
+                except Exception:
+                    db.session.rollback()
+
+    @staticmethod
+    def _counts(report):
+        counts = {key: report[key] for key in ("created", "duplicate", "invalid")}
+        counts["processed_rows"] = sum(counts.values())
+        return counts
@@ -1,6 +1,8 @@
 from flask import flash
 from sqlalchemy.exc import IntegrityError
 from .. import db
+from .BulkSuspend import set_suspended
+from .DashboardSummary import DashboardSummary, ADMIN
 from sqlalchemy import or_
 from sqlalchemy.orm import joinedload
 
@@ -39,6 +41,7 @@ class UserProfile(db.Model):
             )
             db.session.add(row)
             db.session.commit()
+            DashboardSummary.invalidate(ADMIN)
             return "success"
 
         except Exception as e:
@@ -88,6 +91,7 @@ class UserProfile(db.Model):
             row.is_suspended = bool(is_suspended)
 
             db.session.commit()
+            DashboardSummary.invalidate(ADMIN)
             return "success"
 
         except Exception as e:
@@ -140,8 +144,19 @@ class UserProfile(db.Model):
                 return "noop"
             row.is_suspended = new_val
             db.session.commit()
+            DashboardSummary.invalidate(ADMIN)
             return "success"
         except Exception as e:
             db.session.rollback()
             print(f"[UserProfile] set_suspended error id={profile_id}: {e}")
-            return "error"
\ No newline at end of file
+            return "error"
+
+    @classmethod
+    def BulkSuspendUserProfiles(cls, profile_ids, is_suspended: int | bool) -> dict:
+        """
+        Set the suspension flag on many profiles with one UPDATE.
+        Returns {"ok", "data": {"requested", "changed", "noop", "not_found"}, "errors"}.
+        """
+        result = set_suspended(cls, is_suspended, ids=profile_ids)
+        DashboardSummary.invalidate(ADMIN)
+        return result
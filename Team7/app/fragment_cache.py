@@ -0,0 +1,80 @@
+# 📦 File: app/fragment_cache.py
+import threading
+
+from jinja2 import Undefined
+from markupsafe import Markup
+
+from .cache import TTLCache
+
+
+class FragmentCache:
+    """
+    Rendered-HTML cache for template sections, shared by all users:
+
+        {% call cached_fragment("csr_request_card", request.id, request.updated_at) %}
+            ... markup built only from the key's inputs ...
+        {% endcall %}
+
+    The block body runs only on a miss. The key must cover everything the
+    body shows; anything per-user or per-request (flash messages, the current
+    user, selected filters) either goes into the key or stays outside the
+    block. Keys are plain values: a request's (id, updated_at) changes on
+    every write, so stale cards are never served, only evicted (LRU / TTL).
+    """
+
+    _fragments = TTLCache(max_size=5_000, ttl=600, name="template_fragments")
+    _lock = threading.Lock()
+    _stats = {}  # fragment name -> [hits, misses]
+    _enabled = True
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("FRAGMENT_CACHE", True)
+        app.config.setdefault("FRAGMENT_CACHE_SIZE", 5_000)
+        app.config.setdefault("FRAGMENT_CACHE_TTL", 600)
+        cls._enabled = bool(app.config["FRAGMENT_CACHE"])
+        cls._fragments = TTLCache(
+            max_size=int(app.config["FRAGMENT_CACHE_SIZE"]),
+            ttl=float(app.config["FRAGMENT_CACHE_TTL"]),
+            name="template_fragments",
+        )
+        app.jinja_env.globals["cached_fragment"] = cls.cached_fragment
+
+    @staticmethod
+    def _key_part(value):
+        # Missing attributes (e.g. search_title on a non-search row) all mean "no value"
+        if isinstance(value, Undefined):
+            return None
+        if isinstance(value, list):
+            return tuple(value)  # e.g. a category list; must be hashable
+        return value
+
+    @classmethod
+    def cached_fragment(cls, name, *key, caller):
+        if not cls._enabled:
+            return caller()
+        cache_key = (name,) + tuple(cls._key_part(part) for part in key)
+        html = cls._fragments.get(cache_key)
+        hit = html is not None
+        if not hit:
+            html = str(caller())
+            cls._fragments.set(cache_key, html)
+        with cls._lock:
+            counts = cls._stats.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+        return Markup(html)
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Cache-wide counters plus hits / misses / hit rate per fragment name."""
+        with cls._lock:
+            per_fragment = {
+                name: {"hits": h, "misses": m, "hit_rate": round(h / (h + m), 3) if h + m else 0.0}
+                for name, (h, m) in sorted(cls._stats.items())
+            }
+        return {**cls._fragments.stats(), "fragments": per_fragment}
+
+    @classmethod
+    def invalidate(cls):
+        """Drop every fragment, e.g. after a bulk write that bypassed updated_at."""
+        cls._fragments.invalidate()
@@ -0,0 +1,134 @@
+# 📦 File: app/http_cache.py
+import hashlib
+import os
+import threading
+from datetime import datetime
+from functools import wraps
+
+from flask import current_app, make_response, request, session
+
+
+def _code_version(app) -> str:
+    """
+    Newest mtime of the app's code and templates: part of every ETag, so a
+    deploy that changes a template invalidates pages browsers already hold.
+    The same on every worker of one deploy, unlike a random per-process salt.
+    """
+    newest = 0.0
+    for folder, _dirs, files in os.walk(app.root_path):
+        for name in files:
+            if name.endswith((".py", ".html")):
+                newest = max(newest, os.path.getmtime(os.path.join(folder, name)))
+    return f"{newest:.0f}"
+
+
+class ConditionalGet:
+    """
+    HTTP revalidation for pages that declare a validator (@conditional).
+
+    The validator is a cheap query over the data the page shows (row count
+    and newest updated_at of a PIN's requests, of a CSR's shortlist, ...).
+    Its result, together with everything else the page depends on (user,
+    role, URL with query string, code version), is hashed into an ETag. A
+    browser revalidating with a matching If-None-Match gets 304 Not Modified
+    before the view runs: one small query, no list query, no template render.
+
+    Those pages are sent with `Cache-Control: private, no-cache` (the browser
+    may keep a copy but must revalidate every time, shared caches must not
+    store it); every other dynamic response keeps `no-store`, so forms,
+    redirects and POST results are never served from a cache.
+    """
+
+    _lock = threading.Lock()
+    _stats = {}  # endpoint -> [validated, not_modified]
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("CONDITIONAL_GET", True)
+        app.config.setdefault("ETAG_SALT", None)
+        if not app.config["ETAG_SALT"]:
+            app.config["ETAG_SALT"] = _code_version(app)
+        app.after_request(cls._default_headers)
+
+    @staticmethod
+    def _default_headers(response):
+        # Responses from @conditional views already carry their own Cache-Control
+        if not request.path.startswith("/static/") and "Cache-Control" not in response.headers:
+            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+            response.headers["Pragma"] = "no-cache"
+            response.headers["Expires"] = "0"
+        return response
+
+    @staticmethod
+    def etag_for(version) -> str:
+        key = repr((
+            current_app.config["ETAG_SALT"], request.endpoint, request.full_path,
+            session.get("user_id"), session.get("profile_name"), version,
+        ))
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _revalidation_headers(response, etag, version):
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.vary.add("Cookie")
+        # Informational only: the ETag decides, since a date cannot capture deletes or the user
+        stamps = [v for v in version if isinstance(v, datetime)]
+        if stamps:
+            response.last_modified = max(stamps)
+
+    @classmethod
+    def _count(cls, endpoint, not_modified):
+        with cls._lock:
+            stats = cls._stats.setdefault(endpoint, [0, 0])
+            stats[0] += 1
+            stats[1] += not_modified
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """Per-endpoint revalidation counts since start."""
+        with cls._lock:
+            return {ep: {"validated": v, "not_modified": n, "hit_rate": round(n / v, 3) if v else 0.0}
+                    for ep, (v, n) in sorted(cls._stats.items())}
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._stats.clear()
+
+
+def conditional(validator):
+    """
+    Answer GETs with 304 Not Modified while the page's data is unchanged.
+    `validator(**view_args)` returns a tuple that changes whenever anything
+    the page shows changes (or an "error:..." string to skip the check).
+    Put it under @login_required / role checks, so anonymous requests never
+    reach it.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            # Pending flash messages are one-off content: render them, never tag them
+            if (request.method != "GET" or not current_app.config["CONDITIONAL_GET"]
+                    or session.get("_flashes")):
+                return view(*args, **kwargs)
+
+            version = validator(**kwargs)
+            if isinstance(version, str):
+                return view(*args, **kwargs)
+
+            etag = ConditionalGet.etag_for(version)
+            if request.if_none_match.contains_weak(etag):
+                ConditionalGet._count(request.endpoint, True)
+                response = current_app.response_class(status=304)
+                ConditionalGet._revalidation_headers(response, etag, version)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            # Access-denied redirects, errors and the like are not tagged
+            if response.status_code == 200:
+                ConditionalGet._count(request.endpoint, False)
+                ConditionalGet._revalidation_headers(response, etag, version)
+            return response
+        return wrapped
+    return decorator
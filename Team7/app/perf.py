@@ -0,0 +1,225 @@
+# 📦 File: app/perf.py
+import threading
+import time
+from collections import deque
+
+from flask import current_app, g, has_request_context, request, before_render_template, template_rendered
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more SQL than its endpoint's budget, or an N+1 pattern."""
+
+
+def query_budget(max_queries: int):
+    """
+    Declare the most SQL statements a view may run per request.
+    Put it directly under @bp.route; QUERY_BUDGETS in the config overrides it.
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+
+class RequestMetrics:
+    """
+    Per-request timing: SQL statement count and time (all engines), template
+    render time and total time. Sent back in a Server-Timing header (visible
+    in the browser dev tools) and folded into rolling per-endpoint aggregates
+    over the last PERF_WINDOW requests.
+
+    Each request is also checked against its query budget (@query_budget,
+    QUERY_BUDGETS, QUERY_BUDGET_DEFAULT) and for N+1 patterns: the same
+    statement run N_PLUS_ONE_THRESHOLD+ times, typically a lazy relationship
+    touched once per row in a template loop. QUERY_BUDGET_MODE decides what
+    happens: "raise", "log" or "off".
+    """
+
+    _window = 500
+    _lock = threading.Lock()
+    _samples = {}    # endpoint -> deque[(total_ms, db_ms, render_ms, queries)]
+    _requests = {}   # endpoint -> requests seen since start
+
+    @classmethod
+    def init_app(cls, app, engines):
+        app.config.setdefault("PERF_INSTRUMENTATION", True)
+        app.config.setdefault("PERF_SERVER_TIMING", True)
+        app.config.setdefault("PERF_WINDOW", 500)
+        app.config.setdefault("QUERY_BUDGET_MODE", "off")
+        app.config.setdefault("QUERY_BUDGET_DEFAULT", None)
+        app.config.setdefault("QUERY_BUDGETS", {})
+        app.config.setdefault("N_PLUS_ONE_THRESHOLD", 5)
+        if not app.config["PERF_INSTRUMENTATION"]:
+            return
+        cls._window = int(app.config["PERF_WINDOW"])
+
+        if not event.contains(Session, "do_orm_execute", cls._on_orm_execute):
+            event.listen(Session, "do_orm_execute", cls._on_orm_execute)
+
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", cls._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", cls._after_cursor_execute)
+        before_render_template.connect(cls._before_render, app)
+        template_rendered.connect(cls._after_render, app)
+        app.before_request(cls._start)
+        app.after_request(cls._finish)
+
+    # -------------------------------
+    # Hooks
+    # -------------------------------
+    @staticmethod
+    def _start():
+        g.perf = {"start": time.perf_counter(), "queries": 0, "db": 0.0,
+                  "render": 0.0, "render_started": [], "templates": [],
+                  "statements": {}, "relationship": None}
+
+    @staticmethod
+    def _current():
+        return g.get("perf") if has_request_context() else None
+
+    @classmethod
+    def _before_cursor_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("perf_started", []).append(time.perf_counter())
+
+    @classmethod
+    def _after_cursor_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("perf_started")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        perf = cls._current()
+        if perf is not None:
+            perf["queries"] += 1
+            perf["db"] += elapsed
+            # Same SQL text = same statement shape; parameters differ per row in an N+1
+            seen = perf["statements"].get(statement)
+            if seen is None:
+                perf["statements"][statement] = [1, perf["templates"][-1] if perf["templates"] else None,
+                                                 perf["relationship"]]
+            else:
+                seen[0] += 1
+            perf["relationship"] = None
+
+    @classmethod
+    def _on_orm_execute(cls, orm_execute_state):
+        # Remember which relationship a lazy load is for; the next statement is its SELECT
+        perf = cls._current()
+        if perf is not None and orm_execute_state.is_relationship_load:
+            path = orm_execute_state.loader_strategy_path
+            if path is not None and len(path) >= 2:
+                mapper, prop = path[-2], path[-1]
+                perf["relationship"] = f"{mapper.class_.__name__}.{prop.key}"
+
+    @classmethod
+    def _before_render(cls, app, template, context, **extra):
+        perf = cls._current()
+        if perf is not None:
+            perf["render_started"].append(time.perf_counter())
+            perf["templates"].append(template.name)
+
+    @classmethod
+    def _after_render(cls, app, template, context, **extra):
+        perf = cls._current()
+        if perf is not None and perf["render_started"]:
+            perf["render"] += time.perf_counter() - perf["render_started"].pop()
+            perf["templates"].pop()
+
+    @classmethod
+    def _finish(cls, response):
+        perf = cls._current()
+        if perf is None or request.endpoint in (None, "static"):
+            return response
+
+        total_ms = (time.perf_counter() - perf["start"]) * 1000
+        db_ms, render_ms = perf["db"] * 1000, perf["render"] * 1000
+        # db time also counts lazy-load queries fired while the template renders
+        if current_app.config["PERF_SERVER_TIMING"]:
+            response.headers.add("Server-Timing", (
+                f'db;dur={db_ms:.1f};desc="{perf["queries"]} queries", '
+                f"tpl;dur={render_ms:.1f}, total;dur={total_ms:.1f}"
+            ))
+        cls.record(request.endpoint, total_ms, db_ms, render_ms, perf["queries"])
+        cls._check_budget(perf)
+        return response
+
+    # -------------------------------
+    # Budgets / N+1
+    # -------------------------------
+    @classmethod
+    def budget_for(cls, endpoint):
+        budgets = current_app.config["QUERY_BUDGETS"]
+        if endpoint in budgets:
+            return budgets[endpoint]
+        view = current_app.view_functions.get(endpoint)
+        return getattr(view, "query_budget", current_app.config["QUERY_BUDGET_DEFAULT"])
+
+    @classmethod
+    def _check_budget(cls, perf):
+        mode = current_app.config["QUERY_BUDGET_MODE"]
+        if mode == "off":
+            return
+
+        problems = []
+        budget = cls.budget_for(request.endpoint)
+        if budget is not None and perf["queries"] > budget:
+            problems.append(f"{perf['queries']} queries, budget is {budget}")
+
+        threshold = current_app.config["N_PLUS_ONE_THRESHOLD"]
+        for statement, (count, template, relationship) in perf["statements"].items():
+            if count < threshold:
+                continue
+            where = f" in template {template}" if template else ""
+            what = f"lazy load of {relationship}" if relationship else "statement"
+            sql = " ".join(statement.split())
+            problems.append(f"N+1: {what} ran {count}x{where}: {sql[:160]}")
+
+        if not problems:
+            return
+        message = f"Query budget for {request.endpoint}: " + "; ".join(problems)
+        if mode == "raise":
+            raise QueryBudgetExceeded(message)
+        print(f"⚠️ {message}")
+
+    # -------------------------------
+    # Aggregates
+    # -------------------------------
+    @classmethod
+    def record(cls, endpoint, total_ms, db_ms, render_ms, queries):
+        with cls._lock:
+            samples = cls._samples.get(endpoint)
+            if samples is None:
+                samples = cls._samples[endpoint] = deque(maxlen=cls._window)
+            samples.append((total_ms, db_ms, render_ms, queries))
+            cls._requests[endpoint] = cls._requests.get(endpoint, 0) + 1
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """Per-endpoint stats over the rolling window, slowest p95 first."""
+        with cls._lock:
+            data = {ep: (list(s), cls._requests[ep]) for ep, s in cls._samples.items()}
+
+        stats = {}
+        for endpoint, (samples, seen) in data.items():
+            totals = sorted(s[0] for s in samples)
+            n = len(samples)
+            stats[endpoint] = {
+                "requests": seen,
+                "window": n,
+                "p50_ms": round(totals[(n - 1) // 2], 2),
+                "p95_ms": round(totals[int((n - 1) * 0.95)], 2),
+                "max_ms": round(totals[-1], 2),
+                "avg_db_ms": round(sum(s[1] for s in samples) / n, 2),
+                "avg_render_ms": round(sum(s[2] for s in samples) / n, 2),
+                "avg_queries": round(sum(s[3] for s in samples) / n, 2),
+                "max_queries": max(s[3] for s in samples),
+            }
+        return dict(sorted(stats.items(), key=lambda kv: kv[1]["p95_ms"], reverse=True))
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._samples.clear()
+            cls._requests.clear()
+
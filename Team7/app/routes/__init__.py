@@ -0,0 +1,184 @@
+# 📦 File: app/routes/__init__.py
+import importlib
+import sys
+import time
+from functools import wraps
+
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, current_app
+
+from ..control.UserController import LoginUserController
+
+# -----------------------------------------------------------------------------
+# Auth guard
+# -----------------------------------------------------------------------------
+def login_required(view_func):
+    """Decorator to protect routes that require a logged-in user."""
+    @wraps(view_func)
+    def wrapped_view(*args, **kwargs):
+        if not session.get("user_id"):
+            flash("You must log in to access this page.", "error")
+            return redirect(url_for("boundary.on_login"))
+        return view_func(*args, **kwargs)
+    return wrapped_view
+
+
+def role_required(profile_name, message="Access denied."):
+    """
+    Profile check for pages of one role: flash `message` and send other
+    profiles to the login page. Goes under @login_required and above
+    @conditional, so a wrong-role session never reaches the validator query.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped_view(*args, **kwargs):
+            if (session.get("profile_name") or "").lower() != profile_name:
+                flash(message, "error")
+                return redirect(url_for("boundary.on_login"))
+            return view_func(*args, **kwargs)
+        return wrapped_view
+    return decorator
+
+
+def flash_bulk_result(res, noun: str, is_suspended, category: str):
+    """Flash the changed / no-op / not-found counts of a bulk suspend as '<category>:ok|err'."""
+    if not res["ok"]:
+        for e in res["errors"]:
+            flash(e, f"{category}:err")
+        return
+    data, verb = res["data"], ("suspended" if is_suspended else "unsuspended")
+    if not data["requested"]:
+        flash(f"No {noun} to update.", f"{category}:err")
+        return
+    parts = [f"{data['changed']} {noun} {verb}"]
+    if data["noop"]:
+        parts.append(f"{data['noop']} already {verb}")
+    if data["not_found"]:
+        parts.append(f"{data['not_found']} not found")
+    flash("; ".join(parts) + ".", f"{category}:ok")
+
+# Session routes shared by every role; always registered
+bp = Blueprint('boundary', __name__)
+
+# Role blueprint name -> module in this package. Only the ones listed in
+# ENABLED_BLUEPRINTS are imported, so a PIN/CSR-only worker never loads the
+# admin or platform-management controllers.
+ROLE_BLUEPRINTS = {
+    "admin": "admin",
+    "platform": "platform_management",
+    "pin": "pin",
+    "csr": "csr",
+    "api": "api",  # JSON API for PIN / CSR (/api/v1)
+}
+
+ROLE_DASHBOARDS = {
+    "admin": "admin.admin_dashboard",
+    "platform management": "platform.service_category_dashboard",
+    "pin": "pin.pin_dashboard",
+    "csr rep": "csr.csr_dashboard",
+}
+
+# -----------------------------------------------------------------------------
+# Session (LOGIN)
+# -----------------------------------------------------------------------------
+@bp.route('/login', methods=['GET', 'POST'])
+def on_login():
+    if request.method == 'POST':
+        email = (request.form.get('email') or '').strip().lower()
+        password = (request.form.get('password') or '').strip()
+
+        if not email or not password:
+            if not email:
+                flash("Email is required.", "error")
+            if not password:
+                flash("Password is required.", "error")
+            return render_template('LoginForm.html', email=email), 400
+
+        ctrl = LoginUserController()
+        res = ctrl.login(email, password)
+
+        if not res["ok"]:
+            for err in res["errors"]:
+                flash(err, "error")
+            return render_template('LoginForm.html', email=email), 400
+
+        user = res["data"]
+        session["user_id"] = user.id
+        session["user_name"] = user.name
+        session["user_email"] = user.email
+        session["profile_name"] = user.profile.name
+
+        profile_name = user.profile.name.lower()
+        print(profile_name)
+        endpoint = ROLE_DASHBOARDS.get(profile_name, 'boundary.home')
+        if endpoint not in current_app.view_functions:
+            # This role's blueprint is not enabled on this deployment
+            session.clear()
+            flash("This part of the service is not available on this server.", "error")
+            return render_template('LoginForm.html', email=email), 503
+        return redirect(url_for(endpoint))
+
+    return render_template('LoginForm.html')
+
+
+# -----------------------------------------------------------------------------
+# Session (LOGOUT)
+# -----------------------------------------------------------------------------
+@bp.route("/logout", methods=["POST"])
+@login_required
+def click_logout():
+    """Log the user out by clearing the session directly."""
+    session.clear()
+    flash("Signed out successfully.", "ok")
+    return redirect(url_for("boundary.on_login"))
+
+# -----------------------------------------------------------------------------
+# Home → Login
+# -----------------------------------------------------------------------------
+@bp.route('/')
+def home():
+    return redirect(url_for('boundary.on_login'))
+    
+
+
+# -----------------------------------------------------------------------------
+# Registration
+# -----------------------------------------------------------------------------
+def register_blueprints(app) -> dict:
+    """
+    Register the session blueprint plus the role blueprints named in
+    ENABLED_BLUEPRINTS, importing each role module only when it is enabled.
+    Import time and newly loaded modules per blueprint are stored in
+    app.config["BLUEPRINT_IMPORT_REPORT"] and printed at startup.
+    """
+    enabled = app.config.get("ENABLED_BLUEPRINTS") or list(ROLE_BLUEPRINTS)
+    if isinstance(enabled, str):
+        enabled = [name.strip() for name in enabled.split(",") if name.strip()]
+    unknown = sorted(set(enabled) - set(ROLE_BLUEPRINTS))
+    if unknown:
+        raise ValueError(f"Unknown blueprints {unknown}; expected some of {sorted(ROLE_BLUEPRINTS)}")
+
+    app.register_blueprint(bp)
+    report = {}
+    for name, module_name in ROLE_BLUEPRINTS.items():
+        if name not in enabled:
+            report[name] = {"enabled": False}
+            continue
+        modules_before = len(sys.modules)
+        started = time.perf_counter()
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        import_ms = (time.perf_counter() - started) * 1000
+        app.register_blueprint(module.bp)
+        report[name] = {
+            "enabled": True,
+            "import_ms": round(import_ms, 2),
+            "modules_loaded": len(sys.modules) - modules_before,
+            "routes": sum(1 for rule in app.url_map.iter_rules() if rule.endpoint.startswith(f"{name}.")),
+        }
+
+    app.config["BLUEPRINT_IMPORT_REPORT"] = report
+    print("📦 Blueprints: " + ", ".join(
+        f"{name} {r['import_ms']:.1f} ms (+{r['modules_loaded']} modules, {r['routes']} routes)"
+        if r["enabled"] else f"{name} off"
+        for name, r in report.items()
+    ))
+    return report
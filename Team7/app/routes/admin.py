@@ -0,0 +1,447 @@
+# 📦 File: app/routes/admin.py
+# User Admin: dashboard, users, profiles
+import csv
+import io
+import itertools
+
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, jsonify, current_app
+
+from ..control.UserController import (
+    CreateUserController,
+    BulkImportUserController,
+    BulkSuspendUserController,
+    ListUserController,
+    UpdateUserController,
+    UserSearchController,
+    SuspendedUserController,
+    UserSummaryController,
+)
+from ..control.UserProfileController import (
+    CreateUserProfileController,
+    ListUserProfileController,
+    UpdateUserProfileController,
+    UserProfileSearchController,
+    SuspendedUserProfileController,
+    BulkSuspendUserProfileController,
+)
+from ..control.CSRControllers import CSRRecommendationStatsController
+from ..fragment_cache import FragmentCache
+from ..http_cache import ConditionalGet
+from ..perf import RequestMetrics, query_budget
+from . import login_required, flash_bulk_result
+
+bp = Blueprint('admin', __name__)
+
+# -----------------------------------------------------------------------------
+# User Admin dashboard
+# -----------------------------------------------------------------------------
+@bp.route('/admin/dashboard')
+@query_budget(2)
+@login_required
+def admin_dashboard():
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    # Users per profile (one GROUP BY, cached for DASHBOARD_SUMMARY_TTL)
+    summary = UserSummaryController().get_summary()
+    if isinstance(summary, str):
+        flash(f"Could not load user counts: {summary}", "error")
+        summary = None
+    return render_template("AdminDashboard.html", summary=summary)
+
+@bp.route('/admin/performance')
+@login_required
+def admin_performance():
+    """Rolling per-endpoint timings collected by RequestMetrics, as JSON."""
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    return jsonify(RequestMetrics.snapshot())
+
+@bp.route('/admin/performance/revalidation')
+@login_required
+def admin_revalidation_stats():
+    """Per-endpoint ETag checks and 304 Not Modified answers (ConditionalGet), as JSON."""
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    return jsonify(ConditionalGet.snapshot())
+
+@bp.route('/admin/performance/fragments')
+@login_required
+def admin_fragment_cache_stats():
+    """Template fragment cache size and hit rates, overall and per fragment, as JSON."""
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    return jsonify(FragmentCache.stats())
+
+@bp.route('/admin/performance/summaries')
+@login_required
+def admin_summary_cache_stats():
+    """Dashboard summary cache size and hit rate, as JSON."""
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    return jsonify(UserSummaryController().cache_stats())
+
+@bp.route('/admin/performance/recommendations')
+@login_required
+def admin_recommendation_stats():
+    """Scorer in use (numpy / python), open-set size, last ranking time and affinity cache, as JSON."""
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    return jsonify(CSRRecommendationStatsController().stats())
+
+# -----------------------------------------------------------------------------
+# Users (CREATE) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/users/create', methods=['GET', 'POST'])
+@login_required
+def create_user():
+    profiles = ListUserProfileController().ListUserProfile()
+    if request.method == "POST":
+        ctrl = CreateUserController()
+        status  = ctrl.CreateUserAC(
+            request.form.get('name', '').strip(),
+            request.form.get('email', '').strip().lower(),
+            request.form.get('password', ''),
+            request.form.get('profile_id', '0'),
+            1 if request.form.get('is_suspended') else 0
+        )
+
+        if status == "success":
+            flash("User created successfully.", "create_user:ok")
+            return redirect(url_for('admin.create_user'))  # refresh after post
+        elif status == "duplicate":
+            flash("A user with this email already exists.", "create_user:err")
+        else:
+            flash("An unexpected error occurred. Please try again later.", "create_user:err")
+            
+    return render_template("create_user.html", profiles=profiles["data"])
+
+# -----------------------------------------------------------------------------
+# Users (BULK IMPORT from CSV) - admin only
+# -----------------------------------------------------------------------------
+@bp.route('/users/import', methods=['GET', 'POST'])
+@login_required
+def import_users():
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+
+    ctrl = BulkImportUserController()
+    if request.method == "GET":
+        return render_template("import_users.html", job=None, recent=ctrl.RecentImportJobs()["data"])
+
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        flash("Choose a CSV file to import.", "import_users:err")
+        return redirect(url_for('admin.import_users'))
+
+    # Read up to one row past the cap (so the import can report the cut) before
+    # the upload goes away; the rows themselves are imported in the background
+    max_rows = current_app.config["USER_IMPORT_MAX_ROWS"]
+    try:
+        reader = csv.DictReader(io.TextIOWrapper(upload.stream, encoding="utf-8-sig", newline=""))
+        columns = {c.strip().lower() for c in (reader.fieldnames or []) if c}
+        missing = [c for c in BulkImportUserController.COLUMNS if c not in columns]
+        rows = [] if missing else [(reader.line_num, row) for row in itertools.islice(reader, max_rows + 1)]
+    except (UnicodeDecodeError, csv.Error) as e:
+        flash(f"Could not read the CSV file: {e}", "import_users:err")
+        return redirect(url_for('admin.import_users'))
+    if missing:
+        flash(f"Missing CSV columns: {', '.join(missing)}.", "import_users:err")
+        return redirect(url_for('admin.import_users'))
+
+    res = ctrl.SubmitImport(rows, created_by=session.get("user_id"))
+    if request.accept_mimetypes.best == "application/json":
+        if not res["ok"]:
+            return jsonify(res), 500
+        return jsonify(res), 202, {"Location": url_for('admin.import_job', job_id=res["data"])}
+    if not res["ok"]:
+        flash("Could not start the import. Please try again later.", "import_users:err")
+        return redirect(url_for('admin.import_users'))
+    return redirect(url_for('admin.import_job', job_id=res["data"]))
+
+@bp.route('/users/import/<int:job_id>')
+@login_required
+def import_job(job_id):
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+
+    res = BulkImportUserController().GetImportJob(job_id)
+    if request.accept_mimetypes.best == "application/json":
+        return jsonify(res), 200 if res["ok"] else 404
+    if not res["ok"]:
+        flash("Import not found.", "import_users:err")
+        return redirect(url_for('admin.import_users'))
+    return render_template("import_users.html", job=res["data"], recent=None)
+
+# -----------------------------------------------------------------------------
+# Users (LIST + SEARCH) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/users')
+@query_budget(4)
+@login_required
+def list_users():
+    q = (request.args.get('q') or '').strip()
+    page = request.args.get('page', default=1, type=int)  # pass None to disable pagination
+    per_page = 20
+
+    if q:
+        res = UserSearchController().SearchUser(q, page=page, per_page=per_page)
+    else:
+        res = ListUserController().ListUsers(page=page, per_page=per_page)
+
+    if not res["ok"]:
+        for e in res["errors"]:
+            flash(e, "list_users:err")
+        return render_template('list_users.html', rows=[], q=q, pagination=None)
+
+    return render_template(
+        'list_users.html',
+        rows=res["data"],                  
+        q=q,                              
+        pagination=res.get("pagination")  
+    )
+    
+# -----------------------------------------------------------------------------
+# Users (UPDATE) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/users/<int:user_id>/edit', methods=['GET', 'POST'])
+@login_required
+def edit_user(user_id):
+    ctrl = UpdateUserController()
+    profiles = ListUserProfileController().ListUserProfile()
+    user = ctrl.get(user_id)
+    
+    if not user:
+        flash("User not found.", "update_user:err")
+        return redirect(url_for("admin.list_users"))
+    
+    if request.method == "POST":
+        errors = []
+
+        # Inline validation
+        name_n  = (request.form.get("name", "")  or "").strip()
+        email_n = (request.form.get("email", "") or "").strip().lower()
+
+        if not name_n:
+            errors.append("Name is required.")
+        if not email_n:
+            errors.append("Email is required.")
+            
+        if errors:
+            for e in errors:
+                flash(e, "update_user:err")
+            return render_template("update_user.html", user=user, profiles=profiles["data"]), 400
+
+        status = ctrl.UpdateUser(
+            user_id=user_id,
+            name=name_n,
+            email=email_n,
+            password=request.form.get("password") or None,
+            profile_id=request.form.get("profile_id", "0"),
+            is_suspended=int(request.form.get("is_suspended") or 0),
+        )
+
+        if status == "success":
+            flash("User updated successfully.", "list_user:ok")
+            return redirect(url_for("admin.list_users"))
+        elif status == "duplicate":
+            flash("A user with this email already exists.", "update_user:err")
+        elif status == "not_found":
+            flash("User not found.", "update_user:err")
+            return redirect(url_for("admin.list_users"))
+        else:
+            flash("An unexpected error occurred while updating user.", "update_user:err")
+
+    return render_template("update_user.html", user=user, profiles=profiles["data"])
+
+# -----------------------------------------------------------------------------
+# Users (SUSPEND) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/users/<int:user_id>/suspend', methods=['POST'])
+@login_required
+def suspend_user(user_id):
+    is_suspended = int(request.form.get('is_suspended') or 0)
+    status = SuspendedUserController().SuspendedUser(user_id, is_suspended)
+    
+    if status in ("success", "noop"):
+        msg = "User suspended." if is_suspended else "User unsuspended."
+        flash(msg, "list_user:ok")
+    elif status == "not_found":
+        flash("User not found.", "list_user:err")
+    else:
+        flash("Unexpected error while updating suspension.", "list_user:err")
+
+    return redirect(url_for('admin.list_users'))
+
+@bp.route('/users/bulk-suspend', methods=['POST'])
+@query_budget(3)
+@login_required
+def bulk_suspend_users():
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    # Checked rows from list_users.html; one UPDATE for all of them. The acting admin is never included.
+    is_suspended = int(request.form.get('is_suspended') or 0)
+    res = BulkSuspendUserController().BulkSuspendUsers(
+        request.form.getlist('ids', type=int), is_suspended, exclude_ids=[session.get('user_id')])
+    flash_bulk_result(res, "users", is_suspended, "list_user")
+    return redirect(url_for('admin.list_users', q=request.form.get('q') or None,
+                            page=request.form.get('page', type=int)))
+
+# -----------------------------------------------------------------------------
+# Profiles (CREATE) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/profiles/new', methods=['GET','POST'])
+@login_required
+def create_profile():
+    if request.method == "POST":
+        status = CreateUserProfileController().CreateUserProfile(
+            request.form.get("name", "").strip(),
+            request.form.get("description", "").strip(),
+            1 if request.form.get("is_suspended") else 0
+        )
+        
+        if status == "success":
+            flash("Profile created successfully.", "create_profile:ok")
+        elif status == "duplicate":
+            flash("A profile with this name already exists.", "create_profile:err")
+        elif status == "invalid":
+            flash("Profile name is required.", "create_profile:err")
+        else:
+            flash("An unexpected error occurred while creating the profile.", "create_profile:err")
+
+        return redirect(url_for("admin.create_profile"))
+
+    return render_template("create_profile.html")
+
+# -----------------------------------------------------------------------------
+# Profiles (LIST + SEARCH) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/profiles')
+@query_budget(3)
+@login_required
+def list_profiles():
+    q = (request.args.get('q') or '').strip()
+
+    if q:
+        res = UserProfileSearchController().SearchUserProfile(q)
+    else:
+        res = ListUserProfileController().ListUserProfile()
+
+    if not res["ok"]:
+        for e in res["errors"]:
+            flash(e, "list_profiles:err")
+        return render_template('list_profiles.html', profiles=[], q=q)
+
+    return render_template('list_profiles.html', profiles=res["data"], q=q)
+
+# -----------------------------------------------------------------------------
+# Profiles (UPDATE) - protected
+# -----------------------------------------------------------------------------
+@bp.route("/profiles/<int:profile_id>/edit", methods=["GET", "POST"])
+@login_required
+def edit_profile(profile_id):
+    ctrl = UpdateUserProfileController()
+    profile = ctrl.get(profile_id)
+    
+    if not profile:
+        flash("Profile not found.", "update_profile:err")
+        return redirect(url_for("admin.list_profiles"))
+
+    if request.method == "POST":
+        errors = []
+
+        # --- inline validation here (as you prefer) ---
+        name_n = (request.form.get("name", "") or "").strip()
+        desc_n = request.form.get("description", "") or ""
+        is_susp = int(request.form.get('is_suspended') or 0)
+
+        if not name_n:
+            errors.append("Name is required.")
+
+        if errors:
+            for e in errors:
+                flash(e, "update_profile:err")
+            return render_template("update_profile.html", profile=profile["data"]), 400
+
+        status = ctrl.UpdateUserProfile(profile_id, name_n, desc_n, is_susp)
+
+        if status == "success":
+            flash("Profile updated successfully.", "list_profile:ok")
+            return redirect(url_for("admin.list_profiles"))
+        elif status == "duplicate":
+            flash("A profile with this name already exists.", "update_profile:err")
+        elif status == "not_found":
+            flash("Profile not found.", "update_profile:err")
+            return redirect(url_for("admin.list_profiles"))
+        elif status == "invalid":
+            flash("Profile name cannot be empty.", "update_profile:err")
+        else:
+            flash("An unexpected database error occurred.", "update_profile:err")
+
+    # GET or POST with errors
+    return render_template("update_profile.html", profile=profile["data"])
+ 
+# -----------------------------------------------------------------------------
+# Users Profile (SUSPEND) - protected
+# ----------------------------------------------------------------------------- 
+@bp.route('/profiles/<int:profile_id>/suspend', methods=['POST'])
+@login_required
+def suspend_profile(profile_id):
+    is_suspended = int(request.form.get('is_suspended') or 0)
+    status = SuspendedUserProfileController().SuspendedUserProfile(profile_id, is_suspended)
+
+    if status in ("success", "noop"):
+        flash(("Profile suspended." if is_suspended else "Profile unsuspended."), "list_profile:ok")
+    elif status == "not_found":
+        flash("Profile not found.", "list_profile:err")
+    else:
+        flash("Unexpected error while updating profile.", "list_profile:err")
+
+    return redirect(url_for('admin.list_profiles'))
+
+@bp.route('/profiles/bulk-suspend', methods=['POST'])
+@query_budget(3)
+@login_required
+def bulk_suspend_profiles():
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    is_suspended = int(request.form.get('is_suspended') or 0)
+    res = BulkSuspendUserProfileController().BulkSuspendUserProfiles(
+        request.form.getlist('ids', type=int), is_suspended)
+    flash_bulk_result(res, "profiles", is_suspended, "list_profile")
+    return redirect(url_for('admin.list_profiles', q=request.form.get('q') or None))
+
+@bp.route('/profiles/<int:profile_id>/suspend-users', methods=['POST'])
+@query_budget(3)
+@login_required
+def suspend_profile_users(profile_id):
+    role = (session.get("profile_name") or "").lower()
+    if role != "admin":
+        flash("You do not have permission to access the admin dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+    # "Suspend all users with this profile": one UPDATE ... WHERE profile_id = ?
+    is_suspended = int(request.form.get('is_suspended') or 0)
+    res = BulkSuspendUserController().SuspendUsersByProfile(
+        profile_id, is_suspended, exclude_ids=[session.get('user_id')])
+    flash_bulk_result(res, "users", is_suspended, "list_profile")
+    return redirect(url_for('admin.list_profiles', q=request.form.get('q') or None))
+    
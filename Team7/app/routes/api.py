@@ -0,0 +1,136 @@
+# 📦 File: app/routes/api.py
+# JSON API (v1) for the mobile client: PIN and CSR request listing, detail and search.
+# Uses the same session cookie as the web pages (POST /login first).
+from functools import wraps
+
+from flask import Blueprint, request, session
+
+from ..control.PINControllers import PINRequestsAPIController, PINPageVersionController
+from ..control.CSRControllers import CSRRequestsAPIController, CSRPageVersionController
+from ..http_cache import conditional
+from ..perf import query_budget
+from ..serialization import RequestSerializer, dumps, json_error, json_response
+
+bp = Blueprint('api', __name__, url_prefix='/api/v1')
+bp.record_once(lambda state: RequestSerializer.init_app(state.app))
+
+
+def api_role_required(profile_name):
+    """Like login_required, but answers with JSON 401/403 instead of redirecting."""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped_view(*args, **kwargs):
+            if not session.get("user_id"):
+                return json_error("Not logged in.", 401)
+            if (session.get("profile_name") or "").lower() != profile_name:
+                return json_error("Access denied.", 403)
+            return view_func(*args, **kwargs)
+        return wrapped_view
+    return decorator
+
+
+# Validators: list responses revalidate with ETags like the HTML pages (304 = keep your copy)
+def _my_requests_version(**_view_args):
+    return PINPageVersionController().requests_version(session['user_id'])
+
+
+def _open_requests_version(**_view_args):
+    return CSRPageVersionController().available_requests_version()
+
+
+def _my_shortlist_version(**_view_args):
+    return CSRPageVersionController().shortlist_version(session['user_id'])
+
+
+def _per_page():
+    return request.args.get('per_page', type=int)
+
+
+def _result(result, not_found="Request not found."):
+    # Entity error strings -> JSON errors; anything else is already serialized
+    if result == "not_found":
+        return json_error(not_found, 404)
+    if isinstance(result, str):
+        return json_error("Could not load requests.", 500)
+    return None
+
+
+# -----------------------------------------------------------------------------
+# PIN
+# -----------------------------------------------------------------------------
+@bp.route('/pin/requests')
+@query_budget(3)
+@api_role_required("pin")
+@conditional(_my_requests_version)
+def pin_requests():
+    """?scope=active (default) | history, ?cursor=, ?per_page="""
+    scope = request.args.get('scope', 'active')
+    if scope not in ('active', 'history'):
+        return json_error("scope must be 'active' or 'history'.", 400)
+    result = PINRequestsAPIController().list_requests(
+        session['user_id'], scope, request.args.get('cursor'), _per_page())
+    return _result(result) or json_response(RequestSerializer.page(result))
+
+
+@bp.route('/pin/requests/search')
+@query_budget(4)
+@api_role_required("pin")
+@conditional(_my_requests_version)
+def pin_search_requests():
+    search_term = request.args.get('q', '').strip()
+    if not search_term:
+        return json_error("q is required.", 400)
+    result = PINRequestsAPIController().search_requests(
+        session['user_id'], search_term, request.args.get('cursor'), _per_page())
+    return _result(result) or json_response(RequestSerializer.page(result))
+
+
+@bp.route('/pin/requests/<int:request_id>')
+@query_budget(2)
+@api_role_required("pin")
+def pin_request_detail(request_id):
+    result = PINRequestsAPIController().get_request(request_id, session['user_id'])
+    return _result(result) or json_response(RequestSerializer.fragment(result))
+
+
+# -----------------------------------------------------------------------------
+# CSR
+# -----------------------------------------------------------------------------
+@bp.route('/csr/requests')
+@query_budget(4)
+@api_role_required("csr rep")
+@conditional(_open_requests_version)
+def csr_requests():
+    """Open requests; optional ?q=, ?category=, ?urgency=, ?cursor=, ?per_page="""
+    result = CSRRequestsAPIController().search_available_requests(
+        request.args.get('q', '').strip(),
+        request.args.get('category', '').strip(),
+        request.args.get('urgency', '').strip(),
+        request.args.get('cursor'),
+        _per_page(),
+    )
+    return _result(result) or json_response(RequestSerializer.page(result))
+
+
+@bp.route('/csr/requests/<int:request_id>')
+@query_budget(6)
+@api_role_required("csr rep")
+def csr_request_detail(request_id):
+    result = CSRRequestsAPIController().get_request(request_id, session['user_id'])
+    return _result(result) or json_response(RequestSerializer.fragment(result))
+
+
+@bp.route('/csr/shortlist')
+@query_budget(4)
+@api_role_required("csr rep")
+@conditional(_my_shortlist_version)
+def csr_shortlist():
+    result = CSRRequestsAPIController().search_shortlisted_requests(
+        session['user_id'], request.args.get('q', '').strip())
+    return _result(result) or json_response(RequestSerializer.page(result))
+
+
+@bp.route('/cache')
+@api_role_required("admin")
+def payload_cache_stats():
+    return json_response(dumps(RequestSerializer.cache_stats()))
@@ -0,0 +1,285 @@
+# 📦 File: app/routes/csr.py
+# CSR Representative: search, shortlist, completed services
+from datetime import datetime
+
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash
+
+from ..control.CSRControllers import (
+    CSRSearchAvailableRequestsController,
+    CSRViewRequestDetailsController,
+    CSRSaveToShortlistController,
+    CSRSearchShortlistedRequestsController,
+    CSRViewShortlistedRequestController,
+    CSRRemoveFromShortlistController,
+    CSRViewCompletedServicesController,
+    CSRExportCompletedServicesController,
+    CSRSearchCompletedServicesController,
+    CSRPageVersionController,
+    CSRDashboardSummaryController,
+)
+from ..control.ServiceCategoryController import (
+    ListActiveServiceCategoryController,
+)
+from ..http_cache import conditional
+from ..perf import query_budget
+from ..serialization import EXPORT_FORMATS, export_response
+from . import login_required, role_required
+
+bp = Blueprint('csr', __name__)
+
+
+def _open_requests_version(**_view_args):
+    recommended_for = session.get('user_id') if request.args.get('sort') == 'recommended' else None
+    return CSRPageVersionController().available_requests_version(recommended_for)
+
+
+def _my_shortlist_version(**_view_args):
+    # Shortlist and completed-services pages are both built from this CSR's shortlist rows
+    return CSRPageVersionController().shortlist_version(session.get('user_id'))
+
+#CSR ROUTES 
+# -----------------------------------------------------------------------------
+@bp.route('/csr/dashboard')
+@query_budget(2)
+@login_required
+def csr_dashboard():
+    #BOUNDARY for: As CSR, I want to access my dashboard#
+    if session.get("profile_name", "").lower() != "csr rep": 
+        flash("Access denied. CSR Representative profile required.", "error")
+        return redirect(url_for("boundary.on_login"))
+    # My shortlist per request status (one GROUP BY, cached for DASHBOARD_SUMMARY_TTL)
+    summary = CSRDashboardSummaryController().get_summary(session.get('user_id'))
+    if isinstance(summary, str):
+        flash(f"Could not load your shortlist counts: {summary}", "error")
+        summary = None
+    return render_template('csr_dashboard.html', summary=summary)
+    
+    
+# User Story 1 Boundary
+@bp.route('/csr/requests/search')
+@query_budget(9)
+@login_required
+@role_required("csr rep")
+@conditional(_open_requests_version)
+def csr_search_available_requests():
+    #BOUNDARY for: As CSR, I want to search for available service requests#
+    search_term = request.args.get('q', '').strip()
+    category = request.args.get('category', '').strip()
+    urgency = request.args.get('urgency', '').strip()
+    sort = request.args.get('sort', 'newest')
+    if sort not in ('newest', 'recommended'):
+        sort = 'newest'
+    
+    res = ListActiveServiceCategoryController().ListActiveServiceCategory()
+    categories = res.get("data", [])
+    
+    ctrl = CSRSearchAvailableRequestsController()
+    # Views and shortlist changes also bump the request's updated_at, so the
+    # ETag of _open_requests_version already changes when these flags do
+    result = ctrl.search_available_requests(search_term, category, urgency, request.args.get('cursor'),
+                                            csr_company_id=session.get('user_id'), sort=sort)
+    
+    if isinstance(result, str):
+        flash("Error searching requests.", "error")
+        requests = []
+    else:
+        requests = result
+    
+    return render_template('csr_search_requests.html', 
+                         requests=requests, 
+                         search_term=search_term,
+                         selected_category=category,
+                         urgency=urgency,
+                         sort=sort,
+                         available_categories=categories)
+
+
+@bp.route('/csr/requests/<int:request_id>')
+@query_budget(8)
+@login_required
+def csr_view_request_details(request_id):
+    #BOUNDARY for: As CSR, I want to view detailed information about a service request#
+    if session.get("profile_name", "").lower() != "csr rep": 
+        flash("Access denied.", "error")
+        return redirect(url_for("boundary.on_login"))
+    
+    csr_company_id = session.get('user_id')
+    
+    ctrl = CSRViewRequestDetailsController()
+    result = ctrl.get_request_details(request_id, csr_company_id)
+    
+    if isinstance(result, str):
+        flash("Request not found.", "error")
+        return redirect(url_for('csr.csr_search_available_requests'))
+    
+    return render_template('csr_request_details.html', request=result)
+
+
+@bp.route('/csr/shortlist/add/<int:request_id>', methods=['POST'])
+@login_required
+def csr_save_to_shortlist(request_id):
+    #BOUNDARY for: As CSR, I want to save interesting requests to a shortlist#
+    if session.get("profile_name", "").lower() != "csr rep": 
+        flash("Access denied.", "error")
+        return redirect(url_for("boundary.on_login"))
+    
+    csr_company_id = session.get('user_id')
+    ctrl = CSRSaveToShortlistController()
+    result = ctrl.add_to_shortlist(request_id, csr_company_id)
+    
+    if result == "success":
+        flash("Request added to shortlist!", "ok")
+    elif result == "already_shortlisted":
+        flash("Request is already in your shortlist.", "info")
+    else:
+        flash("Error adding to shortlist.", "error")
+    
+    return redirect(url_for('csr.csr_search_available_requests'))
+
+
+
+@bp.route('/csr/shortlist/search')
+@query_budget(4)
+@login_required
+@role_required("csr rep")
+@conditional(_my_shortlist_version)
+def csr_search_shortlisted_requests():
+    #BOUNDARY for: As CSR, I want to search through my shortlisted requests#
+    search_term = request.args.get('q', '').strip()
+    csr_company_id = session.get('user_id')
+    
+    ctrl = CSRSearchShortlistedRequestsController()
+    result = ctrl.search_shortlisted_requests(csr_company_id, search_term)
+    
+    if isinstance(result, str):
+        flash("Error loading shortlist.", "error")
+        requests = []
+    else:
+        requests = result
+    
+    return render_template('csr_shortlist.html', 
+                         requests=requests, 
+                         search_term=search_term)
+
+
+@bp.route('/csr/shortlist/<int:request_id>')
+@query_budget(5)
+@login_required
+@role_required("csr rep")
+@conditional(_my_shortlist_version)
+def csr_view_shortlisted_request(request_id):
+    #BOUNDARY for: As CSR, I want to view the details of my shortlisted requests#
+    csr_company_id = session.get('user_id')
+    ctrl = CSRViewShortlistedRequestController()
+    result = ctrl.get_shortlisted_request_details(request_id, csr_company_id)
+    
+    if isinstance(result, str):
+        flash("Request not found in your shortlist.", "error")
+        return redirect(url_for('csr.csr_search_shortlisted_requests'))
+    
+    return render_template('csr_shortlisted_request_details.html', request=result)
+
+
+@bp.route('/csr/shortlist/remove/<int:request_id>', methods=['POST'])
+@login_required
+def csr_remove_from_shortlist(request_id):
+    #BOUNDARY for removing from shortlist#
+    if session.get("profile_name", "").lower() != "csr rep": 
+        flash("Access denied.", "error")
+        return redirect(url_for("boundary.on_login"))
+    
+    csr_company_id = session.get('user_id')
+    ctrl = CSRRemoveFromShortlistController()
+    result = ctrl.remove_from_shortlist(request_id, csr_company_id)
+    
+    if result == "success":
+        flash("Request removed from shortlist.", "ok")
+    else:
+        flash("Error removing from shortlist.", "error")
+    
+    return redirect(url_for('csr.csr_search_shortlisted_requests'))
+    
+    
+@bp.route('/csr/services/completed/history')
+@query_budget(4)
+@login_required
+@role_required("csr rep")
+@conditional(_my_shortlist_version)
+def csr_completed_services_history():
+    #BOUNDARY for: As CSR Representative, I want to view the history of completed volunteer services#
+    csr_company_id = session.get('user_id')
+    
+    ctrl = CSRViewCompletedServicesController()
+    result = ctrl.get_completed_services_history(csr_company_id, request.args.get('cursor'))
+    
+    if isinstance(result, str):
+        flash("Error loading completed services history.", "error")
+        services = []
+    else:
+        services = result
+    
+    return render_template('csr_completed_services.html', 
+                         services=services,
+                         search_category=None,
+                         search_date=None,
+                         current_page='history')
+
+
+@bp.route('/csr/services/completed/export')
+@query_budget(1)
+@login_required
+def csr_export_completed_services():
+    #BOUNDARY for: As CSR Representative, I want to export my completed services (?format=csv|ndjson, ?gzip=1)#
+    if session.get("profile_name", "").lower() != "csr rep": 
+        flash("Access denied.", "error")
+        return redirect(url_for("boundary.on_login"))
+
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        flash("Unknown export format.", "error")
+        return redirect(url_for('csr.csr_completed_services_history'))
+
+    result = CSRExportCompletedServicesController().export_completed_services(session.get('user_id'))
+    if isinstance(result, str):
+        flash("Error exporting completed services.", "error")
+        return redirect(url_for('csr.csr_completed_services_history'))
+
+    return export_response(result, fmt, "completed_services", compress=request.args.get('gzip') == '1')
+
+
+@bp.route('/csr/services/completed/search')
+@query_budget(4)
+@login_required
+@role_required("csr rep")
+@conditional(_my_shortlist_version)
+def csr_search_completed_services():
+    #BOUNDARY for: As CSR Representative, I want to search for completed volunteer services by type and date#
+    csr_company_id = session.get('user_id')
+    
+    # BOUNDARY: Get search parameters
+    search_title = request.args.get('title', '').strip()
+    search_date = request.args.get('date', '').strip()
+    
+    # BOUNDARY: Validate date format
+    parsed_date = None
+    if search_date:
+        try:
+            parsed_date = datetime.strptime(search_date, '%Y-%m-%d').date()
+        except ValueError:
+            flash("Invalid date format. Use YYYY-MM-DD.", "error")
+            search_date = ""
+    
+    ctrl = CSRSearchCompletedServicesController()
+    result = ctrl.search_completed_services(csr_company_id, search_title, parsed_date)
+    
+    if isinstance(result, str):
+        flash("Error searching completed services.", "error")
+        services = []
+    else:
+        services = result
+    
+    return render_template('csr_completed_services.html', 
+                         services=services,
+                         search_title=search_title,
+                         search_date=search_date,
+                         current_page='search')
@@ -0,0 +1,480 @@
+# 📦 File: app/routes/pin.py
+# PIN: requests, analytics, completed matches
+from datetime import datetime
+
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash
+
+from ..control.PINControllers import (
+    PINCreateRequestController,
+    PINViewRequestsController,
+    PINSuspendRequestController,
+    PINViewHistoryController,
+    PINExportHistoryController,
+    PINSearchRequestsController,
+    PINUpdateRequestController,
+    PINRequestViewCountController,
+    PINRequestShortlistCountController,
+    PINRequestActivityController,
+    PINCompletedMatchesSearchController,
+    PINCompletedMatchesHistoryController,
+    PINPageVersionController,
+    PINDashboardSummaryController,
+)
+from ..control.ServiceCategoryController import (
+    ListActiveServiceCategoryController,
+)
+from ..http_cache import conditional
+from ..perf import query_budget
+from ..serialization import EXPORT_FORMATS, export_response
+from . import login_required, role_required
+
+bp = Blueprint('pin', __name__)
+
+
+def _my_requests_version(**_view_args):
+    # Validator for every page built from this PIN's requests (lists, search)
+    return PINPageVersionController().requests_version(session.get('user_id'))
+
+
+def _analytics_version(**_view_args):
+    # Same data, but the series window moves every hour even when nothing is recorded
+    version = _my_requests_version()
+    if isinstance(version, str):
+        return version
+    return version + (datetime.utcnow().strftime('%Y-%m-%d %H'),)
+
+#PIN ROUTES 
+# -----------------------------------------------------------------------------
+
+#landing page for PIN#
+@bp.route('/pin/dashboard')
+@query_budget(2)
+@login_required
+def pin_dashboard():
+    if session.get("profile_name", "").lower() != "pin":  
+        flash("Access denied. PIN profile required.", "error")
+        return redirect(url_for("boundary.on_login"))
+    # My requests per status (one GROUP BY, cached for DASHBOARD_SUMMARY_TTL)
+    summary = PINDashboardSummaryController().get_summary(session.get('user_id'))
+    if isinstance(summary, str):
+        flash(f"Could not load your request counts: {summary}", "error")
+        summary = None
+    return render_template('pin_dashboard.html', summary=summary)
+
+@bp.route('/pin/requests/new', methods=['GET', 'POST'])
+@login_required
+def create_request():
+    #BOUNDARY for: As PIN, I want to create requests#
+    if session.get("profile_name", "").lower() != "pin":  
+        flash("Access denied. PIN profile required.", "error")
+        return redirect(url_for("boundary.on_login"))
+     
+    # 🔹 Get active categories (cached list[CategoryRow])
+    res = ListActiveServiceCategoryController().ListActiveServiceCategory()
+    categories = res.get("data", [])
+    
+    if request.method == 'POST':
+        # BOUNDARY: Handle ALL user input validation
+        title = (request.form.get('title', '') or '').strip()
+        description = (request.form.get('description', '') or '').strip()
+        category = (request.form.get('category', '') or '').strip()
+        
+        errors = []
+        if not title:
+            errors.append("Title is required.")
+        if not description:
+            errors.append("Description is required.")
+        if not category:
+            errors.append("Category is required.")
+        if len(title) < 5:
+            errors.append("Title must be at least 5 characters.")
+        if len(description) < 10:
+            errors.append("Description must be at least 10 characters.")
+        
+        # BOUNDARY: Handle date validation
+        preferred_date = None
+        date_str = request.form.get('preferred_date', '')
+        if date_str:
+            try:
+                preferred_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                if preferred_date < datetime.now().date():
+                    errors.append("Preferred date cannot be in the past.")
+            except ValueError:
+                errors.append("Invalid date format. Use YYYY-MM-DD.")
+        
+        if errors:
+            for e in errors:
+                flash(e, "err")
+            return render_template('create_request.html', categories=categories), 400
+        
+        # Prepare clean data for controller
+        request_data = {
+            'pin_id': session.get('user_id'),
+            'title': title,
+            'description': description,
+            'category': category,
+            'urgency': request.form.get('urgency', 'medium'),
+            'location': (request.form.get('location', '') or '').strip(),
+            'preferred_date': preferred_date
+        }
+        
+        # CONTROL: Pure data passing to story-specific controller
+        ctrl = PINCreateRequestController()
+        result = ctrl.create_pin_request(request_data)
+        
+        # BOUNDARY: Handle display to user
+        if result == "success":
+            flash("Request created successfully.", "ok")
+            return redirect(url_for('pin.pin_requests'))
+        else:
+            flash(result, "err")  
+    
+    return render_template('create_request.html', categories=categories)
+
+
+@bp.route('/pin/requests')
+@query_budget(4)
+@login_required
+@role_required("pin", "Access denied. PIN profile required.")
+@conditional(_my_requests_version)
+def pin_requests():
+    #BOUNDARY for: As PIN, I want to view my active requests#
+    # BOUNDARY: Call controller
+    ctrl = PINViewRequestsController()
+    result = ctrl.get_active_requests(session.get('user_id'), request.args.get('cursor'))
+    
+    # BOUNDARY: Handle display
+    if type(result) == str:
+    	flash(result, "err")
+    	requests = []
+    else:  
+    	requests = result  #success with request list
+
+    return render_template('pin_requests.html', requests=requests, current_page='active')
+
+
+@bp.route('/pin/requests/history')
+@query_budget(4)
+@login_required
+@role_required("pin", "Access denied. PIN profile required.")
+@conditional(_my_requests_version)
+def request_history():
+    #BOUNDARY for: As PIN, I want to view my request history#
+    # BOUNDARY: Call controller
+    ctrl = PINViewHistoryController()
+    result = ctrl.get_request_history(session.get('user_id'), request.args.get('cursor'))
+    
+    # BOUNDARY: Handle display
+    if type(result) == str:
+    	flash(result, "err")
+    	requests = []
+    else:  
+    	requests = result  #success with request list
+    
+    return render_template('pin_requests.html', requests=requests, title="Request History", current_page='history')
+
+
+@bp.route('/pin/requests/history/export')
+@query_budget(1)
+@login_required
+def export_request_history():
+    #BOUNDARY for: As PIN, I want to export my request history (?format=csv|ndjson, ?gzip=1)#
+    if session.get("profile_name", "").lower() != "pin": 
+        flash("Access denied. PIN profile required.", "error")
+        return redirect(url_for("boundary.on_login"))
+
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        flash("Unknown export format.", "error")
+        return redirect(url_for('pin.request_history'))
+
+    # BOUNDARY: Call controller
+    result = PINExportHistoryController().export_request_history(session.get('user_id'))
+    if isinstance(result, str):
+        flash("Error exporting request history.", "error")
+        return redirect(url_for('pin.request_history'))
+
+    return export_response(result, fmt, "request_history", compress=request.args.get('gzip') == '1')
+
+
+
+@bp.route('/pin/requests/<int:request_id>/suspend', methods=['POST'])
+@login_required
+def suspend_request(request_id):
+    #BOUNDARY for: As PIN, I want to suspend my requests#
+    if session.get("profile_name", "").lower() != "pin": 
+        flash("Access denied. PIN profile required.", "error")
+        return redirect(url_for("boundary.on_login"))
+    
+    # CONTROL: Pure data passing to story-specific controller
+    ctrl = PINSuspendRequestController()
+    result = ctrl.suspend_pin_request(request_id, session.get('user_id'))
+    
+    # BOUNDARY: Handle display to user
+    if result == "success":
+        flash("Request suspended.", "suspend_request:ok")
+    else:
+        flash(result, "suspend_request:err")  # Show database error
+    
+    return redirect(url_for('pin.pin_requests'))
+
+
+
+@bp.route('/pin/requests/search', methods=['GET'])
+@query_budget(5)
+@login_required
+@role_required("pin", "Access denied. PIN profile required.")
+@conditional(_my_requests_version)
+def search_requests():
+    #BOUNDARY for: As PIN, I want to search my requests#
+    # BOUNDARY: Get user input
+    search_term = request.args.get('q', '').strip()
+    pin_id = session.get('user_id')
+    current_page = request.args.get('page', 'active')  # Get the page context
+    
+    # BOUNDARY: Handle empty search - stay on current page
+    if not search_term:
+        flash("Please enter a search term", "error")
+        if current_page == 'history':
+            return redirect(url_for('pin.request_history'))
+        else:
+            return redirect(url_for('pin.pin_requests'))
+    
+    # BOUNDARY: Call controller
+    ctrl = PINSearchRequestsController()
+    result = ctrl.search_pin_requests(pin_id, search_term, request.args.get('cursor'))
+    
+    # BOUNDARY: Handle user display
+    if isinstance(result, str):  #  String = error
+        flash(f"No requests found for '{search_term}'", "info")
+        requests = []
+    else:  # storing request object
+        requests = result
+       
+    
+    # Stay on the same page type (history vs active)
+    template_data = {
+        'requests': requests, 
+        'search_term': search_term,
+        'current_page': current_page
+    }
+    
+    # Set appropriate title based on page context
+    if current_page == 'history':
+        template_data['title'] = f"Search Results for '{search_term}' - History"
+    else:
+        template_data['title'] = f"Search Results for '{search_term}'"
+    
+    return render_template('pin_requests.html', **template_data)
+
+
+
+
+
+@bp.route('/pin/requests/<int:request_id>/edit', methods=['GET', 'POST'])
+@login_required
+def edit_request(request_id):
+    # BOUNDARY: User interaction ONLY
+    if session.get("profile_name", "").lower() != "pin": 
+        flash("Access denied. PIN profile required.", "error")
+        return redirect(url_for("boundary.on_login"))
+    
+    pin_id = session.get('user_id')
+    ctrl = PINUpdateRequestController()
+    
+    res = ListActiveServiceCategoryController().ListActiveServiceCategory()  # cached list[CategoryRow]
+    categories = res.get("data", [])
+    
+    # GET: Get request data through controller for display
+    if request.method == 'GET':
+        result = ctrl.get_request_for_display(request_id, pin_id)
+        
+        if isinstance(result, str):
+            if result == "not_found":
+                flash("Request not found or access denied.", "error")
+            elif result == "can_only_edit_active":
+                flash("Can only edit active requests (pending, approved, or in progress).", "error")
+            else:
+                flash("Error loading request.", "error")
+            return redirect(url_for('pin.pin_requests'))
+        
+        # BOUNDARY: Render template with actual request data
+        return render_template('edit_request.html', request=result, categories=categories)
+    
+    # POST: Handle form submission
+    if request.method == 'POST':
+        title = (request.form.get('title', '') or '').strip()
+        description = (request.form.get('description', '') or '').strip()
+        category = (request.form.get('category', '') or '').strip()
+        
+        errors = []
+        if not title: errors.append("Title is required.")
+        if not description: errors.append("Description is required.")
+        if not category: errors.append("Category is required.")
+        if len(title) < 5: errors.append("Title must be at least 5 characters.")
+        if len(description) < 10: errors.append("Description must be at least 10 characters.")
+        
+        preferred_date = None
+        date_str = request.form.get('preferred_date', '')
+        if date_str:
+            try:
+                preferred_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                if preferred_date < datetime.now().date():
+                    errors.append("Preferred date cannot be in the past.")
+            except ValueError:
+                errors.append("Invalid date format. Use YYYY-MM-DD.")
+        
+        if errors:
+            for e in errors:
+                flash(e, "error")
+            # Get current data through controller for re-rendering
+            current_result = ctrl.get_request_for_display(request_id, pin_id)
+            if isinstance(current_result, str):
+                return redirect(url_for('pin.pin_requests'))
+            return render_template('edit_request.html', request=current_result, categories=categories), 400
+        
+        # BOUNDARY: Prepare data for controller
+        update_data = {
+            'title': title,
+            'description': description,
+            'category': category,
+            'urgency': request.form.get('urgency', 'medium'),
+            'location': (request.form.get('location', '') or '').strip(),
+            'preferred_date': preferred_date
+        }
+        
+        # BOUNDARY: Call controller
+        result = ctrl.update_request(request_id, pin_id, update_data)
+        
+        # BOUNDARY: Handle user feedback
+        if result == "success":
+            flash("Request updated successfully!", "ok")
+            return redirect(url_for('pin.pin_requests'))
+        elif result == "can_only_update_active":
+            flash("Can only update active requests.", "error")
+        else:
+            flash("Error updating request.", "error")
+            
+        return redirect(url_for('pin.pin_requests'))
+        
+@bp.route('/pin/requests/<int:request_id>/analytics')
+@query_budget(7)
+@login_required
+@role_required("pin", "Access denied. PIN profile required.")
+@conditional(_analytics_version)
+def pin_request_analytics(request_id):
+    #BOUNDARY for: As PIN, I want to see how many times my request has been viewed and shortlisted#
+    pin_id = session.get('user_id')
+    # ?range=24h|7d|30d|90d
+    range_key = request.args.get('range', PINRequestActivityController.DEFAULT_RANGE)
+    if range_key not in PINRequestActivityController.RANGES:
+        range_key = PINRequestActivityController.DEFAULT_RANGE
+    
+    # BOUNDARY: Get request details for context
+    request_ctrl = PINUpdateRequestController()
+    pin_request = request_ctrl.get_request_for_display(request_id, pin_id)
+    
+    if isinstance(pin_request, str):
+        if pin_request == "not_found":
+            flash("Request not found or access denied.", "error")
+        elif pin_request == "can_only_edit_active":
+            flash("Cannot view analytics for this request.", "error")
+        else:
+            flash("Error loading request details.", "error")
+        return redirect(url_for('pin.pin_requests'))
+    
+    # BOUNDARY: Call specific controllers for view and shortlist counts
+    view_ctrl = PINRequestViewCountController()
+    shortlist_ctrl = PINRequestShortlistCountController()
+    
+    view_count = view_ctrl.get_view_count(request_id, pin_id)
+    shortlist_count = shortlist_ctrl.get_shortlist_count(request_id, pin_id)
+    
+    # BOUNDARY: Views / shortlists per hour or day
+    series = PINRequestActivityController().get_activity_series(request_id, pin_id, range_key)
+    
+    # BOUNDARY: Handle errors
+    if isinstance(view_count, str) or isinstance(shortlist_count, str) or isinstance(series, str):
+        flash("Error loading analytics data.", "error")
+        return redirect(url_for('pin.pin_requests'))
+    
+    return render_template('pin_request_analytics.html', 
+                         request=pin_request, 
+                         view_count=view_count,
+                         shortlist_count=shortlist_count,
+                         series=series,
+                         range_key=range_key,
+                         ranges=PINRequestActivityController.RANGES)
+
+# 🆕 NEW: PIN Completed Matches History (User Story 4)
+@bp.route('/pin/matches/completed/history')
+@query_budget(4)
+@login_required
+@role_required("pin", "Access denied. PIN profile required.")
+@conditional(_my_requests_version)
+def pin_completed_matches_history():
+    #BOUNDARY for: As PIN, I want to view the history of my completed matches#
+    pin_id = session.get('user_id')
+    
+    # BOUNDARY: Call specific controller
+    ctrl = PINCompletedMatchesHistoryController()
+    result = ctrl.get_completed_matches_history(pin_id, request.args.get('cursor'))
+    
+    # BOUNDARY: Handle display
+    if isinstance(result, str):
+        flash("Error loading completed matches history.", "error")
+        matches = []
+    else:
+        matches = result
+    
+    return render_template('pin_completed_matches.html', 
+                         matches=matches,
+                         search_category=None,
+                         search_date=None)
+
+# 🆕 NEW: PIN Search Completed Matches (User Story 3)
+@bp.route('/pin/matches/completed/search')
+@query_budget(4)
+@login_required
+@role_required("pin", "Access denied. PIN profile required.")
+@conditional(_my_requests_version)
+def pin_search_completed_matches():
+    #BOUNDARY for: As PIN, I want to search my completed matches by service type and date#
+    pin_id = session.get('user_id')
+    
+    # BOUNDARY: Get search parameters
+    search_title = request.args.get('title', '').strip()
+    search_date = request.args.get('date', '').strip()
+    
+    # BOUNDARY: Validate date format
+    parsed_date = None
+    if search_date:
+        try:
+            parsed_date = datetime.strptime(search_date, '%Y-%m-%d').date()
+        except ValueError:
+            flash("Invalid date format. Use YYYY-MM-DD.", "error")
+            search_date = ""
+    
+    # BOUNDARY: Call specific controller
+    ctrl = PINCompletedMatchesSearchController()
+    result = ctrl.search_completed_matches(pin_id, search_title, parsed_date)
+    
+    # BOUNDARY: Handle display
+    if isinstance(result, str):
+        flash("Error searching completed matches.", "error")
+        return render_template('pin_completed_matches.html', 
+                         matches=[],
+                         search_title=search_title,
+                         search_date=search_date)
+    else:
+        matches = result
+    
+    return render_template('pin_completed_matches.html', 
+                         matches=matches,
+                         search_title=search_title,
+                         search_date=search_date)
+        
+        
+        
+        
+        
@@ -0,0 +1,155 @@
+# 📦 File: app/routes/platform_management.py
+# Platform Management: service categories
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash
+
+from ..control.ServiceCategoryController import (
+    CreateServiceCategoryController,
+    ListServiceCategoryController,
+    ListActiveServiceCategoryController,
+    UpdateServiceCategoryController,
+    SearchServiceCategoryController,
+    SuspendedServiceCategoryController,
+    BulkSuspendServiceCategoryController,
+    ServiceCategorySummaryController,
+)
+from ..perf import query_budget
+from . import login_required, flash_bulk_result
+
+bp = Blueprint('platform', __name__)
+
+# -----------------------------------------------------------------------------
+# Service Category dashboard
+# -----------------------------------------------------------------------------
+@bp.route('/service-categories/dashboard')
+@query_budget(3)
+@login_required
+def service_category_dashboard():
+    # Allow admins or platform management (adjust to your roles)
+    role = (session.get("profile_name") or "").lower()
+    if role not in ("admin", "platform management"):
+        flash("You do not have permission to access Service Category Dashboard.", "error")
+        return redirect(url_for('boundary.home'))
+
+    # Requests per category and status (one GROUP BY, cached for DASHBOARD_SUMMARY_TTL)
+    summary = ServiceCategorySummaryController().get_summary()
+    if isinstance(summary, str):
+        flash(f"Could not load request counts: {summary}", "error")
+        summary = None
+    return render_template("ServiceCategoryDashboard.html", summary=summary,
+                           category_cache=ListActiveServiceCategoryController().cache_stats())
+
+# -----------------------------------------------------------------------------
+# Service Category (CREATE) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/categories/create', methods=['GET', 'POST'])
+@login_required
+def create_service_category():
+    if request.method == 'POST':
+        name = request.form.get('name').strip()
+        description = request.form.get('description').strip()
+        is_suspended = int(request.form.get('is_suspended') or 0)
+
+        status = CreateServiceCategoryController().CreateServiceCategory(name, description, is_suspended)
+
+        if status == "success":
+            flash('Category created successfully.', 'create_service:ok')
+            return redirect(url_for('platform.create_service_category'))
+        elif status == "duplicate":
+            flash('A category with this name already exists.', 'create_service:err')
+        elif status == "invalid":
+            flash('Category name is required.', 'create_service:err')
+        else:
+            flash('An unexpected database error occurred.', 'create_service:err')
+
+    return render_template('create_service_category.html')
+
+# -----------------------------------------------------------------------------
+# Service Category (LIST + SEARCH) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/categories', methods=['GET'])
+@query_budget(4)
+@login_required
+def list_service_categories():
+    q = (request.args.get('q') or '').strip()
+    page = request.args.get('page', default=1, type=int)  # pass None to disable pagination
+    per_page = 20
+    
+    if q:
+        res = SearchServiceCategoryController().SearchServiceCategory(q)
+    else:
+        res = ListServiceCategoryController().ListServiceCategory(page=page, per_page=per_page)
+
+    if not res["ok"]:
+        for e in res.get("errors", []):
+            flash(e, "list_service_categories:err")
+        return render_template('list_service_categories.html', categories=[], q=q, pagination=None)
+
+    return render_template('list_service_categories.html', categories=res.get("data", []), q=q, pagination=res.get("pagination"))
+
+# -----------------------------------------------------------------------------
+# Service Category (UPDATE) - protected
+# -----------------------------------------------------------------------------
+@bp.route('/categories/<int:category_id>/edit', methods=['GET', 'POST'])
+@login_required
+def update_service_category(category_id):
+    ctrl = UpdateServiceCategoryController()
+    row = ctrl.get(category_id)
+    
+    if not row['ok']:
+        flash('Category not found.', 'list_service:err')
+        return redirect(url_for('platform.list_service_categories'))
+
+    if request.method == 'POST':
+        name = (request.form.get('name', '') or '').strip()
+        description = (request.form.get('description', '') or '').strip()
+        is_suspended = int(request.form.get('is_suspended') or 0)
+        
+        status = ctrl.UpdateServiceCategory(category_id, name, description, is_suspended)
+
+        if status == "success":
+            flash("Category updated successfully.", "list_service:ok")
+            return redirect(url_for("platform.list_service_categories"))
+        elif status == "duplicate":
+            flash("Another category with this name already exists.", "update_service:err")
+        elif status == "not_found":
+            flash("Category not found.", "list_service:err")
+            return redirect(url_for("platform.list_service_categories"))
+        elif status == "invalid":
+            flash("Category name cannot be empty.", "update_service:err")
+        else:
+            flash("Unexpected database error while updating category.", "update_service:err")
+
+    return render_template("update_service_category.html", category=row["data"])
+    
+# -----------------------------------------------------------------------------
+# Service Category (SUSPEND) - protected
+# ----------------------------------------------------------------------------- 
+@bp.route('/categories/<int:category_id>/suspend', methods=['POST'])
+@login_required
+def suspend_service_category(category_id):
+    is_suspended = int(request.form.get('is_suspended') or 0)
+    status = SuspendedServiceCategoryController().SuspendedServiceCategory(category_id, is_suspended)
+
+    if status in ("success", "noop"):
+        flash(("Category suspended." if is_suspended else "Category unsuspended."), "list_service:ok")
+    elif status == "not_found":
+        flash("Category not found.", "list_service:err")
+    else:
+        flash("Unexpected error while updating category.", "list_service:err")
+
+    return redirect(url_for('platform.list_service_categories'))
+
+@bp.route('/categories/bulk-suspend', methods=['POST'])
+@query_budget(3)
+@login_required
+def bulk_suspend_service_categories():
+    role = (session.get("profile_name") or "").lower()
+    if role not in ("admin", "platform management"):
+        flash("You do not have permission to manage service categories.", "error")
+        return redirect(url_for('boundary.home'))
+    is_suspended = int(request.form.get('is_suspended') or 0)
+    res = BulkSuspendServiceCategoryController().BulkSuspendServiceCategories(
+        request.form.getlist('ids', type=int), is_suspended)
+    flash_bulk_result(res, "categories", is_suspended, "list_service")
+    return redirect(url_for('platform.list_service_categories', q=request.form.get('q') or None,
+                            page=request.form.get('page', type=int)))
@@ -0,0 +1,178 @@
+# 📦 File: app/serialization.py
+import csv
+import io
+import json
+import zlib
+
+from flask import Response, stream_with_context
+
+from .cache import TTLCache
+from .entity.Request import Request
+from .entity.RequestSearchIndex import RequestSearchIndex
+
+try:
+    import orjson  # optional: several times faster than the json module
+except ImportError:
+    orjson = None
+
+# json.dumps() with non-default options builds a new encoder per call; reuse one
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+EXPORT_ROWS_PER_CHUNK = 500
+
+
+def dumps(value) -> bytes:
+    """Compact UTF-8 JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return _encoder.encode(value).encode()
+
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    return Response(body, status=status, mimetype="application/json")
+
+
+def json_error(message: str, status: int) -> Response:
+    return json_response(dumps({"error": message}), status)
+
+
+class RequestSerializer:
+    """
+    JSON for the request API, built from `Request.projected` rows (plain
+    column values, no ORM objects). Each request's JSON object is encoded
+    once and cached as bytes under (id, updated_at): every write goes
+    through SQLAlchemy, whose onupdate bumps updated_at even for Core
+    UPDATEs such as the view/shortlist counters, so a changed row gets a new
+    key. A list response is then one join over cached fragments; only rows
+    not seen before are encoded.
+    """
+
+    FIELDS = Request.API_FIELDS
+    _DATE_INDEXES = tuple(i for i, name in enumerate(FIELDS) if name in ("preferred_date", "created_at", "updated_at"))
+    _payloads = TTLCache(max_size=20_000, ttl=600, name="request_json")
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("API_PAYLOAD_CACHE_SIZE", 20_000)
+        app.config.setdefault("API_PAYLOAD_CACHE_TTL", 600)
+        cls._payloads = TTLCache(
+            max_size=int(app.config["API_PAYLOAD_CACHE_SIZE"]),
+            ttl=float(app.config["API_PAYLOAD_CACHE_TTL"]),
+            name="request_json",
+        )
+
+    @classmethod
+    def values(cls, row) -> list:
+        # Projected rows start with FIELDS, in order; search rows have extra columns after them
+        values = list(row[:len(cls.FIELDS)])
+        for i in cls._DATE_INDEXES:
+            if values[i] is not None:
+                values[i] = values[i].isoformat()
+        return values
+
+    @classmethod
+    def _encode(cls, row) -> bytes:
+        return dumps(dict(zip(cls.FIELDS, cls.values(row))))
+
+    @classmethod
+    def fragments(cls, rows) -> list:
+        """Encoded JSON objects for `rows`: one cache lookup for all, then only the misses encoded."""
+        keys = [(row.id, row.updated_at) for row in rows]
+        payloads = cls._payloads.get_many(keys)
+        missing = {key: cls._encode(row) for key, row in zip(keys, rows) if key not in payloads}
+        if missing:
+            cls._payloads.set_many(missing)
+            payloads.update(missing)
+        return [payloads[key] for key in keys]
+
+    @classmethod
+    def fragment(cls, row) -> bytes:
+        return cls.fragments([row])[0]
+
+    @staticmethod
+    def _marked(text) -> str:
+        return (text or "").replace(RequestSearchIndex.MARK_START, "<mark>").replace(RequestSearchIndex.MARK_END, "</mark>")
+
+    @classmethod
+    def items(cls, rows) -> bytes:
+        """A JSON array of request objects, search highlights spliced in when present."""
+        parts = cls.fragments(rows)
+        if rows and "search_title" in rows[0]._fields:
+            # Full-text search rows: highlights depend on the query, so they are never cached
+            parts = [
+                payload[:-1] + b',"highlight":'
+                + dumps({"title": cls._marked(row.search_title), "snippet": cls._marked(row.search_snippet)}) + b"}"
+                for payload, row in zip(parts, rows)
+            ]
+        return b"[" + b",".join(parts) + b"]"
+
+    @classmethod
+    def page(cls, rows) -> bytes:
+        """{"items": [...], "next_cursor": ..., "prev_cursor": ...} for a KeysetPage or plain list."""
+        cursors = dumps({
+            "next_cursor": getattr(rows, "next_cursor", None),
+            "prev_cursor": getattr(rows, "prev_cursor", None),
+        })
+        return b'{"items":' + cls.items(rows) + b"," + cursors[1:]
+
+    @classmethod
+    def cache_stats(cls) -> dict:
+        return cls._payloads.stats()
+
+    # -------------------------------
+    # Streaming exports
+    # -------------------------------
+    @classmethod
+    def csv_chunks(cls, rows, rows_per_chunk: int = EXPORT_ROWS_PER_CHUNK):
+        """CSV (header + one line per row) as byte chunks; payloads are not cached."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(cls.FIELDS)
+        for n, row in enumerate(rows, 1):
+            # A leading = + - @ would make spreadsheet apps run user text as a formula
+            writer.writerow(["'" + v if isinstance(v, str) and v.startswith(("=", "+", "-", "@")) else v
+                             for v in cls.values(row)])
+            if n % rows_per_chunk == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    @classmethod
+    def ndjson_chunks(cls, rows, rows_per_chunk: int = EXPORT_ROWS_PER_CHUNK):
+        """One JSON object per line, as byte chunks."""
+        lines = []
+        for row in rows:
+            lines.append(cls._encode(row))
+            if len(lines) == rows_per_chunk:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+
+
+def _gzipped(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_response(rows, fmt: str, filename: str, compress: bool = False) -> Response:
+    """
+    Stream request rows (e.g. a yield_per result) as a CSV or NDJSON download,
+    optionally gzip-compressed on the fly. Memory stays constant: one batch of
+    rows and one output chunk at a time.
+    """
+    chunks = RequestSerializer.csv_chunks(rows) if fmt == "csv" else RequestSerializer.ndjson_chunks(rows)
+    filename, mimetype = f"{filename}.{fmt}", EXPORT_FORMATS[fmt]
+    if compress:
+        chunks, filename, mimetype = _gzipped(chunks), filename + ".gz", "application/gzip"
+    # Keeps the app context (and the session's open cursor) alive until the last chunk
+    response = Response(stream_with_context(chunks), mimetype=mimetype)
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
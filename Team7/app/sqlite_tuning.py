@@ -0,0 +1,45 @@
+# 📦 File: app/sqlite_tuning.py
+import re
+
+from sqlalchemy import event
+
+_NAME = re.compile(r"^[a-z_]+$")
+_VALUE = re.compile(r"^-?[A-Za-z0-9_]+$")
+
+
+def _pragma_statements(pragmas: dict) -> list[str]:
+    statements = []
+    for name, value in pragmas.items():
+        value = str(value)
+        if not _NAME.match(name) or not _VALUE.match(value):
+            raise ValueError(f"Invalid SQLite pragma {name}={value!r}")
+        statements.append(f"PRAGMA {name} = {value}")
+    return statements
+
+
+def install_pragmas(engine, pragmas: dict):
+    """Run the configured PRAGMAs on every new DB-API connection of `engine`."""
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+    statements = _pragma_statements(pragmas)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for stmt in statements:
+                cursor.execute(stmt)
+        finally:
+            cursor.close()
+
+
+def effective_pragmas(engine, names) -> dict:
+    """Read back the values SQLite is actually using for `names`."""
+    if engine.dialect.name != "sqlite":
+        return {}
+    values = {}
+    with engine.connect() as conn:
+        for name in names:
+            if _NAME.match(name):
+                values[name] = conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+    return values
@@ -0,0 +1,68 @@
+# 📦 File: app/template_cache.py
+import os
+import time
+
+from jinja2 import FileSystemBytecodeCache
+
+
+class _TolerantBytecodeCache(FileSystemBytecodeCache):
+    """A read-only or full cache directory costs a recompile, never a failed render."""
+
+    def load_bytecode(self, bucket):
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            pass
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            print(f"⚠️ Jinja bytecode cache not written ({bucket.key[:12]}): {e}")
+
+
+class TemplateCache:
+    """
+    Compiled boundary templates kept on disk (JINJA_BYTECODE_CACHE_DIR,
+    default instance/jinja_cache) so a fresh worker loads code objects
+    instead of parsing and compiling every template on its first hit.
+    Entries are checked against the template source, so an edited template
+    is recompiled automatically.
+
+    `flask precompile-templates` fills the cache ahead of a deploy;
+    JINJA_PRELOAD_TEMPLATES also loads every template into memory at startup,
+    so no request pays for a template load at all.
+    """
+
+    @classmethod
+    def init_app(cls, app):
+        app.config.setdefault("JINJA_BYTECODE_CACHE", True)
+        app.config.setdefault("JINJA_BYTECODE_CACHE_DIR", None)
+        app.config.setdefault("JINJA_PRELOAD_TEMPLATES", False)
+        if app.config["JINJA_BYTECODE_CACHE"]:
+            directory = app.config["JINJA_BYTECODE_CACHE_DIR"] or os.path.join(app.instance_path, "jinja_cache")
+            try:
+                os.makedirs(directory, exist_ok=True)
+                # Must be in place before the first template is loaded
+                app.jinja_env.bytecode_cache = _TolerantBytecodeCache(directory)
+            except OSError as e:
+                print(f"⚠️ Jinja bytecode cache disabled ({directory}): {e}")
+        if app.config["JINJA_PRELOAD_TEMPLATES"]:
+            loaded, ms, errors = cls.precompile(app)
+            print(f"🧩 Preloaded {loaded} templates in {ms:.0f} ms" + (f", {len(errors)} failed" if errors else ""))
+
+    @staticmethod
+    def precompile(app):
+        """
+        Load (compile, or read from the bytecode cache) every .html template.
+        Returns (templates loaded, elapsed ms, [(name, error), ...]).
+        """
+        env = app.jinja_env
+        started, loaded, errors = time.perf_counter(), 0, []
+        for name in env.list_templates(extensions=["html"]):
+            try:
+                env.get_template(name)
+                loaded += 1
+            except Exception as e:  # a broken template should not stop the others
+                errors.append((name, str(e)))
+        return loaded, (time.perf_counter() - started) * 1000, errors
@@ -0,0 +1,359 @@
+"""
+Entity-level microbenchmarks.
+
+Builds a SQLite database per dataset size (cached under benchmarks/.data),
+runs every entity classmethod against a fresh copy of it and reports
+p50 / p95 latency, rows/s and SQL statements per call.
+
+    # from Team7/
+    python benchmarks/bench_entities.py --sizes 10k 100k
+    python benchmarks/bench_entities.py --sizes 10k --save          # write baselines
+    python benchmarks/bench_entities.py --sizes 10k --threshold 0.25  # compare, exit 1 on regression
+    python benchmarks/bench_entities.py --sizes 1m --only CSRService.
+
+Baselines are stored in benchmarks/baselines/<size>.json. A case regresses
+when its p50 grows by more than --threshold (fraction) compared to the
+baseline, ignoring differences below --min-delta-ms.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from sqlalchemy import event
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+DATA_DIR = os.path.join(HERE, ".data")
+BASELINE_DIR = os.path.join(HERE, "baselines")
+sys.path.insert(0, ROOT)
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# -------------------------------
+# Dataset
+# -------------------------------
+def _make_app(db_path):
+    os.environ["TEAM7_SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
+    os.environ["TEAM7_VIEW_TRACKING_MODE"] = "sync"
+    from app import create_app
+    return create_app("dev")
+
+
+def build_dataset(n_requests: int, db_path: str, seed: int = 7):
+    """Create a database with n_requests requests plus users, views and shortlists."""
+    from app import db, RequestSearchIndex
+    from app.demo_data import generate_demo_data
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    app = _make_app(db_path)
+    with app.app_context():
+        db.create_all()
+        RequestSearchIndex.ensure()
+        generate_demo_data(pins=max(20, n_requests // 50), csrs=max(10, n_requests // 500),
+                           requests=n_requests, views_per_request=0.5, shortlist_rate=0.2,
+                           days=730, seed=seed)
+        with db.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    print(f"🌱 Built {n_requests:,} requests -> {db_path}")
+
+
+def dataset_path(size_name: str, rebuild: bool = False) -> str:
+    os.makedirs(DATA_DIR, exist_ok=True)
+    path = os.path.join(DATA_DIR, f"requests_{size_name}.db")
+    if rebuild or not os.path.exists(path):
+        build_dataset(SIZES[size_name], path)
+    return path
+
+
+# -------------------------------
+# Cases
+# -------------------------------
+def _rows(result) -> int:
+    if isinstance(result, dict):
+        result = result.get("data", [])
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    if isinstance(result, int) and not isinstance(result, bool):
+        return 1
+    return 0 if result is None or isinstance(result, str) else 1
+
+
+def build_cases(ctx):
+    """(name, fn(i)) pairs; `i` is the iteration number, used to vary ids."""
+    from app.entity.UserProfile import UserProfile
+    from app.entity.UserAdmin import UserAdmin
+    from app.entity.ServiceCategory import ServiceCategory
+    from app.entity.Request import Request, PINRequestView
+    from app.entity.CSREntities import CSRService
+
+    pin, csr, rid = ctx["pin_id"], ctx["csr_id"], ctx["request_id"]
+    # First half of the PIN's open requests is edited, second half suspended
+    half = len(ctx["pin_request_ids"]) // 2
+    own, to_suspend = ctx["pin_request_ids"][:half], ctx["pin_request_ids"][half:]
+    open_ids = ctx["open_request_ids"]
+    day = ctx["search_date"]
+    cat = ctx["category_id"]
+    prof = ctx["profile_id"]
+    user = ctx["user_id"]
+    tag = ctx["tag"]
+
+    return [
+        # Request
+        ("Request.get_shortlist_count", lambda i: Request.get_shortlist_count(rid, pin)),
+        ("Request.search_completed_matches", lambda i: Request.search_completed_matches(pin, "garden")),
+        ("Request.search_completed_matches[date]", lambda i: Request.search_completed_matches(pin, None, day)),
+        ("Request.get_completed_matches_history", lambda i: Request.get_completed_matches_history(pin)),
+        ("Request.create_pin_request", lambda i: Request.create_pin_request(
+            pin, f"Bench request {i}", "bench garden repair", "Cleaning", "low", "Block 1", None)),
+        ("Request.get_active_requests", lambda i: Request.get_active_requests(pin)),
+        ("Request.update_pin_request", lambda i: Request.update_pin_request(
+            own[i % len(own)], pin, location=f"Block {i}")),
+        ("Request.get_pin_request_history", lambda i: Request.get_pin_request_history(pin)),
+        ("Request.search_pin_requests", lambda i: Request.search_pin_requests(pin, "repair")),
+        ("Request.get_request_for_display", lambda i: Request.get_request_for_display(own[i % len(own)], pin)),
+        ("Request.suspend_pin_request", lambda i: Request.suspend_pin_request(to_suspend[i % len(to_suspend)], pin)),
+        # PINRequestView
+        ("PINRequestView.track_view", lambda i: PINRequestView.track_view(open_ids[i % len(open_ids)], csr)),
+        ("PINRequestView.record_views[100]", lambda i: PINRequestView.record_views(
+            [(open_ids[(i * 100 + k) % len(open_ids)], ctx["csr_ids"][i % len(ctx["csr_ids"])],
+              datetime.utcnow()) for k in range(100)])),
+        ("PINRequestView.get_view_count", lambda i: PINRequestView.get_view_count(rid, pin)),
+        # CSRService
+        ("CSRService.get_completed_services_history", lambda i: CSRService.get_completed_services_history(csr)),
+        ("CSRService.search_completed_services", lambda i: CSRService.search_completed_services(csr, "repair")),
+        ("CSRService.search_available_requests", lambda i: CSRService.search_available_requests()),
+        ("CSRService.search_available_requests[term]", lambda i: CSRService.search_available_requests("garden")),
+        ("CSRService.search_available_requests[filters]", lambda i: CSRService.search_available_requests(
+            None, "Home Repairs", "high")),
+        ("CSRService.search_available_requests[recommended]", lambda i: CSRService.search_available_requests(
+            csr_company_id=csr, sort="recommended")),
+        ("CSRService.get_request_details", lambda i: CSRService.get_request_details(rid)),
+        ("CSRService.add_to_shortlist", lambda i: CSRService.add_to_shortlist(open_ids[i % len(open_ids)], csr)),
+        ("CSRService.search_shortlisted_requests", lambda i: CSRService.search_shortlisted_requests(csr)),
+        ("CSRService.search_shortlisted_requests[term]", lambda i: CSRService.search_shortlisted_requests(
+            csr, "repair")),
+        ("CSRService.get_shortlisted_request_details", lambda i: CSRService.get_shortlisted_request_details(
+            open_ids[0], csr)),
+        ("CSRService.remove_from_shortlist", lambda i: CSRService.remove_from_shortlist(
+            open_ids[i % len(open_ids)], csr)),
+        # UserAdmin
+        ("UserAdmin.CreateUserAC", lambda i: UserAdmin.CreateUserAC(
+            f"Bench {i}", f"bench{tag}-{i}@bench.local", "pw", prof, 0)),
+        ("UserAdmin.ListUsers[page]", lambda i: UserAdmin.ListUsers(page=1)),
+        ("UserAdmin.ListUsers[all]", lambda i: UserAdmin.ListUsers()),
+        ("UserAdmin.UpdateUser", lambda i: UserAdmin.UpdateUser(
+            user, f"PIN User {i}", ctx["user_email"], None, ctx["pin_profile_id"], 0)),
+        ("UserAdmin.get_by_id", lambda i: UserAdmin.get_by_id(user)),
+        ("UserAdmin.SearchUser", lambda i: UserAdmin.SearchUser("csr", page=1)),
+        ("UserAdmin.SuspendedUser", lambda i: UserAdmin.SuspendedUser(user, i % 2)),
+        # UserProfile
+        ("UserProfile.CreateUserProfile", lambda i: UserProfile.CreateUserProfile(f"Bench {tag} {i}")),
+        ("UserProfile.ListUserProfile", lambda i: UserProfile.ListUserProfile()),
+        ("UserProfile.UpdateUserProfile", lambda i: UserProfile.UpdateUserProfile(
+            prof, f"Bench profile {tag}", f"rev {i}", 0)),
+        ("UserProfile.get_by_id", lambda i: UserProfile.get_by_id(prof)),
+        ("UserProfile.SearchUserProfile", lambda i: UserProfile.SearchUserProfile("bench")),
+        ("UserProfile.SuspendedUserProfile", lambda i: UserProfile.SuspendedUserProfile(prof, i % 2)),
+        # ServiceCategory
+        ("ServiceCategory.CreateServiceCategory", lambda i: ServiceCategory.CreateServiceCategory(
+            f"Bench {tag} {i}")),
+        ("ServiceCategory.ListServiceCategory[page]", lambda i: ServiceCategory.ListServiceCategory(page=1)),
+        ("ServiceCategory.ListServiceCategory[all]", lambda i: ServiceCategory.ListServiceCategory()),
+        ("ServiceCategory.ListActiveServiceCategory", lambda i: ServiceCategory.ListActiveServiceCategory()),
+        ("ServiceCategory.UpdateServiceCategory", lambda i: ServiceCategory.UpdateServiceCategory(
+            cat, "Cleaning", f"rev {i}", 0)),
+        ("ServiceCategory.get_by_id", lambda i: ServiceCategory.get_by_id(cat)),
+        ("ServiceCategory.SearchServiceCategory", lambda i: ServiceCategory.SearchServiceCategory("care")),
+        ("ServiceCategory.SuspendedServiceCategory", lambda i: ServiceCategory.SuspendedServiceCategory(
+            cat + 1, i % 2)),
+    ]
+
+
+def _context():
+    """Pick representative ids from the dataset: the PIN with the most requests, a busy CSR, ..."""
+    from app import db
+    from app.entity.UserProfile import UserProfile
+    from app.entity.UserAdmin import UserAdmin
+    from app.entity.Request import Request
+    from app.entity.CSREntities import CSRService
+
+    pin_id = (db.session.query(Request.pin_id).group_by(Request.pin_id)
+              .order_by(db.func.count().desc()).limit(1).scalar())
+    csr_id = (db.session.query(CSRService.csr_company_id).group_by(CSRService.csr_company_id)
+              .order_by(db.func.count().desc()).limit(1).scalar())
+    own = [r for (r,) in db.session.query(Request.id).filter(
+        Request.pin_id == pin_id, Request.status.in_(["pending", "approved", "in_progress"]))
+        .order_by(Request.id).limit(200)]
+    csr_ids = [c for (c,) in db.session.query(CSRService.csr_company_id).distinct()]
+    open_ids = [r for (r,) in db.session.query(Request.id).filter(Request.status == "pending")
+                .order_by(Request.id.desc()).limit(500)]
+    completed = (db.session.query(Request.updated_at)
+                 .filter(Request.pin_id == pin_id, Request.status == "completed").limit(1).scalar())
+    tag = datetime.utcnow().strftime("%H%M%S")
+    UserProfile.CreateUserProfile(f"Bench profile {tag}", "benchmark target")
+    return {
+        "pin_id": pin_id,
+        "csr_id": csr_id,
+        "csr_ids": csr_ids,
+        "request_id": own[0],
+        "pin_request_ids": own,
+        "open_request_ids": open_ids,
+        "search_date": (completed or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0),
+        "category_id": 1,
+        "profile_id": UserProfile.query.filter_by(name=f"Bench profile {tag}").first().id,
+        "pin_profile_id": UserProfile.query.filter_by(name="PIN").first().id,
+        "user_id": pin_id,
+        "user_email": db.session.get(UserAdmin, pin_id).email,
+        "tag": tag,
+    }
+
+
+# -------------------------------
+# Runner
+# -------------------------------
+def _percentile(sorted_values, q):
+    k = (len(sorted_values) - 1) * q
+    lo, hi = int(k), min(int(k) + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def run_size(size_name: str, repeat: int, only: str | None, rebuild: bool) -> dict:
+    from app import db
+
+    source = dataset_path(size_name, rebuild)
+    work = os.path.join(DATA_DIR, f"work_{size_name}.db")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(work + suffix):
+            os.remove(work + suffix)
+    shutil.copyfile(source, work)
+
+    app = _make_app(work)
+    results = {}
+    with app.app_context():
+        statements = [0]
+
+        def count(*_args, **_kwargs):
+            statements[0] += 1
+
+        for engine in db.engines.values():
+            event.listen(engine, "before_cursor_execute", count)
+
+        ctx = _context()
+        db.session.remove()
+        for name, fn in build_cases(ctx):
+            if only and only not in name:
+                continue
+            fn(repeat)  # warm-up (and different ids from the timed calls)
+            db.session.remove()
+            timings, rows, queries = [], 0, 0
+            for i in range(repeat):
+                statements[0] = 0
+                t0 = time.perf_counter()
+                result = fn(i)
+                timings.append(time.perf_counter() - t0)
+                queries += statements[0]
+                rows += _rows(result)
+                db.session.remove()  # request boundary: no identity-map reuse between calls
+            timings.sort()
+            total = sum(timings)
+            results[name] = {
+                "p50_ms": round(_percentile(timings, 0.50) * 1000, 3),
+                "p95_ms": round(_percentile(timings, 0.95) * 1000, 3),
+                "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+                "rows": rows // repeat,
+                "rows_per_s": round(rows / total, 1) if total else 0.0,
+                "queries": round(queries / repeat, 2),
+            }
+            r = results[name]
+            print(f"  {name:<48} p50 {r['p50_ms']:>9.3f} ms  p95 {r['p95_ms']:>9.3f} ms  "
+                  f"{r['rows_per_s']:>11,.0f} rows/s  {r['queries']:>5} q")
+
+        for engine in db.engines.values():
+            event.remove(engine, "before_cursor_execute", count)
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    return results
+
+
+def compare(size_name: str, results: dict, threshold: float, min_delta_ms: float) -> list[str]:
+    path = os.path.join(BASELINE_DIR, f"{size_name}.json")
+    if not os.path.exists(path):
+        print(f"  (no baseline for {size_name}; run with --save to create one)")
+        return []
+    with open(path) as fh:
+        baseline = json.load(fh)["results"]
+
+    regressions = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        delta = now["p50_ms"] - before["p50_ms"]
+        if delta > min_delta_ms and now["p50_ms"] > before["p50_ms"] * (1 + threshold):
+            regressions.append(f"{size_name} {name}: p50 {before['p50_ms']} -> {now['p50_ms']} ms "
+                               f"(+{delta / before['p50_ms'] * 100:.0f}%)")
+        if now["queries"] > before["queries"]:
+            regressions.append(f"{size_name} {name}: queries {before['queries']} -> {now['queries']}")
+    return regressions
+
+
+def save(size_name: str, results: dict, repeat: int):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = os.path.join(BASELINE_DIR, f"{size_name}.json")
+    payload = {
+        "size": SIZES[size_name],
+        "repeat": repeat,
+        "recorded_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as fh:
+        json.dump(payload, fh, indent=2, sort_keys=True)
+    print(f"💾 Baseline written to {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["10k"], choices=sorted(SIZES))
+    parser.add_argument("--repeat", type=int, default=30, help="timed calls per case")
+    parser.add_argument("--only", help="run cases whose name contains this text")
+    parser.add_argument("--save", action="store_true", help="store results as the new baselines")
+    parser.add_argument("--threshold", type=float, default=0.20, help="allowed p50 slowdown (fraction)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="ignore p50 changes below this")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild cached datasets")
+    args = parser.parse_args(argv)
+
+    regressions = []
+    for size_name in args.sizes:
+        print(f"📊 {size_name} ({SIZES[size_name]:,} requests, {args.repeat} calls per case)")
+        results = run_size(size_name, args.repeat, args.only, args.rebuild)
+        if args.save:
+            save(size_name, results, args.repeat)
+        else:
+            regressions += compare(size_name, results, args.threshold, args.min_delta_ms)
+
+    if regressions:
+        print("❌ Regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("✅ No regressions" if not args.save else "✅ Done")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
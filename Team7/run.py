@@ -1,5 +1,5 @@
 
-from app import create_app, db, seed_defaults
+from app import create_app, db, seed_defaults, ensure_indexes, RequestSearchIndex, RequestActivity
 
 app = create_app()
 
@@ -7,5 +7,8 @@ if __name__ == "__main__":
     with app.app_context():
         # db.drop_all()   # 🧨 deletes all tables
         db.create_all() # 🔁 recreates tables
+        ensure_indexes() # 🗂️ adds indexes missing from older databases
+        RequestSearchIndex.ensure() # 🔎 full-text index (rebuild: flask --app run rebuild-search-index)
+        RequestActivity.ensure() # 📈 backfill view/shortlist rollups (rebuild: flask --app run rebuild-activity-rollups)
         seed_defaults() # 🌱 reseed defaults
     app.run(debug=True)
@@ -0,0 +1,42 @@
+"""
+TTLCache.get_or_set under concurrent misses.
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+import threading
+import time
+
+from app.cache import TTLCache
+
+
+def test_concurrent_misses_run_one_loader():
+    cache = TTLCache(ttl=60)
+    calls, results = [], []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_set("k", loader))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert len(calls) == 1
+    assert results == ["value"] * 8
+
+
+def test_failed_load_lets_the_next_caller_load():
+    cache = TTLCache(ttl=60)
+
+    def broken():
+        raise RuntimeError("db down")
+
+    try:
+        cache.get_or_set("k", broken)
+    except RuntimeError:
+        pass
+    assert cache.get_or_set("k", lambda: "value") == "value"
+    assert cache._loading == {}
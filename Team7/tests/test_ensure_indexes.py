@@ -0,0 +1,63 @@
+"""
+ensure_indexes() on a database from before uq_csr_shortlist_request_csr,
+whose csr_shortlist already holds duplicate (request, CSR) rows.
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+import pytest
+
+from app import create_app, db, ensure_indexes
+from app.entity.Request import Request
+
+
+@pytest.fixture
+def app():
+    app = create_app("test")
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _shortlist(rows):
+    db.session.execute(db.text("DROP INDEX uq_csr_shortlist_request_csr"))
+    for request_id, csr_id in rows:
+        db.session.execute(db.text(
+            "INSERT INTO csr_shortlist (request_id, csr_company_id, added_at) VALUES (:r, :c, CURRENT_TIMESTAMP)"
+        ), {"r": request_id, "c": csr_id})
+    db.session.execute(db.text(
+        "UPDATE requests SET shortlist_count = (SELECT count(*) FROM csr_shortlist WHERE request_id = requests.id)"
+    ))
+    db.session.commit()
+
+
+def test_duplicates_are_removed_before_the_unique_index(app):
+    with app.app_context():
+        first, second = Request(1, "A", "a", "Cleaning"), Request(1, "B", "b", "Cleaning")
+        db.session.add_all([first, second])
+        db.session.commit()
+        _shortlist([(first.id, 7), (first.id, 7), (first.id, 8), (second.id, 7), (first.id, 7)])
+
+        assert ensure_indexes() == ["uq_csr_shortlist_request_csr"]
+
+        rows = db.session.execute(db.text(
+            "SELECT id, request_id, csr_company_id FROM csr_shortlist ORDER BY id")).all()
+        assert [(r.request_id, r.csr_company_id) for r in rows] == [(first.id, 7), (first.id, 8), (second.id, 7)]
+        assert rows[0].id == 1  # the first row of each pair is the one kept
+        counts = dict(db.session.execute(db.text("SELECT id, shortlist_count FROM requests")).all())
+        assert counts == {first.id: 2, second.id: 1}
+
+
+def test_index_that_cannot_be_built_stops_startup(app, monkeypatch):
+    with app.app_context():
+        request = Request(1, "A", "a", "Cleaning")
+        db.session.add(request)
+        db.session.commit()
+        _shortlist([(request.id, 7), (request.id, 7)])
+        from app.entity.CSREntities import CSRService
+        monkeypatch.setattr(CSRService, "remove_duplicates", classmethod(lambda cls: 0))
+
+        with pytest.raises(RuntimeError, match="uq_csr_shortlist_request_csr"):
+            ensure_indexes()
@@ -0,0 +1,92 @@
+"""
+Keyset pagination over DATETIME columns stored in both text formats:
+'YYYY-MM-DD HH:MM:SS' (older rows) and 'YYYY-MM-DD HH:MM:SS.ffffff' (SQLAlchemy).
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+import pytest
+
+from app import create_app, db
+from app.entity.Request import Request
+from app.entity.CSREntities import CSRService
+
+PIN_ID = 1
+
+# (created_at as stored, status); same-second rows in both formats, ties on
+# the exact same text (broken by id) and rows in neighbouring seconds
+STORED = [
+    ("2025-06-01 23:29:07", "pending"),
+    ("2025-06-01 23:29:07.500000", "pending"),
+    ("2025-06-01 23:29:07", "approved"),
+    ("2025-06-01 23:29:08", "pending"),
+    ("2025-06-01 23:29:06.999999", "pending"),
+    ("2025-06-01 23:29:07.000001", "approved"),
+    ("2025-06-01 23:29:08.000000", "in_progress"),
+    ("2025-06-01 23:29:06", "pending"),
+    ("2025-06-02 00:00:00", "pending"),
+    ("2025-06-01 23:29:07.500000", "pending"),
+    ("2025-05-31 12:00:00.250000", "approved"),
+    ("2025-06-01 23:29:07", "pending"),
+]
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = create_app("test")
+    with app.app_context():
+        db.create_all()
+        for i, (created_at, status) in enumerate(STORED):
+            request = Request(PIN_ID, f"Request {i}", "mixed timestamp formats", "Cleaning")
+            request.status = status
+            db.session.add(request)
+            db.session.flush()
+            db.session.execute(db.text("UPDATE requests SET created_at = :c, updated_at = :c WHERE id = :id"),
+                               {"c": created_at, "id": request.id})
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _expected(statuses):
+    """Ids in the order SQLite itself sorts the stored text: created_at DESC, id DESC."""
+    rows = db.session.execute(db.text(
+        "SELECT id FROM requests WHERE status IN ({}) ORDER BY created_at DESC, id DESC".format(
+            ", ".join(f"'{s}'" for s in statuses))
+    )).all()
+    return [row.id for row in rows]
+
+
+def _walk(fetch):
+    """Follow next cursors to the end, then prev cursors back: (forward ids, pages, pages read backwards)."""
+    pages, cursor = [], None
+    while True:
+        page = fetch(cursor)
+        pages.append([item.id for item in page])
+        if not page.has_next or len(pages) > len(STORED):  # a repeating cursor would never end
+            break
+        cursor = page.next_cursor
+    backwards = [pages[-1]]
+    while page.has_prev and len(backwards) <= len(STORED):
+        page = fetch(page.prev_cursor)
+        backwards.insert(0, [item.id for item in page])
+    return [i for ids in pages for i in ids], pages, backwards
+
+
+@pytest.mark.parametrize("per_page", [1, 2, 3, 5])
+def test_csr_search_pages_each_row_once(app, per_page):
+    with app.app_context():
+        forward, pages, backwards = _walk(
+            lambda cursor: CSRService.search_available_requests(cursor=cursor, per_page=per_page))
+        assert forward == _expected(["pending", "approved"])
+        assert backwards == pages
+
+
+@pytest.mark.parametrize("as_rows", [False, True])
+def test_pin_active_requests_pages_each_row_once(app, as_rows):
+    with app.app_context():
+        forward, pages, backwards = _walk(
+            lambda cursor: Request.get_active_requests(PIN_ID, cursor, per_page=1, as_rows=as_rows))
+        assert forward == _expected(["pending", "approved", "in_progress"])
+        assert backwards == pages
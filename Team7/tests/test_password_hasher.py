@@ -0,0 +1,101 @@
+"""
+PasswordHasher backlog handling and rehash detection.
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+import threading
+import time
+
+import pytest
+
+from app import create_app
+from app.entity.PasswordHasher import PasswordHasher
+
+
+@pytest.fixture(scope="module")
+def app():
+    return create_app("test")
+
+
+def test_full_backlog_is_busy_at_once(app):
+    slots = PasswordHasher._workers + app.config["PASSWORD_HASH_MAX_PENDING"]
+    for _ in range(slots):
+        assert PasswordHasher._slots.acquire(blocking=False)
+    try:
+        started = time.perf_counter()
+        with pytest.raises(PasswordHasher.Busy):
+            PasswordHasher.hash("secret")
+        assert time.perf_counter() - started < 1.0
+    finally:
+        for _ in range(slots):
+            PasswordHasher._slots.release()
+    assert PasswordHasher.verify(PasswordHasher.hash("secret"), "secret")[0]
+
+
+
+def _free_slots():
+    taken = 0
+    while PasswordHasher._slots.acquire(blocking=False):
+        taken += 1
+    for _ in range(taken):
+        PasswordHasher._slots.release()
+    return taken
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes(app, monkeypatch):
+    monkeypatch.setattr(PasswordHasher, "_timeout", 0.05)
+    total = _free_slots()
+    release = threading.Event()
+
+    with pytest.raises(PasswordHasher.Busy):
+        PasswordHasher._run(release.wait, 5)
+    assert _free_slots() == total - 1  # the caller gave up, the job still runs
+
+    release.set()
+    assert _wait_for(lambda: _free_slots() == total)
+
+
+def test_timed_out_queued_job_is_cancelled(app, monkeypatch):
+    monkeypatch.setattr(PasswordHasher, "_timeout", 0.05)
+    total = _free_slots()
+    release, ran = threading.Event(), threading.Event()
+    for _ in range(PasswordHasher._workers):  # occupy every worker
+        with pytest.raises(PasswordHasher.Busy):
+            PasswordHasher._run(release.wait, 5)
+
+    with pytest.raises(PasswordHasher.Busy):
+        PasswordHasher._run(ran.set)
+    assert _free_slots() == total - PasswordHasher._workers  # the queued job's slot is back
+
+    release.set()
+    assert _wait_for(lambda: _free_slots() == total)
+    assert not ran.is_set()
+
+
+@pytest.mark.parametrize("configured, stored, rehash", [
+    ("pbkdf2:sha256", "pbkdf2:sha256:1000000", False),
+    ("pbkdf2", "pbkdf2:sha256:1000000", False),
+    ("pbkdf2:sha256:1000", "pbkdf2:sha256:1000", False),
+    ("pbkdf2:sha256", "pbkdf2:sha256:600000", True),
+    ("scrypt", "scrypt:32768:8:1", False),
+    ("scrypt:32768:8:1", "scrypt:16384:8:1", True),
+    ("scrypt", "pbkdf2:sha256:1000000", True),
+])
+def test_needs_rehash_compares_full_parameters(app, configured, stored, rehash):
+    assert (PasswordHasher.method_params(stored) != PasswordHasher.method_params(configured)) is rehash
+
+
+def test_verify_rehashes_only_on_a_parameter_change(app, monkeypatch):
+    stored = PasswordHasher.hash("secret")  # TestConfig: pbkdf2:sha256:1000
+    monkeypatch.setattr(PasswordHasher, "_method_params", PasswordHasher.method_params("pbkdf2:sha256:1000"))
+    assert PasswordHasher.verify(stored, "secret") == (True, False)
+    monkeypatch.setattr(PasswordHasher, "_method_params", PasswordHasher.method_params("pbkdf2:sha256"))
+    assert PasswordHasher.verify(stored, "secret") == (True, True)
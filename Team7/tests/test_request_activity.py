@@ -0,0 +1,71 @@
+"""
+Hourly activity rollups are kept for RequestActivity.HOURLY_RETENTION
+(the 24h range only reads the last day); daily rollups are kept.
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import create_app, db
+from app.entity.Request import Request, PINRequestView
+from app.entity.RequestActivity import RequestActivity, RequestActivityHourly, RequestActivityDaily
+
+
+@pytest.fixture
+def request_id():
+    app = create_app("test")
+    with app.app_context():
+        db.create_all()
+        request = Request(1, "Groceries", "weekly shop", "Errands")
+        db.session.add(request)
+        db.session.commit()
+        yield request.id
+        db.session.remove()
+        db.drop_all()
+
+
+def _hour(hours_ago):
+    return (datetime.utcnow() - timedelta(hours=hours_ago)).replace(minute=0, second=0, microsecond=0)
+
+
+def _hourly_buckets():
+    return sorted(b for (b,) in db.session.query(RequestActivityHourly.bucket))
+
+
+def test_record_drops_hourly_rows_past_retention(request_id, monkeypatch):
+    for hours_ago in (200, 72, 49, 47, 2):
+        db.session.add(RequestActivityHourly(request_id=request_id, bucket=_hour(hours_ago), views=1))
+    db.session.commit()
+    monkeypatch.setattr(RequestActivity, "_pruned_hour", None)
+
+    RequestActivity.record([(request_id, datetime.utcnow(), "views", 1)])
+    db.session.commit()
+    assert _hourly_buckets() == [_hour(47), _hour(2), _hour(0)]
+
+    # once per hour: rows that age out meanwhile wait for the next hour's prune
+    db.session.add(RequestActivityHourly(request_id=request_id, bucket=_hour(100), views=1))
+    db.session.commit()
+    RequestActivity.record([(request_id, datetime.utcnow(), "views", 1)])
+    db.session.commit()
+    assert _hour(100) in _hourly_buckets()
+
+
+def test_rebuild_keeps_hourly_rows_only_within_retention(request_id):
+    for hours_ago in (24 * 30, 72, 30, 1):
+        db.session.add(PINRequestView(request_id=request_id, csr_company_id=7,
+                                      viewed_at=datetime.utcnow() - timedelta(hours=hours_ago)))
+    db.session.commit()
+
+    RequestActivity.rebuild()
+    assert _hourly_buckets() == [_hour(30), _hour(1)]
+    assert sum(v for (v,) in db.session.query(RequestActivityDaily.views)) == 4
+
+
+def test_prune_hourly_returns_deleted_rows(request_id):
+    db.session.add_all([RequestActivityHourly(request_id=request_id, bucket=_hour(h), views=1) for h in (60, 50, 10)])
+    db.session.commit()
+    assert RequestActivity.prune_hourly() == 2
+    assert _hourly_buckets() == [_hour(10)]
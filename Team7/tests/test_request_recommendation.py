@@ -0,0 +1,63 @@
+"""
+RequestRecommendation open-set snapshot: built once, then rebuilt in the
+background while requests keep using the previous snapshot.
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+import threading
+import time
+
+import pytest
+
+from app import create_app
+from app.entity.RequestRecommendation import RequestRecommendation, _OpenSet
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    app = create_app("test")
+    monkeypatch.setattr(RequestRecommendation, "_app", app)
+    monkeypatch.setattr(RequestRecommendation, "_snapshot", None)
+    monkeypatch.setattr(RequestRecommendation, "_snapshot_ttl", 60.0)
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def fake_load(cls):
+        calls.append(1)
+        if len(calls) > 1:  # rebuilds wait until the test lets them finish
+            started.set()
+            release.wait(5)
+        return _OpenSet([(len(calls), "Cleaning", "low", "Block 1")])
+
+    monkeypatch.setattr(RequestRecommendation, "_load_open_set", classmethod(fake_load))
+    yield calls, started, release
+    release.set()
+    assert _wait_unlocked()
+
+
+def _wait_unlocked():
+    deadline = time.monotonic() + 5
+    while RequestRecommendation._building.locked() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not RequestRecommendation._building.locked()
+
+
+def test_stale_snapshot_is_served_while_one_rebuild_runs(loads, monkeypatch):
+    calls, started, release = loads
+    first = RequestRecommendation.open_set()
+    assert first.ids == [1] and len(calls) == 1
+
+    assert RequestRecommendation.open_set() is first and len(calls) == 1  # fresh: reused as is
+
+    monkeypatch.setattr(RequestRecommendation, "_snapshot_ttl", 0.0)
+    for _ in range(5):
+        assert RequestRecommendation.open_set() is first  # no request waits for the rebuild
+    assert started.wait(5)
+    assert len(calls) == 2  # one rebuild, however many requests saw the stale snapshot
+
+    assert RequestRecommendation.stats()["open_set_refreshing"] is True
+
+    release.set()
+    assert _wait_unlocked()
+    monkeypatch.setattr(RequestRecommendation, "_snapshot_ttl", 60.0)
+    assert RequestRecommendation.open_set().ids == [2]  # the rebuilt snapshot replaced the old one
@@ -0,0 +1,56 @@
+"""
+Role-only pages with @conditional: the profile check runs first, so other
+profiles are redirected before any validator query.
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+import pytest
+
+from app import create_app, db
+from app.control.PINControllers import PINPageVersionController
+from app.control.CSRControllers import CSRPageVersionController
+
+PIN_PAGES = ["/pin/requests", "/pin/requests/history", "/pin/requests/search?q=help", "/pin/requests/1/analytics",
+             "/pin/matches/completed/history", "/pin/matches/completed/search?title=help"]
+CSR_PAGES = ["/csr/requests/search", "/csr/shortlist/search", "/csr/shortlist/1",
+             "/csr/services/completed/history", "/csr/services/completed/search?title=help"]
+
+
+@pytest.fixture
+def app(monkeypatch):
+    app = create_app("test")
+    validated = []
+    for controller in (PINPageVersionController, CSRPageVersionController):
+        for name in ("requests_version", "available_requests_version", "shortlist_version"):
+            if hasattr(controller, name):
+                monkeypatch.setattr(controller, name, lambda self, *a, _n=name: validated.append(_n) or "error:x")
+    app.validated = validated
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _client(app, profile):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+        sess["profile_name"] = profile
+    return client
+
+
+@pytest.mark.parametrize("profile, pages", [("CSR Rep", PIN_PAGES), ("PIN", CSR_PAGES), ("Admin", PIN_PAGES + CSR_PAGES)])
+def test_wrong_profile_is_redirected_before_the_validator(app, profile, pages):
+    client = _client(app, profile)
+    for url in pages:
+        response = client.get(url)
+        assert response.status_code == 302 and response.headers["Location"].endswith("/login"), url
+    assert app.validated == []
+
+
+def test_own_profile_reaches_the_validator(app):
+    _client(app, "PIN").get("/pin/requests")
+    _client(app, "CSR Rep").get("/csr/requests/search")
+    assert app.validated == ["requests_version", "available_requests_version"]
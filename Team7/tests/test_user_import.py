@@ -0,0 +1,111 @@
+"""
+CSV user import: the upload returns a job, the import runs on the
+UserImportQueue worker and the job page reports the result.
+
+    # from Team7/
+    python -m pytest -q tests
+"""
+import io
+import threading
+
+import pytest
+
+from app import create_app, db, seed_defaults
+from app.entity.UserAdmin import UserAdmin
+from app.entity.UserImportQueue import UserImportQueue, UserImportJob
+
+CSV = (
+    "name,email,password,profile\n"
+    "Ann,ann@example.com,pw1,PIN\n"
+    "Ben,ben@example.com,pw2,CSR Rep\n"
+    "Ann again,ann@example.com,pw3,PIN\n"
+    "No profile,np@example.com,pw4,Nobody\n"
+)
+
+
+@pytest.fixture
+def app():
+    app = create_app("test")
+    with app.app_context():
+        db.create_all()
+        seed_defaults()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def admin(app):
+    client = app.test_client()
+    with app.app_context():
+        admin_id = UserAdmin.query.filter_by(email="admin@example.com").one().id
+    with client.session_transaction() as sess:
+        sess["user_id"] = admin_id
+        sess["profile_name"] = "Admin"
+    return client
+
+
+def _upload(client, text):
+    return client.post("/users/import", data={"file": (io.BytesIO(text.encode()), "users.csv")},
+                       content_type="multipart/form-data", headers={"Accept": "application/json"})
+
+
+def _job(client, job_id):
+    return client.get(f"/users/import/{job_id}", headers={"Accept": "application/json"}).get_json()["data"]
+
+
+def test_upload_returns_a_job_with_the_report(app, admin):
+    response = _upload(admin, CSV)
+    assert response.status_code == 202
+    job_id = response.get_json()["data"]
+    assert response.headers["Location"].endswith(f"/users/import/{job_id}")
+
+    job = _job(admin, job_id)
+    assert (job["status"], job["created"], job["duplicate"], job["invalid"]) == ("done", 2, 1, 1)
+    assert [r["status"] for r in job["rows"]] == ["created", "created", "duplicate", "invalid"]
+    with app.app_context():
+        assert UserAdmin.query.filter(UserAdmin.email.in_(["ann@example.com", "ben@example.com"])).count() == 2
+
+
+def test_import_runs_on_the_worker(app, admin, monkeypatch):
+    monkeypatch.setitem(app.config, "USER_IMPORT_MODE", "async")
+    monkeypatch.setitem(app.config, "USER_IMPORT_CHUNK_SIZE", 1)  # progress after every row
+    try:
+        job_id = _upload(admin, CSV).get_json()["data"]
+        assert UserImportQueue.flush(timeout=30)
+        job = _job(admin, job_id)
+        assert (job["status"], job["processed_rows"], job["total_rows"]) == ("done", 4, 4)
+    finally:
+        UserImportQueue.shutdown()
+
+
+def test_rows_past_the_cap_are_reported(app, admin, monkeypatch):
+    monkeypatch.setitem(app.config, "USER_IMPORT_MAX_ROWS", 2)
+    job = _job(admin, _upload(admin, CSV).get_json()["data"])
+    assert (job["total_rows"], job["created"]) == (2, 2)
+    assert job["errors"] == ["Only the first 2 rows were processed."]
+
+
+def test_job_still_running_at_shutdown_is_marked_interrupted(app, admin, monkeypatch):
+    monkeypatch.setitem(app.config, "USER_IMPORT_MODE", "async")
+    release = threading.Event()
+    monkeypatch.setattr(UserAdmin, "BulkImportUsers", classmethod(lambda cls, rows, **kw: release.wait(10)))
+    worker = None
+    try:
+        job_id = _upload(admin, CSV).get_json()["data"]
+        worker = UserImportQueue._worker
+        UserImportQueue.shutdown(timeout=0.1)
+        job = _job(admin, job_id)
+        assert (job["status"], job["finished"]) == ("interrupted", True)
+    finally:
+        release.set()
+        if worker is not None:
+            worker.join(10)
+
+
+def test_job_page_is_admin_only(app):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+        sess["profile_name"] = "PIN"
+    assert client.get("/users/import/1").status_code == 302